@@ -0,0 +1,362 @@
+"""
+Benchmark offline untuk pipeline scraping: fetch, parse, extract, dan penulis CSV diukur terpisah.
+
+Halaman artikel diambil dari korpus fixture (benchmarks/fixtures, dibuat oleh make_fixtures.py)
+yang disajikan oleh server HTTP lokal dengan latensi, jitter, dan tingkat error yang dapat diatur,
+sehingga benchmark dapat dijalankan di CI tanpa mengakses situs berita sungguhan. Setiap tahap
+dijalankan di proses baru agar peak RSS yang dilaporkan hanya milik tahap tersebut.
+
+    python benchmarks/bench_scraping.py
+    python benchmarks/bench_scraping.py --pages 2000 --latency-ms 20 --jitter-ms 10 --error-rate 0.02
+    python benchmarks/bench_scraping.py --backend lxml --json hasil.json
+    python benchmarks/bench_scraping.py --baseline hasil.json --max-regression 0.2   # keluar 1 jika ada regresi
+
+Tahap:
+    fetch    fetch_article_html lewat PooledHTTPSessionManager (I/O saja, satu percobaan, tanpa parsing)
+    parse    parsing HTML saja (BeautifulSoup html.parser, pohon parsial 'partial', atau pohon lxml)
+    extract  build_article_result: parsing + pemilihan selektor + pembentukan dict hasil
+    csv      CheckpointedCSVWriter menulis hasil ber-batch dengan fsync
+    job      run_scraping_job end-to-end dengan engine pilihan, termasuk retry (tidak termasuk bawaan)
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCHMARK_DIR, 'fixtures')
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+try:
+    import resource # Tidak tersedia di Windows; peak RSS dilaporkan sebagai None
+except ImportError:
+    resource = None
+
+DEFAULT_STAGES = ['fetch', 'parse', 'extract', 'csv']
+ALL_STAGES = DEFAULT_STAGES + ['job']
+ERROR_STATUSES = [500, 503, 429]
+
+def load_fixtures():
+    """Mengembalikan list (nama, bytes) fixture dalam urutan nama agar hasil dapat direproduksi."""
+    names = sorted(name for name in os.listdir(FIXTURE_DIR) if name.endswith('.html'))
+    if not names:
+        raise RuntimeError(f"Tidak ada fixture di {FIXTURE_DIR}; jalankan benchmarks/make_fixtures.py")
+    fixtures = []
+    for name in names:
+        with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+            fixtures.append((name, f.read()))
+    return fixtures
+
+def page_url(base_url, index):
+    return f"{base_url}/article/{index}"
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """
+    Menyajikan /article/<n> dari fixture ke-(n mod jumlah fixture). Latensi dan error ditentukan
+    dari seed + path + urutan request ke path itu, jadi setiap run mendapat keterlambatan dan status
+    yang sama, sementara percobaan ulang ke URL yang sama dapat berhasil.
+    """
+    protocol_version = 'HTTP/1.1' # Keep-alive, seperti server berita sungguhan
+    disable_nagle_algorithm = True
+    wbufsize = 1 << 20 # Header + body dikirim dalam satu write
+
+    def do_GET(self):
+        server = self.server
+        path_rng = random.Random(zlib.crc32(f"{server.seed}:{self.path}:{server.count_request(self.path)}".encode('utf-8')))
+        delay = server.latency + path_rng.uniform(0, server.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if path_rng.random() < server.error_rate:
+            status = path_rng.choice(ERROR_STATUSES)
+            body = f"Error {status}".encode('ascii')
+            self.send_response(status)
+            if status in (429, 503):
+                self.send_header('Retry-After', '1')
+        else:
+            try:
+                index = int(self.path.rsplit('/', 1)[-1])
+            except ValueError:
+                index = -1
+            if not self.path.startswith('/article/') or index < 0:
+                body = b"Not Found"
+                self.send_response(404)
+            else:
+                body = server.fixtures[index % len(server.fixtures)][1]
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # Log akses per request hanya akan mengotori output benchmark
+
+class FixtureHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, fixtures, latency_ms=0, jitter_ms=0, error_rate=0.0, seed=0, host='127.0.0.1', port=0):
+        super().__init__((host, port), FixtureRequestHandler)
+        self.fixtures = fixtures
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.seed = seed
+        self._request_counts = {}
+        self._request_counts_lock = threading.Lock()
+
+    def count_request(self, path):
+        """Nomor urut request ke path ini (0 untuk request pertama)."""
+        with self._request_counts_lock:
+            count = self._request_counts.get(path, 0)
+            self._request_counts[path] = count + 1
+            return count
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, name='FixtureHTTPServer', daemon=True)
+        thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024 # macOS: byte, Linux: KiB
+
+def percentile(sorted_values, fraction):
+    """Persentil nearest-rank dari list yang sudah terurut."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+def summarize(stage, latencies, elapsed, pages, errors=0, **extra):
+    latencies = sorted(latencies) if latencies is not None else None
+    summary = {
+        'stage': stage,
+        'pages': pages,
+        'errors': errors,
+        'elapsed_s': round(elapsed, 4),
+        'pages_per_sec': round(pages / elapsed, 2) if elapsed > 0 else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 3) if latencies else None,
+    }
+    summary.update(extra)
+    return summary
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    value = function(*args)
+    return value, time.perf_counter() - start
+
+def bench_fetch(config, tugasakhir, fixtures):
+    urls = [page_url(config['base_url'], i) for i in range(config['pages'])]
+    session_manager = tugasakhir.PooledHTTPSessionManager(pool_maxsize=config['concurrency'],
+                                                          keep_alive=not config['no_keep_alive'])
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=config['concurrency']) as executor:
+        outcomes = list(executor.map(lambda url: _timed(tugasakhir.fetch_article_html, url, session_manager, config['max_response_bytes']), urls))
+    elapsed = time.perf_counter() - start
+    connection_stats = session_manager.connection_stats()
+    session_manager.close()
+    errors = sum(1 for (html_content, error_msg), _ in outcomes if error_msg)
+    return summarize('fetch', [latency for _, latency in outcomes], elapsed, len(urls), errors,
+                     bytes=sum(len(html_content) for (html_content, _), _ in outcomes if html_content),
+                     new_connections=sum(host['new_connections'] for host in connection_stats.values()))
+
+def _page_inputs(config, fixtures):
+    """Pasangan (url, html) untuk tahap CPU; URL memakai host detik agar profil selektor lxml realistis."""
+    return [(f"https://www.detik.com/bench/{fixtures[i % len(fixtures)][0]}/{i}", fixtures[i % len(fixtures)][1])
+            for i in range(config['pages'])]
+
+def _make_backend(config, tugasakhir):
+    return tugasakhir.EXTRACTION_BACKENDS[config['backend']](profile_path=None)
+
+def bench_parse(config, tugasakhir, fixtures):
+    backend = _make_backend(config, tugasakhir)
+    if config['backend'] == 'lxml':
+        parse = backend._parse
+    elif config['backend'] == 'partial':
+        beautiful_soup = backend._beautiful_soup
+        parse = lambda html_content: beautiful_soup(html_content, 'html.parser', parse_only=backend._strainer)
+    else:
+        beautiful_soup = backend._beautiful_soup
+        parse = lambda html_content: beautiful_soup(html_content, 'html.parser')
+    pages = _page_inputs(config, fixtures)
+    latencies = []
+    start = time.perf_counter()
+    for _, html_content in pages:
+        latencies.append(_timed(parse, html_content)[1])
+    return summarize('parse', latencies, time.perf_counter() - start, len(pages), backend=config['backend'])
+
+def bench_extract(config, tugasakhir, fixtures):
+    backend = _make_backend(config, tugasakhir)
+    pages = _page_inputs(config, fixtures)
+    latencies = []
+    errors = 0
+    start = time.perf_counter()
+    for url, html_content in pages:
+        (result, error_msg), latency = _timed(tugasakhir.build_article_result, html_content, url, 'bench', backend)
+        latencies.append(latency)
+        errors += 1 if error_msg else 0 # Halaman indeks kanal memang gagal (< MIN_ARTICLE_WORD_COUNT kata)
+    return summarize('extract', latencies, time.perf_counter() - start, len(pages), errors, backend=config['backend'])
+
+def bench_csv(config, tugasakhir, fixtures):
+    # Hasil dibentuk lebih dulu di luar pengukuran supaya yang diukur hanya penulis CSV
+    backend = _make_backend(config, tugasakhir)
+    templates = [result for result, _ in (tugasakhir.build_article_result(html_content, f"https://www.detik.com/bench/{name}", 'bench', backend)
+                                          for name, html_content in fixtures) if result]
+    results = [dict(templates[i % len(templates)], url=f"https://www.detik.com/bench/{i}") for i in range(config['pages'])]
+    latencies = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, 'bench.csv')
+        start = time.perf_counter()
+        with tugasakhir.CheckpointedCSVWriter(csv_path, batch_size=config['csv_batch_size']) as writer:
+            for result in results:
+                latencies.append(_timed(writer.write_result, result)[1])
+        elapsed = time.perf_counter() - start
+        csv_bytes = os.path.getsize(csv_path)
+    return summarize('csv', latencies, elapsed, len(results), bytes=csv_bytes, batch_size=config['csv_batch_size'])
+
+def bench_job(config, tugasakhir, fixtures):
+    urls = [page_url(config['base_url'], i) for i in range(config['pages'])]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        summary = tugasakhir.run_scraping_job(urls, os.path.join(tmp_dir, 'bench.csv'), config['engine'],
+                                              config['concurrency'], config['concurrency'], not config['no_keep_alive'],
+                                              config['backend'], log=lambda message: None, canonicalize=False,
+                                              max_response_bytes=config['max_response_bytes'])
+        elapsed = time.perf_counter() - start
+    # Latensi per URL tidak terlihat dari luar engine, jadi tahap ini hanya melaporkan throughput
+    return summarize('job', None, elapsed, len(urls), len(summary['failed_urls_info']),
+                     engine=config['engine'], backend=config['backend'])
+
+STAGE_RUNNERS = {
+    'fetch': bench_fetch,
+    'parse': bench_parse,
+    'extract': bench_extract,
+    'csv': bench_csv,
+    'job': bench_job,
+}
+
+def run_stage(stage, config):
+    """Dijalankan di proses anak yang baru: mengukur satu tahap dan peak RSS proses tersebut."""
+    import tugasakhir
+    fixtures = load_fixtures()
+    rss_before = peak_rss_mb()
+    summary = STAGE_RUNNERS[stage](config, tugasakhir, fixtures)
+    summary['peak_rss_mb'] = round(peak_rss_mb(), 1) if resource else None
+    summary['rss_growth_mb'] = round(summary['peak_rss_mb'] - rss_before, 1) if resource else None
+    return summary
+
+def format_results(results):
+    header = f"{'tahap':<8} {'halaman':>8} {'error':>6} {'hal/detik':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak RSS MB':>12}"
+    lines = [header, '-' * len(header)]
+    for summary in results:
+        p50, p99, rss = (f"{summary[key]:.2f}" if summary[key] is not None else 'n/a' for key in ('p50_ms', 'p99_ms', 'peak_rss_mb'))
+        lines.append(f"{summary['stage']:<8} {summary['pages']:>8} {summary['errors']:>6} {summary['pages_per_sec']:>10.1f} "
+                     f"{p50:>9} {p99:>9} {rss:>12}")
+    return '\n'.join(lines)
+
+def find_regressions(results, baseline, max_regression):
+    """Membandingkan hal/detik per tahap dengan baseline; mengembalikan daftar pesan regresi."""
+    baseline_by_stage = {summary['stage']: summary for summary in baseline.get('results', [])}
+    regressions = []
+    for summary in results:
+        previous = baseline_by_stage.get(summary['stage'])
+        if not previous or not previous['pages_per_sec']:
+            continue
+        change = summary['pages_per_sec'] / previous['pages_per_sec'] - 1
+        if change < -max_regression:
+            regressions.append(f"{summary['stage']}: {previous['pages_per_sec']:.1f} -> {summary['pages_per_sec']:.1f} hal/detik ({change:+.0%})")
+    return regressions
+
+def build_arg_parser():
+    from tugasakhir import FETCH_ENGINES # Nama engine sama dengan CLI utama; tahap tetap mengimpor modulnya di proses anak
+    parser = argparse.ArgumentParser(description="Benchmark offline fetch/parse/extract/CSV dengan server fixture lokal.")
+    parser.add_argument('--pages', type=int, default=500, help="Jumlah halaman per tahap (bawaan: 500)")
+    parser.add_argument('--stages', nargs='+', choices=ALL_STAGES, default=DEFAULT_STAGES,
+                        help="Tahap yang diukur (bawaan: fetch parse extract csv)")
+    parser.add_argument('--backend', choices=['bs4', 'partial', 'lxml'], default='bs4', help="Backend ekstraksi (bawaan: bs4)")
+    parser.add_argument('--max-response-bytes', type=int, help="Tahap fetch/job: stream respons dengan batas byte ini (bawaan: tanpa batas)")
+    parser.add_argument('--engine', choices=sorted(FETCH_ENGINES), default='thread', help="Engine untuk tahap 'job' (bawaan: thread)")
+    parser.add_argument('--concurrency', type=int, default=8, help="Worker fetch paralel (bawaan: 8)")
+    parser.add_argument('--no-keep-alive', action='store_true', help="Tutup koneksi setelah setiap request")
+    parser.add_argument('--latency-ms', type=float, default=0, help="Latensi tambahan server per request (bawaan: 0)")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Jitter acak tambahan 0..N ms per request (bawaan: 0)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraksi request yang dijawab 500/503/429 (bawaan: 0)")
+    parser.add_argument('--seed', type=int, default=0, help="Seed untuk latensi dan error server (bawaan: 0)")
+    parser.add_argument('--csv-batch-size', type=int, default=50, help="batch_size CheckpointedCSVWriter (bawaan: 50)")
+    parser.add_argument('--json', metavar='FILE', help="Simpan hasil sebagai JSON (dapat dipakai sebagai --baseline)")
+    parser.add_argument('--baseline', metavar='FILE', help="File JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                        help="Penurunan hal/detik maksimum per tahap terhadap baseline sebelum keluar dengan kode 1 (bawaan: 0.2)")
+    return parser
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    server = FixtureHTTPServer(load_fixtures(), args.latency_ms, args.jitter_ms, args.error_rate, args.seed).start()
+    config = {
+        'base_url': server.base_url,
+        'pages': args.pages,
+        'backend': args.backend,
+        'engine': args.engine,
+        'concurrency': args.concurrency,
+        'no_keep_alive': args.no_keep_alive,
+        'csv_batch_size': args.csv_batch_size,
+        'max_response_bytes': args.max_response_bytes,
+    }
+    results = []
+    try:
+        for stage in args.stages:
+            # Proses baru per tahap: peak RSS tidak tercampur dengan tahap sebelumnya
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+                results.append(executor.submit(run_stage, stage, config).result())
+            print(f"  {stage}: {results[-1]['pages_per_sec']:.1f} hal/detik", file=sys.stderr)
+    finally:
+        server.stop()
+
+    print(format_results(results))
+    output = {
+        'config': {key: value for key, value in vars(args).items() if key not in ('json', 'baseline')},
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'results': results,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+        print(f"Hasil benchmark disimpan ke '{args.json}'", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.max_regression)
+        if regressions:
+            print("Regresi terdeteksi:\n" + '\n'.join(f"   {line}" for line in regressions))
+            return 1
+        print(f"Tidak ada regresi melebihi {args.max_regression:.0%} dibanding baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
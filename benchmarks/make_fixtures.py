@@ -0,0 +1,112 @@
+"""
+Membuat ulang korpus fixture HTML untuk benchmark (benchmarks/fixtures/*.html).
+
+Halaman-halaman ini meniru struktur halaman artikel detik.com yang ada di hasil_scraping.csv
+(header/nav besar, skrip inline, iklan, artikel di <article class="detail">, sidebar, footer),
+dengan isi artikel yang diperpanjang secara deterministik dari teks aslinya. Hasilnya di-commit
+agar benchmark tidak pernah perlu mengakses situs berita sungguhan.
+
+    python benchmarks/make_fixtures.py
+"""
+import csv
+import html
+import os
+import random
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCHMARK_DIR, 'fixtures')
+SOURCE_CSV = os.path.join(BENCHMARK_DIR, '..', 'hasil_scraping.csv')
+SEED = 20250609
+
+SECTIONS = ['detikNews', 'detikFinance', 'detikFood', 'detikSport', 'detikPop', 'detikHot', 'detikInet', 'detikOto']
+
+def inline_script(rng, size):
+    """Skrip inline berukuran kira-kira `size` byte, seperti skrip iklan/analitik di halaman asli."""
+    parts = []
+    while sum(len(p) for p in parts) < size:
+        parts.append(f"window.dtkAds=window.dtkAds||[];dtkAds.push({{slot:'div-gpt-ad-{rng.randint(1000, 9999)}',"
+                     f"sizes:[[300,250],[728,90]],targeting:{{kanal:'{rng.choice(SECTIONS)}',pos:{rng.randint(1, 9)}}}}});\n")
+    return "<script>\n" + "".join(parts) + "</script>"
+
+def navigation(rng):
+    links = "".join(f'<li><a href="https://www.detik.com/{s.lower()}/{i}">{s} {i}</a></li>'
+                    for s in SECTIONS for i in range(rng.randint(4, 8)))
+    return f'<header class="header"><nav class="nav"><ul>{links}</ul></nav></header>'
+
+def paragraphs(rng, words, count):
+    result = []
+    for _ in range(count):
+        length = rng.randint(35, 70)
+        result.append("<p>" + html.escape(" ".join(rng.choice(words) for _ in range(length))) + ".</p>")
+    return result
+
+def article_page(rng, row, words, paragraph_count, with_article_tag=True):
+    title = html.escape(row['title'])
+    description = html.escape(row['meta_description'])
+    preview = html.escape(row['content_preview'])
+    body = paragraphs(rng, words, paragraph_count)
+    # Sisipkan iklan dan skrip di tengah isi artikel, seperti di halaman asli
+    body.insert(len(body) // 3, '<div class="ads"><div id="div-gpt-ad-inarticle">Advertisement</div></div>')
+    body.insert(len(body) // 2, inline_script(rng, 1500))
+    author_line = f'<div class="detail__author">{html.escape(row["author"]) if row["author"] != "Unknown" else "Tim Redaksi"} - {rng.choice(SECTIONS)}</div>'
+    date_line = (f'<div class="date">{html.escape(row["publish_date"])}</div>' if row['publish_date'] != 'Unknown'
+                 else '<div class="detail__date">Senin, 09 Jun 2025 09:42 WIB</div>')
+    content = (f'<div class="detail__header"><h1 class="detail__title">{title}</h1>{author_line}{date_line}</div>'
+               f'<figure class="detail__media"><img src="https://akcdn.detik.net.id/x.jpg" alt="{title}"><figcaption>Ilustrasi</figcaption></figure>'
+               f'<div class="detail__body-text itp_bodycontent"><p>{preview}</p>{"".join(body)}</div>')
+    container = f'<article class="detail">{content}</article>' if with_article_tag else f'<div class="detail">{content}</div>'
+    related = "".join(f'<li><a href="https://www.detik.com/berita/d-{rng.randint(7000000, 7999999)}/x">{html.escape(rng.choice(words).title())} {i}</a></li>'
+                      for i in range(25))
+    return f"""<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<meta name="description" content="{description}">
+<meta property="og:title" content="{title}">
+<meta property="og:description" content="{description}">
+<link rel="canonical" href="{html.escape(row['url'])}">
+<style>{'.detail__body-text p{margin:0 0 16px;line-height:1.6}' * 40}</style>
+{inline_script(rng, 12000)}
+</head>
+<body>
+{navigation(rng)}
+<div class="container">
+{container}
+<aside class="sidebar"><h3>Berita Terkait</h3><ul>{related}</ul></aside>
+<div id="comments"><form><textarea></textarea></form></div>
+</div>
+<footer class="footer">Copyright @ 2025 detikcom. All right reserved</footer>
+{inline_script(rng, 6000)}
+</body>
+</html>
+"""
+
+def section_index_page(rng, words):
+    """Halaman indeks kanal: banyak tautan, sedikit teks (gagal sebagai artikel, < 100 kata)."""
+    links = "".join(f'<li><a href="https://finance.detik.com/berita/d-{rng.randint(7000000, 7999999)}/{rng.choice(words)}">{html.escape(rng.choice(words).title())}</a></li>'
+                    for _ in range(60))
+    return (f'<!DOCTYPE html><html lang="id"><head><meta charset="utf-8"><title>detikFinance</title>{inline_script(rng, 8000)}</head>'
+            f'<body>{navigation(rng)}<main><ul class="list-content">{links}</ul></main><footer>detikcom</footer></body></html>')
+
+def main():
+    rng = random.Random(SEED)
+    with open(SOURCE_CSV, 'r', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    words = sorted({word.strip('.,:;?"()').lower() for row in rows for word in row['content_preview'].split() if word.isalpha()})
+
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    pages = {}
+    for i, row in enumerate(rows):
+        pages[f"article_{i:02d}_long.html"] = article_page(rng, row, words, rng.randint(14, 22))
+        pages[f"article_{i:02d}_short.html"] = article_page(rng, row, words, rng.randint(3, 6))
+    pages["article_fallback_body.html"] = article_page(rng, rows[0], words, 10, with_article_tag=False)
+    pages["section_index.html"] = section_index_page(rng, words)
+
+    for name, content in pages.items():
+        with open(os.path.join(FIXTURE_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+    print(f"{len(pages)} fixture ditulis ke {FIXTURE_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# tugasakhir.py berada di root repositori, bukan di dalam paket
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,115 @@
+import csv
+import json
+
+import pytest
+
+import tugasakhir
+
+
+def result(url, word_count=100):
+    return {'url': url, 'title': "Judul\nberita", 'word_count': word_count, 'thread_id': 'T1'}
+
+
+def read_rows(csv_path):
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def read_checkpoint(csv_path):
+    with open(csv_path + '.checkpoint.jsonl', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("content, expected", [
+    (b"a\nb\n", b"a\nb\n"),
+    (b"a\nb\nsetengah", b"a\nb\n"),
+    (b"tanpa newline", b""),
+    (b"", b""),
+    (b"a\n" + b"x" * 10000, b"a\n"), # Baris terpotong lebih panjang dari satu blok baca
+])
+def test_truncate_partial_last_line(tmp_path, content, expected):
+    path = tmp_path / "file.txt"
+    path.write_bytes(content)
+    tugasakhir._truncate_partial_last_line(str(path))
+    assert path.read_bytes() == expected
+
+
+def test_rows_are_single_line_and_flushed_in_batches(tmp_path):
+    csv_path = str(tmp_path / "hasil.csv")
+    writer = tugasakhir.CheckpointedCSVWriter(csv_path, batch_size=2)
+    try:
+        writer.write_result(result("https://a.com/1"))
+        assert read_rows(csv_path) == [] # Masih di buffer batch
+        writer.record_failure("https://a.com/2", "Timeout Error")
+        assert [row['url'] for row in read_rows(csv_path)] == ["https://a.com/1"]
+        assert read_rows(csv_path)[0]['title'] == "Judul berita"
+        assert read_checkpoint(csv_path) == [{'url': "https://a.com/1", 'status': 'done'},
+                                             {'url': "https://a.com/2", 'status': 'failed', 'reason': "Timeout Error"}]
+    finally:
+        writer.close()
+
+
+def test_resume_after_crash_mid_row_truncates_and_appends(tmp_path):
+    csv_path = str(tmp_path / "hasil.csv")
+    with tugasakhir.CheckpointedCSVWriter(csv_path) as writer:
+        writer.write_result(result("https://a.com/1"))
+        writer.record_failure("https://a.com/2", "HTTP Error: 500 - Internal Server Error")
+    # Crash saat baris berikutnya baru sebagian tertulis
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write('https://a.com/3,Judul setengah,12')
+    with open(csv_path + '.checkpoint.jsonl', 'a', encoding='utf-8') as f:
+        f.write('{"url": "https://a.com/3", "sta')
+
+    resumed = tugasakhir.CheckpointedCSVWriter(csv_path, resume=True)
+    try:
+        assert resumed.done_urls == {"https://a.com/1"}
+        assert resumed.completed_urls == {"https://a.com/1", "https://a.com/2"}
+        resumed.write_result(result("https://a.com/3"))
+    finally:
+        resumed.close()
+
+    assert [row['url'] for row in read_rows(csv_path)] == ["https://a.com/1", "https://a.com/3"]
+    assert [entry['url'] for entry in read_checkpoint(csv_path)] == ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+
+
+def test_resume_uses_csv_rows_missing_from_checkpoint(tmp_path):
+    # Crash setelah CSV di-fsync tetapi sebelum checkpoint tertulis
+    csv_path = str(tmp_path / "hasil.csv")
+    with tugasakhir.CheckpointedCSVWriter(csv_path) as writer:
+        writer.write_result(result("https://a.com/1"))
+    open(csv_path + '.checkpoint.jsonl', 'w').close()
+    resumed = tugasakhir.CheckpointedCSVWriter(csv_path, resume=True)
+    try:
+        assert resumed.done_urls == {"https://a.com/1"}
+    finally:
+        resumed.close()
+
+
+def test_without_resume_output_is_overwritten(tmp_path):
+    csv_path = str(tmp_path / "hasil.csv")
+    with tugasakhir.CheckpointedCSVWriter(csv_path) as writer:
+        writer.write_result(result("https://a.com/1"))
+    with tugasakhir.CheckpointedCSVWriter(csv_path) as writer:
+        assert writer.completed_urls == set()
+    assert read_rows(csv_path) == []
+    assert read_checkpoint(csv_path) == []
+
+
+@pytest.mark.parametrize("skip_failed, expected_fetch", [
+    (True, ["https://a.com/3"]),
+    (False, ["https://a.com/2", "https://a.com/3"]),
+])
+def test_resumed_job_skips_done_urls_and_failed_urls_only_with_skip_failed(tmp_path, skip_failed, expected_fetch):
+    csv_path = str(tmp_path / "hasil.csv")
+    with tugasakhir.CheckpointedCSVWriter(csv_path) as writer:
+        writer.write_result(result("https://a.com/1"))
+        writer.record_failure("https://a.com/2", "Timeout Error")
+
+    job = tugasakhir.ScrapingJob(csv_path, resume=True, skip_failed=skip_failed, log=lambda message: None)
+    try:
+        urls_to_fetch, skipped_urls, duplicate_urls = job.prepare(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+    finally:
+        job.close()
+    assert urls_to_fetch == expected_fetch
+    assert skipped_urls == {"https://a.com/1", "https://a.com/2"} - set(expected_fetch)
+    assert duplicate_urls == {}
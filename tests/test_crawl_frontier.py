@@ -0,0 +1,193 @@
+import math
+import threading
+import time
+
+import tugasakhir
+
+
+def open_frontier(tmp_path, shard_count=4):
+    return tugasakhir.CrawlFrontier(str(tmp_path / "frontier.sqlite"), shard_count=shard_count)
+
+
+def test_add_urls_canonicalizes_and_ignores_existing(tmp_path):
+    frontier = open_frontier(tmp_path)
+    try:
+        assert frontier.add_urls(["https://a.com/1?utm_source=x", "https://a.com/1", "https://b.com/2"]) == 2
+        assert frontier.add_urls(["https://a.com/1"]) == 0
+        assert frontier.counts() == {'pending': 2, 'leased': 0, 'done': 0, 'failed': 0}
+    finally:
+        frontier.close()
+
+
+def test_add_urls_records_invalid_urls_as_failed(tmp_path):
+    frontier = open_frontier(tmp_path)
+    try:
+        frontier.add_urls(["https://a.com/1", "http://a.com:abc/x", "http://[::1/x"])
+        assert frontier.counts() == {'pending': 1, 'leased': 0, 'done': 0, 'failed': 2}
+    finally:
+        frontier.close()
+
+
+def test_lease_complete_and_fail(tmp_path):
+    frontier = open_frontier(tmp_path)
+    try:
+        frontier.add_urls(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+        leased = frontier.lease('w1', limit=2)
+        assert len(leased) == 2
+        assert sorted(frontier.lease('w2', limit=10)) == [url for url in ["https://a.com/1", "https://a.com/2", "https://a.com/3"] if url not in leased]
+        assert frontier.complete(leased[0], 'w1')
+        assert frontier.fail(leased[1], 'w1', "HTTP Error: 404 - Not Found")
+        assert not frontier.complete(leased[0], 'w1') # Sudah tidak disewa
+        assert frontier.counts() == {'pending': 0, 'leased': 1, 'done': 1, 'failed': 1}
+    finally:
+        frontier.close()
+
+
+def test_expired_lease_is_handed_to_another_worker(tmp_path):
+    frontier = open_frontier(tmp_path)
+    try:
+        frontier.add_urls(["https://a.com/1"])
+        assert frontier.lease('crashed', lease_seconds=0.01) == ["https://a.com/1"]
+        assert frontier.lease('w2') == []
+        time.sleep(0.05)
+        assert frontier.lease('w2') == ["https://a.com/1"]
+        assert not frontier.complete("https://a.com/1", 'crashed') # Worker lama tidak boleh melaporkan lagi
+        assert frontier.complete("https://a.com/1", 'w2')
+    finally:
+        frontier.close()
+
+
+def test_renew_keeps_lease_alive(tmp_path):
+    frontier = open_frontier(tmp_path)
+    try:
+        frontier.add_urls(["https://a.com/1"])
+        frontier.lease('w1', lease_seconds=0.05)
+        assert frontier.renew('w1', lease_seconds=60) == 1
+        time.sleep(0.1)
+        assert frontier.lease('w2') == []
+    finally:
+        frontier.close()
+
+
+def test_requeue_failed_then_lease_round_trip(tmp_path):
+    frontier = open_frontier(tmp_path)
+    try:
+        frontier.add_urls(["https://a.com/1"])
+        [url] = frontier.lease('w1')
+        frontier.fail(url, 'w1', "Timeout Error")
+        assert frontier.lease('w1') == []
+        assert frontier.requeue_failed() == 1
+        assert frontier.lease('w1') == [url]
+        assert frontier.complete(url, 'w1')
+        assert frontier.counts()['done'] == 1
+    finally:
+        frontier.close()
+
+
+def test_release_returns_urls_to_pending(tmp_path):
+    frontier = open_frontier(tmp_path)
+    try:
+        frontier.add_urls(["https://a.com/1", "https://a.com/2"])
+        leased = frontier.lease('w1')
+        frontier.release(leased, 'w1')
+        assert sorted(frontier.lease('w2')) == sorted(leased)
+    finally:
+        frontier.close()
+
+
+def test_lease_only_from_requested_shards(tmp_path):
+    frontier = open_frontier(tmp_path, shard_count=8)
+    try:
+        urls = [f"https://host{i}.com/a" for i in range(20)]
+        frontier.add_urls(urls)
+        shard = tugasakhir.host_shard(urls[0], frontier.shard_count)
+        leased = frontier.lease('w1', limit=100, shards=[shard])
+        assert urls[0] in leased
+        assert all(tugasakhir.host_shard(url, frontier.shard_count) == shard for url in leased)
+    finally:
+        frontier.close()
+
+
+def test_checkpoint_resume_separates_done_and_failed(tmp_path):
+    csv_path = str(tmp_path / "hasil.csv")
+    with tugasakhir.CheckpointedCSVWriter(csv_path) as writer:
+        writer.write_result({'url': "https://a.com/1", 'title': "Judul", 'word_count': 100})
+        writer.record_failure("https://a.com/2", "Timeout Error")
+    resumed = tugasakhir.CheckpointedCSVWriter(csv_path, resume=True)
+    try:
+        assert resumed.completed_urls == {"https://a.com/1", "https://a.com/2"}
+        assert resumed.done_urls == {"https://a.com/1"}
+    finally:
+        resumed.close()
+
+
+def test_worker_refetches_requeued_failure_instead_of_marking_it_done(tmp_path):
+    # URL yang tidak valid gagal tanpa akses jaringan; setelah --requeue-failed, worker dengan id yang
+    # sama harus mencobanya lagi (tetap failed), bukan melewatinya sebagai 'done' dari checkpoint
+    frontier_path = str(tmp_path / "frontier.sqlite")
+    csv_path = str(tmp_path / "hasil.csv")
+    frontier = tugasakhir.CrawlFrontier(frontier_path)
+    try:
+        frontier.add_urls(["http://a.com:abc/x"], canonicalize=False)
+        for _ in range(2):
+            assert frontier.requeue_failed() == 1
+            totals = tugasakhir.run_frontier_worker(frontier_path, csv_path, 'w1', wait_for_leases=False, log=lambda message: None)
+            assert totals['failed'] == 1 and totals['done'] == 0
+            assert frontier.counts() == {'pending': 0, 'leased': 0, 'done': 0, 'failed': 1}
+    finally:
+        frontier.close()
+
+
+def test_dedup_index_can_be_shared_by_two_connections(tmp_path):
+    path = str(tmp_path / "dedup.sqlite")
+    first = tugasakhir.ContentDedupIndex(path, busy_timeout=1.0)
+    second = tugasakhir.ContentDedupIndex(path, busy_timeout=1.0)
+    try:
+        for i in range(20):
+            first.mark_url_seen(f"https://a.com/{i}")
+            second.mark_url_seen(f"https://b.com/{i}")
+        assert second.is_url_seen("https://a.com/19")
+        assert first.is_url_seen("https://b.com/19")
+    finally:
+        first.close()
+        second.close()
+
+
+def test_worker_leases_several_batches(tmp_path):
+    frontier_path = str(tmp_path / "frontier.sqlite")
+    frontier = tugasakhir.CrawlFrontier(frontier_path)
+    try:
+        frontier.add_urls([f"http://a.com:abc/{i}" for i in range(10)], canonicalize=False)
+        frontier.requeue_failed()
+        totals = tugasakhir.run_frontier_worker(frontier_path, str(tmp_path / "hasil.csv"), 'w1', lease_batch=3, wait_for_leases=False,
+                                                log=lambda message: None)
+        assert totals == {'batches': 4, 'done': 0, 'failed': 10, 'released': 0}
+        assert frontier.counts() == {'pending': 0, 'leased': 0, 'done': 0, 'failed': 10}
+    finally:
+        frontier.close()
+
+
+def test_retry_queue_pulls_slow_input_outside_its_lock():
+    pulling = threading.Event()
+    release = threading.Event()
+
+    def slow_urls():
+        yield "https://a.com/1"
+        pulling.set()
+        release.wait(5) # Mis. frontier.lease() yang menunggu kunci SQLite proses lain
+        yield "https://a.com/2"
+
+    url_queue = tugasakhir.RetryQueue(slow_urls(), tugasakhir.RetryPolicy(max_retries=0))
+    assert url_queue.poll() == (("https://a.com/1", 0), 0)
+    puller = threading.Thread(target=url_queue.get)
+    puller.start()
+    assert pulling.wait(5)
+    finished = threading.Thread(target=url_queue.finish, args=("https://a.com/1", 0))
+    finished.start()
+    finished.join(1)
+    assert not finished.is_alive() # finish() tidak tertahan oleh penarikan input
+    assert url_queue.poll() == (None, math.inf) # URL berikutnya sedang ditarik
+    release.set()
+    puller.join(5)
+    assert url_queue.finish("https://a.com/2", 0) is False
+    assert url_queue.poll() == (None, None)
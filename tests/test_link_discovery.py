@@ -0,0 +1,119 @@
+import tugasakhir
+
+
+def test_bloom_filter_add_and_contains():
+    seen = tugasakhir.BloomFilter(capacity=1000, error_rate=0.01)
+    assert seen.add("https://a.com/1")
+    assert not seen.add("https://a.com/1")
+    assert "https://a.com/1" in seen
+    assert "https://a.com/2" not in seen
+    assert seen.count == 1
+
+
+def test_bloom_filter_false_positive_rate_stays_near_target():
+    seen = tugasakhir.BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        seen.add(f"https://a.com/artikel/{i}")
+    assert all(f"https://a.com/artikel/{i}" in seen for i in range(5000))
+    false_positives = sum(f"https://b.com/lain/{i}" in seen for i in range(5000))
+    assert false_positives < 5000 * 0.03
+
+
+def test_bloom_filter_save_and_load(tmp_path):
+    path = str(tmp_path / "seen.bloom")
+    seen = tugasakhir.BloomFilter(capacity=1000, path=path)
+    seen.add("https://a.com/1")
+    seen.save()
+    loaded = tugasakhir.BloomFilter(capacity=1000, path=path)
+    assert "https://a.com/1" in loaded
+    assert loaded.count == 1
+
+
+def test_bloom_filter_ignores_corrupt_file(tmp_path, capsys):
+    path = tmp_path / "seen.bloom"
+    path.write_bytes(b"bukan bloom filter")
+    seen = tugasakhir.BloomFilter(capacity=1000, path=str(path))
+    assert "https://a.com/1" not in seen
+    assert "tidak dapat dibaca" in capsys.readouterr().out
+
+
+def test_extract_links_resolves_and_canonicalizes():
+    html_content = (b'<a href="/berita/d-1?utm_source=x">1</a>'
+                    b"<a class='x' href='https://m.detik.com/berita/d-2'>2</a>"
+                    b'<a href=d-3>3</a>'
+                    b'<a href="#atas">atas</a><a href="javascript:void(0)">js</a><a href="mailto:a@b.c">mail</a>'
+                    b'<a href="ftp://a.com/file">ftp</a>')
+    assert tugasakhir.extract_links(html_content, "https://www.detik.com/berita/") == [
+        "https://www.detik.com/berita/d-1",
+        "https://www.detik.com/berita/d-2",
+        "https://www.detik.com/berita/d-3",
+    ]
+
+
+def test_extract_links_skips_malformed_hrefs():
+    html_content = (b'<a href="http://x.com:port/">port</a>'
+                    b'<a href="http://[::1/x">ipv6</a>'
+                    b'<a href="/ok">ok</a>')
+    assert tugasakhir.extract_links(html_content, "https://a.com/") == ["https://a.com/ok"]
+
+
+def test_crawl_scope_hosts_and_patterns():
+    scope = tugasakhir.CrawlScope({'.detik.com', 'example.org'}, include_patterns=[r'/berita/'], exclude_patterns=[r'/foto/'])
+    assert scope.allows("https://finance.detik.com/berita/d-1")
+    assert scope.allows("https://example.org/berita/d-1")
+    assert not scope.allows("https://sub.example.org/berita/d-1")
+    assert not scope.allows("https://notdetik.com/berita/d-1")
+    assert not scope.allows("https://finance.detik.com/indeks")
+    assert not scope.allows("https://finance.detik.com/berita/foto/d-1")
+
+
+def test_link_discoverer_does_not_mark_links_seen_before_fetch():
+    seen = tugasakhir.BloomFilter(capacity=1000)
+    seen.add("https://a.com/lama")
+    scope = tugasakhir.CrawlScope({'a.com'})
+    discoverer = tugasakhir.LinkDiscoverer(scope, seen, scheduled=["https://a.com/"])
+    page = b'<a href="/">home</a><a href="/lama">lama</a><a href="/baru">baru</a><a href="/baru">lagi</a><a href="https://b.com/x">luar</a>'
+
+    discoverer.on_page("https://a.com/", page)
+    discoverer.on_page("https://a.com/", page)
+
+    assert discoverer.take_discovered() == ["https://a.com/baru"]
+    assert "https://a.com/baru" not in seen # Baru dicatat setelah benar-benar di-fetch
+    assert discoverer.links_seen == 8
+
+
+def test_crawl_only_persists_fetched_urls_in_seen_filter(tmp_path):
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    seed_page = b''.join(b'<a href="/a/%d">%d</a>' % (i, i) for i in range(6)) + b'<a href="http://x.com:port/">rusak</a>'
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = seed_page if self.path == '/' else b'<html><body>pendek</body></html>'
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    seed_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    seen_path = str(tmp_path / "seen.bloom")
+    try:
+        summary = tugasakhir.run_crawl_job([seed_url], str(tmp_path / "hasil.csv"), max_pages=3, seen_filter_path=seen_path,
+                                           log=lambda message: None, max_retries=0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert summary['discovered_per_level'] == [6, 0]
+    fetched = summary['urls_to_fetch']
+    assert len(fetched) == 3
+    seen = tugasakhir.BloomFilter(path=seen_path)
+    all_links = [seed_url] + [f"{seed_url}a/{i}" for i in range(6)]
+    assert [url for url in all_links if url in seen] == fetched
@@ -0,0 +1,123 @@
+import json
+import math
+import random
+
+import pytest
+
+import tugasakhir
+
+
+def result(word_count, thread_id='T1'):
+    return {'word_count': word_count, 'thread_id': thread_id}
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(round(q * len(ordered), 9))) - 1]
+
+
+def test_quantile_of_two_samples_uses_nearest_rank():
+    histogram = tugasakhir.LogHistogram()
+    for value in (200, 300):
+        histogram.add(value)
+    assert histogram.quantile(0.5) == pytest.approx(200, rel=0.01)
+    assert histogram.quantile(0.9) == pytest.approx(300, rel=0.01)
+    assert histogram.quantile(0.99) == pytest.approx(300, rel=0.01)
+    assert histogram.quantile(0) == 200 and histogram.quantile(1) == 300
+
+
+def test_quantile_within_relative_accuracy():
+    rng = random.Random(3)
+    values = [rng.randint(1, 5000) for _ in range(1000)]
+    histogram = tugasakhir.LogHistogram()
+    for value in values:
+        histogram.add(value)
+    for q in (0.07, 0.25, 0.5, 0.9, 0.99):
+        assert histogram.quantile(q) == pytest.approx(exact_quantile(values, q), rel=0.02)
+
+
+def test_quantile_with_zeros_and_empty_histogram():
+    assert tugasakhir.LogHistogram().quantile(0.5) is None
+    histogram = tugasakhir.LogHistogram()
+    for value in (0, 0, 0, 100):
+        histogram.add(value)
+    assert histogram.quantile(0.75) == 0
+    assert histogram.quantile(0.8) == pytest.approx(100, rel=0.01)
+
+
+def test_histogram_merge_and_dict_round_trip():
+    first, second, both = tugasakhir.LogHistogram(), tugasakhir.LogHistogram(), tugasakhir.LogHistogram()
+    for value in range(1, 200):
+        (first if value % 2 else second).add(value)
+        both.add(value)
+    first.merge(second)
+    assert first.to_dict() == both.to_dict()
+    restored = tugasakhir.LogHistogram.from_dict(json.loads(json.dumps(first.to_dict())))
+    assert [restored.quantile(q) for q in (0.1, 0.5, 0.9)] == [both.quantile(q) for q in (0.1, 0.5, 0.9)]
+
+
+def recorded_analytics():
+    analytics = tugasakhir.LiveScrapingAnalytics(rate_window_seconds=10)
+    analytics.record("https://a.com/1", result(300), now=1000.0)
+    analytics.record("https://a.com/2", result(500, 'T2'), now=1000.5)
+    analytics.record("https://b.com/1", result(700), now=1004.0)
+    analytics.record("https://b.com/2", error_reason="HTTP Error: 429 - Too Many Requests", now=1005.0)
+    analytics.record("https://b.com/3", error_reason="Timeout Error: baca", now=1006.0)
+    return analytics
+
+
+def test_record_updates_counts_hosts_threads_and_rate():
+    analytics = recorded_analytics()
+    assert (analytics.successes, analytics.failures, analytics.total_words) == (3, 2, 1500)
+    assert analytics.failure_categories == {'HTTP 429 (dibatasi)': 1, 'Timeout': 1}
+    assert analytics.hosts['a.com']['articles'] == 2 and analytics.hosts['b.com']['failures'] == 2
+    assert analytics.threads['T1']['words'] == 1000
+    assert analytics.rate_series(now=1005.0) == [0] * 4 + [2, 0, 0, 0, 1, 0]
+    assert analytics.window_rate(now=1005.0) == pytest.approx(0.3)
+    assert analytics.report_stats()['rows'] == 3
+    assert "HTTP 429 (dibatasi): 1" in analytics.generate_comprehensive_report()
+
+
+def test_merge_adds_counts_and_active_seconds():
+    merged = recorded_analytics()
+    merged.merge(recorded_analytics())
+    assert (merged.successes, merged.failures, merged.total_words) == (6, 4, 3000)
+    assert merged.word_counts.count == 6
+    assert merged.failure_categories['Timeout'] == 2
+    assert merged.previous_runs == 1
+    assert merged.hosts['a.com']['articles'] == 4
+    assert merged.hosts['a.com']['previous_seconds'] == pytest.approx(0.5) # Detik aktif run lain dijumlahkan, bukan direntangkan
+
+
+def test_to_dict_from_dict_round_trip():
+    data = recorded_analytics().to_dict()
+    restored = tugasakhir.LiveScrapingAnalytics.from_dict(json.loads(json.dumps(data)))
+    assert restored.to_dict() == data
+    assert restored.first_success == recorded_analytics().first_success
+
+
+def test_save_and_load_check_csv_size(tmp_path):
+    csv_path = tmp_path / "hasil.csv"
+    csv_path.write_text("url\nhttps://a.com/1\n", encoding='utf-8')
+    path = str(tmp_path / "hasil.csv.analytics.json")
+    analytics = recorded_analytics()
+    analytics.save(path, str(csv_path))
+
+    loaded = tugasakhir.LiveScrapingAnalytics.load(path, str(csv_path))
+    assert loaded.to_dict() == analytics.to_dict()
+
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write("https://a.com/2\n") # CSV berubah setelah snapshot disimpan
+    assert tugasakhir.LiveScrapingAnalytics.load(path, str(csv_path)) is None
+    assert tugasakhir.LiveScrapingAnalytics.load(path) is not None # Tanpa CSV, ukuran tidak dicek
+    csv_path.unlink()
+    assert tugasakhir.LiveScrapingAnalytics.load(path, str(csv_path)) is None
+
+
+def test_load_missing_or_corrupt_snapshot(tmp_path):
+    path = tmp_path / "snapshot.json"
+    assert tugasakhir.LiveScrapingAnalytics.load(str(path)) is None
+    path.write_text("{rusak", encoding='utf-8')
+    assert tugasakhir.LiveScrapingAnalytics.load(str(path)) is None
+    path.write_text(json.dumps({'successes': 1}), encoding='utf-8')
+    assert tugasakhir.LiveScrapingAnalytics.load(str(path)) is None
@@ -0,0 +1,119 @@
+import csv
+import gzip
+import os
+
+import tugasakhir
+
+
+def page(title, words=400):
+    return (f"<html><head><title>{title}</title></head><body><article><p>"
+            + " ".join(f"kata{i}" for i in range(words)) + "</p></article></body></html>").encode('utf-8')
+
+
+def test_round_trip_append_reopen_read(tmp_path):
+    path = str(tmp_path / "arsip.warc.gz")
+    with tugasakhir.RawHTMLArchive(path, batch_size=2) as archive:
+        archive.append("https://a.com/1", page("Satu"))
+        assert archive.get("https://a.com/1") == page("Satu") # Masih di buffer batch
+        archive.append("https://a.com/2", page("Dua"))
+        archive.append("https://a.com/1", page("Satu versi baru"))
+
+    with tugasakhir.RawHTMLArchive(path, writable=False) as archive:
+        assert len(archive) == 2
+        assert "https://a.com/2" in archive and "https://a.com/3" not in archive
+        assert archive.get("https://a.com/1") == page("Satu versi baru") # Record terbaru per URL
+        assert archive.get("https://a.com/2") == page("Dua")
+        assert archive.get("https://a.com/3") is None
+        with open(path, 'rb') as f:
+            offset, length = archive.offsets["https://a.com/2"]
+            assert tugasakhir.read_archive_record(f.read(), offset, length) == ("https://a.com/2", page("Dua"))
+
+    # Member gzip berurutan: arsip dapat dibaca sebagai satu file .warc.gz biasa
+    with gzip.open(path, 'rb') as f:
+        assert f.read().count(b"WARC/1.0\r\n") == 3
+
+
+def test_append_after_reopen_keeps_earlier_records(tmp_path):
+    path = str(tmp_path / "arsip.warc.gz")
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        archive.append("https://a.com/1", page("Satu"))
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        archive.append("https://a.com/2", page("Dua"))
+        assert archive.get("https://a.com/1") == page("Satu")
+    with tugasakhir.RawHTMLArchive(path, writable=False) as archive:
+        assert [archive.get(url) for url in ("https://a.com/1", "https://a.com/2")] == [page("Satu"), page("Dua")]
+
+
+def test_recovers_unindexed_records_and_cuts_torn_gzip_member(tmp_path):
+    path = str(tmp_path / "arsip.warc.gz")
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        archive.append("https://a.com/1", page("Satu"))
+    indexed_size = os.path.getsize(path)
+    # Crash: record 2 utuh dan record 3 setengah sudah di arsip, indeks belum ditulis
+    torn = tugasakhir._archive_record_bytes("https://a.com/3", page("Tiga"))
+    with open(path, 'ab') as f:
+        f.write(tugasakhir._archive_record_bytes("https://a.com/2", page("Dua")))
+        f.write(torn[:len(torn) // 2])
+
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        assert sorted(archive.offsets) == ["https://a.com/1", "https://a.com/2"]
+        assert archive.get("https://a.com/2") == page("Dua")
+        archive.append("https://a.com/3", page("Tiga"))
+    assert os.path.getsize(path) > indexed_size
+
+    with tugasakhir.RawHTMLArchive(path, writable=False) as archive:
+        assert [archive.get(f"https://a.com/{i}") for i in (1, 2, 3)] == [page("Satu"), page("Dua"), page("Tiga")]
+
+
+def test_recovers_from_torn_index_line(tmp_path):
+    path = str(tmp_path / "arsip.warc.gz")
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        archive.append("https://a.com/1", page("Satu"))
+        archive.append("https://a.com/2", page("Dua"))
+    index_path = path + '.idx.jsonl'
+    with open(index_path, 'rb') as f:
+        lines = f.readlines()
+    with open(index_path, 'wb') as f:
+        f.write(lines[0] + lines[1][:10]) # Crash di tengah baris indeks kedua
+
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        assert archive.get("https://a.com/2") == page("Dua") # Dipulihkan dari ujung arsip
+    with open(index_path, 'rb') as f:
+        assert len(f.readlines()) == 2
+
+
+def test_index_entries_past_a_truncated_archive_are_dropped(tmp_path):
+    path = str(tmp_path / "arsip.warc.gz")
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        archive.append("https://a.com/1", page("Satu"))
+        archive.append("https://a.com/2", page("Dua"))
+    offset, length = tugasakhir.RawHTMLArchive(path, writable=False).offsets["https://a.com/2"]
+    with open(path, 'rb+') as f:
+        f.truncate(offset + length // 2) # Arsip terpotong di tengah record terakhir, indeks utuh
+
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        assert list(archive.offsets) == ["https://a.com/1"]
+        assert os.path.getsize(path) == offset
+        # Record baru menempati offset lama record 2; entri indeks lamanya tidak boleh menunjuk ke sana
+        archive.append("https://a.com/3", page("Tiga dengan isi yang jauh lebih panjang", words=2000))
+    with tugasakhir.RawHTMLArchive(path, writable=False) as archive:
+        assert "https://a.com/2" not in archive
+        assert archive.get("https://a.com/3") == page("Tiga dengan isi yang jauh lebih panjang", words=2000)
+
+
+def test_reextract_archive_writes_latest_record_per_url(tmp_path):
+    path = str(tmp_path / "arsip.warc.gz")
+    with tugasakhir.RawHTMLArchive(path) as archive:
+        archive.append("https://a.com/1", page("Lama"))
+        archive.append("https://a.com/2", page("Pendek", words=5))
+        archive.append("https://a.com/1", page("Baru"))
+    csv_path = str(tmp_path / "ulang.csv")
+
+    summary = tugasakhir.reextract_archive(path, csv_path, processes=1, log=lambda message: None)
+
+    assert sorted(summary['urls_to_fetch']) == ["https://a.com/1", "https://a.com/2"]
+    assert [result['url'] for result in summary['successful_results']] == ["https://a.com/1"]
+    assert [info['url'] for info in summary['failed_urls_info']] == ["https://a.com/2"]
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['url'], row['title']) for row in rows] == [("https://a.com/1", "Baru")]
@@ -0,0 +1,227 @@
+import math
+import random
+import threading
+
+import pytest
+
+import tugasakhir
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def throttled(retry_after=None):
+    return tugasakhir._fetch_failure('throttled', retry_after)
+
+
+def limit_of(limiter, host="a.com"):
+    return limiter.snapshot()[host]['limit']
+
+
+def test_limiter_starts_small_and_blocks_at_limit():
+    limiter = tugasakhir.AdaptiveHostLimiter(10, clock=FakeClock())
+    for _ in range(tugasakhir.ADAPTIVE_INITIAL_HOST_LIMIT):
+        assert limiter.try_acquire("a.com") is None
+    assert limiter.try_acquire("a.com") == math.inf
+    assert limiter.try_acquire("b.com") is None # Batas berlaku per host
+
+
+def test_limiter_additive_increase_on_healthy_responses():
+    limiter = tugasakhir.AdaptiveHostLimiter(10, clock=FakeClock())
+    for _ in range(5):
+        limiter.try_acquire("a.com")
+        limiter.release("a.com", 0.01)
+    assert limit_of(limiter) == 5 # Kira-kira +1 per putaran (4 -> 5 setelah 5 respons sehat)
+    for _ in range(100):
+        limiter.try_acquire("a.com")
+        limiter.release("a.com", 0.01)
+    assert limit_of(limiter) == 10 # Tidak melewati max_limit
+    assert limiter.snapshot()["a.com"]['peak_limit'] == 10
+
+
+def test_limiter_does_not_increase_when_slow_or_erroring():
+    limiter = tugasakhir.AdaptiveHostLimiter(10, clock=FakeClock())
+    limiter.try_acquire("a.com")
+    limiter.release("a.com", 0.01)
+    for _ in range(10):
+        limiter.try_acquire("a.com")
+        limiter.release("a.com", 1.0) # Jauh di atas 3x latensi terbaik
+    assert limit_of(limiter) == 4
+
+    limiter = tugasakhir.AdaptiveHostLimiter(10, clock=FakeClock())
+    for _ in range(2):
+        limiter.try_acquire("a.com")
+        limiter.release("a.com", 0.01, tugasakhir._fetch_failure('error'))
+    limiter.try_acquire("a.com")
+    limiter.release("a.com", 0.01)
+    assert limit_of(limiter) == 4 # Tingkat error (EWMA) masih di atas ambang
+
+
+def test_limiter_halves_on_throttle_once_per_cooldown():
+    clock = FakeClock()
+    limiter = tugasakhir.AdaptiveHostLimiter(16, initial_limit=16, clock=clock)
+    for _ in range(3): # Satu gelombang 429 dari request yang berjalan bersamaan
+        limiter.try_acquire("a.com")
+        limiter.release("a.com", 0.01, throttled())
+    assert limit_of(limiter) == 8
+    clock.now += tugasakhir.AdaptiveHostLimiter.DECREASE_COOLDOWN
+    limiter.try_acquire("a.com")
+    limiter.release("a.com", 0.01, throttled())
+    assert limit_of(limiter) == 4
+    for _ in range(10):
+        clock.now += 1
+        limiter.try_acquire("a.com")
+        limiter.release("a.com", 0.01, throttled())
+    assert limit_of(limiter) == 1 # Tidak pernah di bawah 1
+    assert limiter.snapshot()["a.com"]['throttled'] == 14
+
+
+def test_limiter_respects_retry_after():
+    clock = FakeClock()
+    limiter = tugasakhir.AdaptiveHostLimiter(10, clock=clock)
+    limiter.try_acquire("a.com")
+    limiter.release("a.com", 0.01, throttled(retry_after=2.0))
+    assert limiter.try_acquire("a.com") == pytest.approx(2.0)
+    clock.now += 1.5
+    assert limiter.try_acquire("a.com") == pytest.approx(0.5)
+    assert limiter.try_acquire("b.com") is None
+    clock.now += 0.5
+    assert limiter.try_acquire("a.com") is None
+
+
+def test_limiter_without_adaptation_uses_max_limit():
+    limiter = tugasakhir.AdaptiveHostLimiter(6, adaptive=False, clock=FakeClock())
+    for _ in range(6):
+        assert limiter.try_acquire("a.com") is None
+    limiter.release("a.com", 0.01, throttled())
+    assert limit_of(limiter) == 6
+
+
+def test_limiter_acquire_waits_for_release():
+    limiter = tugasakhir.AdaptiveHostLimiter(1, initial_limit=1)
+    limiter.acquire("a.com")
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: (limiter.acquire("a.com"), acquired.set()))
+    waiter.start()
+    assert not acquired.wait(0.1)
+    limiter.release("a.com", 0.01)
+    assert acquired.wait(5)
+    waiter.join()
+
+
+def test_retry_policy_gives_up_on_fatal_and_after_max_retries():
+    policy = tugasakhir.RetryPolicy(max_retries=2, rng=random.Random(0))
+    assert policy.retry_delay(None, 0) is None
+    assert policy.retry_delay(tugasakhir._fetch_failure('fatal'), 0) is None
+    assert policy.retry_delay(throttled(), 1) is not None
+    assert policy.retry_delay(throttled(), 2) is None
+
+
+def test_retry_policy_full_jitter_bounds():
+    policy = tugasakhir.RetryPolicy(max_retries=10, base_delay=0.5, max_delay=4.0, rng=random.Random(42))
+    for attempt in range(8):
+        cap = min(4.0, 0.5 * 2 ** attempt)
+        delays = [policy.retry_delay(throttled(), attempt) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert max(delays) > cap * 0.9 # Jitter benar-benar memakai seluruh rentang
+    assert policy.retry_delay(throttled(retry_after=20.0), 0) == 20.0 # Retry-After menjadi batas bawah
+
+
+def test_retry_policy_backoff_grows_until_max_delay():
+    class UpperBound:
+        def uniform(self, low, high):
+            return high
+
+    policy = tugasakhir.RetryPolicy(max_retries=10, base_delay=0.5, max_delay=4.0, rng=UpperBound())
+    assert [policy.retry_delay(throttled(), attempt) for attempt in range(6)] == [0.5, 1.0, 2.0, 4.0, 4.0, 4.0]
+
+
+def test_retry_policy_is_repeatable_with_seed():
+    first = tugasakhir.RetryPolicy(rng=random.Random(7))
+    second = tugasakhir.RetryPolicy(rng=random.Random(7))
+    assert [first.retry_delay(throttled(), 1) for _ in range(5)] == [second.retry_delay(throttled(), 1) for _ in range(5)]
+
+
+class FixedDelay:
+    def __init__(self, delay, max_retries=2):
+        self.delay = delay
+        self.max_retries = max_retries
+
+    def retry_delay(self, failure, attempt):
+        return self.delay if failure and attempt < self.max_retries else None
+
+
+def test_retry_queue_end_of_queue_waits_for_in_flight_urls():
+    url_queue = tugasakhir.RetryQueue(["https://a.com/1", "https://a.com/2"], clock=FakeClock())
+    assert url_queue.poll() == (("https://a.com/1", 0), 0)
+    assert url_queue.poll() == (("https://a.com/2", 0), 0)
+    assert url_queue.poll() == (None, math.inf)
+    assert url_queue.finish("https://a.com/1", 0) is False
+    assert url_queue.poll() == (None, math.inf)
+    assert url_queue.finish("https://a.com/2", 0) is False
+    assert url_queue.poll() == (None, None)
+    assert url_queue.retry_count == 0
+
+
+def test_retry_queue_schedules_retries_before_new_urls():
+    clock = FakeClock()
+    url_queue = tugasakhir.RetryQueue(["https://a.com/1", "https://a.com/2"], FixedDelay(3.0), clock=clock)
+    assert url_queue.poll() == (("https://a.com/1", 0), 0)
+    assert url_queue.finish("https://a.com/1", 0, throttled()) is True
+    assert url_queue.retry_count == 1
+    assert url_queue.poll() == (("https://a.com/2", 0), 0) # Retry belum jatuh tempo
+    assert url_queue.poll() == (None, 3.0)
+    clock.now += 3.0
+    assert url_queue.poll() == (("https://a.com/1", 1), 0)
+
+
+def test_retry_queue_retries_due_first_and_gives_up_after_max_retries():
+    clock = FakeClock()
+    url_queue = tugasakhir.RetryQueue(["https://a.com/1", "https://a.com/2", "https://a.com/3"], FixedDelay(1.0), clock=clock)
+    url_queue.poll()
+    url_queue.finish("https://a.com/1", 0, throttled())
+    clock.now += 1.0
+    assert url_queue.poll() == (("https://a.com/1", 1), 0) # Retry jatuh tempo didahulukan dari URL baru
+    url_queue.finish("https://a.com/1", 1, throttled())
+    clock.now += 1.0
+    assert url_queue.poll() == (("https://a.com/1", 2), 0)
+    assert url_queue.finish("https://a.com/1", 2, throttled()) is False # Jatah retry habis
+    assert url_queue.retry_count == 2
+    assert [url_queue.poll()[0] for _ in range(2)] == [("https://a.com/2", 0), ("https://a.com/3", 0)]
+
+
+def test_retry_queue_get_returns_none_when_done():
+    url_queue = tugasakhir.RetryQueue(iter(["https://a.com/1"]))
+    assert url_queue.get() == ("https://a.com/1", 0)
+    waiter_result = []
+    waiter = threading.Thread(target=lambda: waiter_result.append(url_queue.get()))
+    waiter.start()
+    waiter.join(0.1)
+    assert waiter.is_alive() # Masih menunggu URL yang sedang diproses
+    url_queue.finish("https://a.com/1", 0)
+    waiter.join(5)
+    assert waiter_result == [None]
+    assert url_queue.get() is None
+
+
+def test_retry_queue_get_async_returns_retry_then_none():
+    pytest.importorskip('aiohttp')
+    tugasakhir._load_aiohttp()
+    url_queue = tugasakhir.RetryQueue((url for url in ["https://a.com/1"]), FixedDelay(0.01, max_retries=1))
+
+    async def drain():
+        items = []
+        while True:
+            item = await url_queue.get_async()
+            if item is None:
+                return items
+            items.append(item)
+            url_queue.finish(item[0], item[1], throttled())
+
+    assert tugasakhir.asyncio.run(drain()) == [("https://a.com/1", 0), ("https://a.com/1", 1)]
+    assert url_queue.retry_count == 1
@@ -0,0 +1,119 @@
+import json
+import pstats
+import re
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+import tugasakhir
+
+EXPOSITION_LINE = re.compile(r'^(# (HELP|TYPE) \S+ .+|[a-z_]+\{[a-z]+="[^"]*"(,le="[^"]+")?\} [0-9.e+-]+)$')
+
+
+def traced(tmp_path, **options):
+    tracer = tugasakhir.StageTracer(jsonl_path=str(tmp_path / "trace.jsonl"), **options)
+    tracer.add_stage("https://a.com/1", 'ttfb', 0.02)
+    tracer.add_stage("https://a.com/1", 'download', 0.003, 1000)
+    tracer.add_stage("https://a.com/1", 'download', 0.001, 500) # Tahap yang sama dijumlahkan
+    tracer.add_stages("https://a.com/2", {'ttfb': [0.2, 0], 'parse': [0.05, 0]})
+    tracer.finish("https://a.com/1")
+    tracer.finish("https://a.com/2", "HTTP Error: 404 - Not Found")
+    return tracer
+
+
+def test_finish_writes_one_jsonl_record_per_url(tmp_path):
+    traced(tmp_path).close()
+    with open(tmp_path / "trace.jsonl", encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert [(record['url'], record['outcome'], record['error']) for record in records] == [
+        ("https://a.com/1", 'success', None),
+        ("https://a.com/2", 'failure', "HTTP Error: 404 - Not Found"),
+    ]
+    assert records[0]['stages'] == {'ttfb': 0.02, 'download': 0.004}
+    assert records[0]['bytes'] == {'download': 1500}
+    assert records[1]['stages'] == {'ttfb': 0.2, 'parse': 0.05}
+    assert records[1]['bytes'] == {}
+    assert all('timestamp' in record for record in records)
+
+
+def test_prometheus_exposition(tmp_path):
+    tracer = traced(tmp_path)
+    try:
+        text = tracer.prometheus_text()
+    finally:
+        tracer.close()
+    lines = text.splitlines()
+    assert text.endswith("\n")
+    assert all(EXPOSITION_LINE.match(line) for line in lines), [line for line in lines if not EXPOSITION_LINE.match(line)]
+    assert "# TYPE scraper_stage_duration_seconds histogram" in lines
+    # Bucket kumulatif: ttfb 0.02 dan 0.2 detik
+    assert 'scraper_stage_duration_seconds_bucket{stage="ttfb",le="0.01"} 0' in lines
+    assert 'scraper_stage_duration_seconds_bucket{stage="ttfb",le="0.025"} 1' in lines
+    assert 'scraper_stage_duration_seconds_bucket{stage="ttfb",le="0.25"} 2' in lines
+    assert 'scraper_stage_duration_seconds_bucket{stage="ttfb",le="+Inf"} 2' in lines
+    assert 'scraper_stage_duration_seconds_sum{stage="ttfb"} 0.220000' in lines
+    assert 'scraper_stage_duration_seconds_count{stage="ttfb"} 2' in lines
+    assert 'scraper_stage_bytes_total{stage="download"} 1500' in lines
+    assert 'scraper_urls_total{outcome="success"} 1' in lines
+    assert 'scraper_urls_total{outcome="failure"} 1' in lines
+    bucket_lines = [line for line in lines if line.startswith('scraper_stage_duration_seconds_bucket{stage="parse"')]
+    assert len(bucket_lines) == len(tugasakhir.TRACE_BUCKETS_SECONDS) + 1
+
+
+def test_stage_summary_follows_trace_stage_order(tmp_path):
+    tracer = traced(tmp_path)
+    try:
+        summary = tracer.stage_summary()
+    finally:
+        tracer.close()
+    assert list(summary) == ['ttfb', 'download', 'parse']
+    assert summary['ttfb']['count'] == 2
+    assert summary['ttfb']['total_seconds'] == pytest.approx(0.22)
+    assert summary['download']['bytes'] == 1500
+
+
+def test_metrics_file_and_http_endpoint(tmp_path):
+    metrics_path = str(tmp_path / "metrics.prom")
+    tracer = traced(tmp_path, metrics_path=metrics_path)
+    port = tracer.serve_metrics(0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            assert response.read().decode('utf-8') == tracer.prometheus_text()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/lain", timeout=5)
+    finally:
+        tracer.close()
+    with open(metrics_path, encoding='utf-8') as f:
+        assert f.read() == tracer.prometheus_text()
+
+
+def test_should_profile_every_nth_call():
+    tracer = tugasakhir.StageTracer(profile_every=3)
+    assert [tracer.should_profile() for _ in range(7)] == [True, False, False, True, False, False, True]
+    assert not any(tugasakhir.StageTracer().should_profile() for _ in range(3))
+
+
+def test_only_one_cprofile_is_active_at_a_time(tmp_path):
+    profile_path = str(tmp_path / "extract.pstats")
+    tracer = tugasakhir.StageTracer(profile_every=1, profile_path=profile_path)
+    inside = threading.Event()
+    release = threading.Event()
+
+    def slow_extract():
+        inside.set()
+        release.wait(5)
+        return 'lambat'
+
+    profiled = threading.Thread(target=tracer.profile_call, args=(slow_extract,))
+    profiled.start()
+    assert inside.wait(5)
+    # Profil pertama masih aktif: panggilan lain (thread lain maupun bersarang) berjalan tanpa cProfile
+    assert tracer.profile_call(lambda value: value * 2, 21) == 42
+    release.set()
+    profiled.join(5)
+    assert tracer.profile_call(lambda: tracer.profile_call(sum, [1, 2])) == 3
+    assert tracer.profiled_pages == 2
+    tracer.close()
+    assert pstats.Stats(profile_path).total_calls > 0
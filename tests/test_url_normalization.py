@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+import tugasakhir
+
+
+def test_canonicalize_url_merges_variants_of_one_article():
+    canonical = "https://finance.detik.com/berita/d-123/judul?page=2"
+    variants = [
+        "https://finance.detik.com/berita/d-123/judul?page=2",
+        "HTTPS://Finance.Detik.com:443/berita/d-123/judul?utm_source=fb&page=2#komentar",
+        "https://m.finance.detik.com/berita/d-123/judul/amp?page=2&fbclid=abc",
+    ]
+    assert {tugasakhir.canonicalize_url(url) for url in variants} == {canonical}
+
+
+def test_canonicalize_url_mobile_prefix_on_bare_domain():
+    assert tugasakhir.canonicalize_url("https://m.detik.com/x") == "https://www.detik.com/x"
+
+
+def test_canonicalize_url_keeps_non_default_port_and_sorts_query():
+    assert tugasakhir.canonicalize_url("http://a.com:8080/p?b=2&a=1") == "http://a.com:8080/p?a=1&b=2"
+
+
+def test_canonicalize_url_accepts_ipv6_host():
+    assert tugasakhir.canonicalize_url("http://[::1]:8080/x") == "http://[::1]:8080/x"
+    assert tugasakhir.canonicalize_url("http://[::1]:80/x") == "http://[::1]/x"
+
+
+@pytest.mark.parametrize("url", ["http://a.com:abc/x", "http://a.com:99999/x", "http://[::1/x"])
+def test_canonicalize_url_rejects_unparseable_url(url):
+    with pytest.raises(ValueError):
+        tugasakhir.canonicalize_url(url)
+    with pytest.raises(ValueError):
+        tugasakhir.validate_url(url)
+
+
+def test_url_host_of_unparseable_url_is_empty():
+    assert tugasakhir.url_host("http://[::1/x") == ''
+    assert tugasakhir.url_host("http://a.com/x") == 'a.com'
+
+
+@pytest.mark.parametrize("canonicalize", [True, False])
+def test_run_scraping_job_reports_invalid_urls_as_failures(tmp_path, canonicalize):
+    csv_path = str(tmp_path / "hasil.csv")
+    bad_urls = ["http://a.com:abc/x", "http://[::1/x"]
+    completed = []
+    summary = tugasakhir.run_scraping_job(bad_urls, csv_path, log=lambda message: None, canonicalize=canonicalize,
+                                          on_complete=lambda url, reason: completed.append((url, reason)))
+
+    assert summary['invalid_urls'] == bad_urls
+    assert summary['urls_to_fetch'] == []
+    assert [info['url'] for info in summary['failed_urls_info']] == bad_urls
+    assert all(info['reason'].startswith("URL tidak valid") for info in summary['failed_urls_info'])
+    assert [url for url, _ in completed] == bad_urls
+    assert summary['analytics'].failure_categories == {'URL tidak valid': 2}
+    with open(csv_path + '.checkpoint.jsonl', encoding='utf-8') as f:
+        assert [json.loads(line)['status'] for line in f] == ['failed', 'failed']
+
+
+def test_dedup_index_flags_exact_duplicate_html(tmp_path):
+    index = tugasakhir.ContentDedupIndex(str(tmp_path / "dedup.sqlite"))
+    try:
+        assert index.page_filter("http://a.com/1", b"<html>sama</html>") is None
+        assert index.page_filter("http://a.com/1", b"<html>sama</html>") is None # URL yang sama bukan duplikat
+        assert "http://a.com/1" in index.page_filter("http://a.com/2", b"<html>sama</html>")
+    finally:
+        index.close()
@@ -1,118 +1,771 @@
-import pandas as pd
-import matplotlib.pyplot as plt # Tetap diimpor karena seaborn mungkin membutuhkannya secara internal
-import seaborn as sns # Tetap diimpor karena pandas atau modul lain mungkin menggunakannya
-from datetime import datetime
-import numpy as np
 import time
+_MODULE_LOAD_START = time.perf_counter() # Titik awal pengukuran waktu startup mode headless
+from datetime import datetime, timezone
 import threading
+import argparse
+import importlib
+import sys
 import requests
-from bs4 import BeautifulSoup
+import requests.adapters
+import urllib3.connection
+import urllib3.connectionpool
+import bisect
 import csv
+import hashlib
+import heapq
+import html
+import itertools
+import json
+import math
+import mmap
+import random
+import socket
+import sqlite3
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed # as_completed sudah digabung
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+import queue
 import re
-from urllib.parse import urljoin, urlparse # urljoin dan urlparse tetap dibutuhkan jika ingin fitur lebih lanjut
-import tkinter as tk
-from tkinter import scrolledtext, messagebox, filedialog
+import email.utils
+from collections import defaultdict
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+
+# Dependensi berat atau opsional tidak diimpor saat modul dimuat, melainkan di jalur kode yang
+# membutuhkannya: pandas (analisis), tkinter (GUI), BeautifulSoup/lxml (backend ekstraksi), asyncio dan
+# aiohttp (engine asyncio). Dengan begitu mode headless tidak membayar waktu impor library yang tidak dipakai.
+tk = scrolledtext = messagebox = None
+asyncio = aiohttp = None
+etree = lxml_html = None
+
+# Target waktu startup mode headless (impor modul + parsing argumen), diukur dengan --startup-time
+HEADLESS_STARTUP_TARGET_SECONDS = 0.25
+
+def _import_optional(module_name, feature, package_name=None, install_hint=None):
+    """Mengimpor modul saat dibutuhkan; pesan error menyebutkan fitur dan paket yang harus dipasang."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        package_name = package_name or module_name
+        install_hint = install_hint or f"pip install {package_name}"
+        raise RuntimeError(f"{feature} membutuhkan paket {package_name} ({install_hint}).")
+
+def _load_tkinter():
+    global tk, scrolledtext, messagebox
+    if tk is None:
+        tk = _import_optional('tkinter', "Mode GUI", 'tkinter',
+                              "tidak tersedia lewat pip; pasang Python dengan dukungan Tk, mis. apt install python3-tk")
+        scrolledtext = importlib.import_module('tkinter.scrolledtext')
+        messagebox = importlib.import_module('tkinter.messagebox')
+
+def _load_aiohttp():
+    global asyncio, aiohttp
+    if aiohttp is None:
+        asyncio = importlib.import_module('asyncio')
+        aiohttp = _import_optional('aiohttp', "Engine 'asyncio'")
+
+def _load_lxml():
+    global etree, lxml_html
+    if etree is None:
+        lxml_html = _import_optional('lxml.html', "Backend ekstraksi 'lxml'", 'lxml')
+        etree = importlib.import_module('lxml.etree')
 
 # Non-GUI classes
+ANALYZER_COLUMNS = ['url', 'word_count', 'thread_id', 'timestamp'] # Kolom teks panjang tidak pernah dibaca
+ANALYZER_CHUNK_SIZE = 200_000
+
+def columnar_sidecar_path(csv_file):
+    """Lokasi file Parquet pendamping untuk sebuah CSV hasil (hasil_scraping.csv -> hasil_scraping.parquet)."""
+    return os.path.splitext(csv_file)[0] + '.parquet'
+
+def export_results_to_parquet(csv_file, parquet_file=None, chunksize=ANALYZER_CHUNK_SIZE):
+    """
+    Mengonversi CSV hasil ke Parquet terkompresi (zstd) secara streaming per chunk, sehingga file
+    berukuran gigabyte tidak perlu dimuat utuh. thread_id disimpan dengan dictionary encoding dan
+    timestamp sebagai tipe waktu, supaya analisis berikutnya cukup membaca kolom yang dibutuhkan.
+    Mengembalikan path file Parquet.
+    """
+    import pandas as pd
+    pa = _import_optional('pyarrow', "Output Parquet")
+    pq = importlib.import_module('pyarrow.parquet')
+
+    parquet_file = parquet_file or columnar_sidecar_path(csv_file)
+    schema = pa.schema([
+        ('url', pa.string()), ('title', pa.string()), ('word_count', pa.int64()),
+        ('author', pa.string()), ('publish_date', pa.string()), ('meta_description', pa.string()),
+        ('content_preview', pa.string()), ('thread_id', pa.dictionary(pa.int32(), pa.string())),
+        ('timestamp', pa.timestamp('s')),
+    ])
+    tmp_file = parquet_file + '.tmp'
+    with pq.ParquetWriter(tmp_file, schema, compression='zstd') as writer:
+        for chunk in pd.read_csv(csv_file, chunksize=chunksize, dtype=str, keep_default_na=False):
+            chunk = chunk.reindex(columns=CSV_FIELDNAMES, fill_value='')
+            chunk['word_count'] = pd.to_numeric(chunk['word_count'], errors='coerce').fillna(0).astype('int64')
+            chunk['thread_id'] = chunk['thread_id'].astype('category')
+            chunk['timestamp'] = pd.to_datetime(chunk['timestamp'], errors='coerce').astype('datetime64[s]')
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    os.replace(tmp_file, parquet_file)
+    return parquet_file
+
 class ArticleScrapingResultAnalyzer:
-    def __init__(self, csv_file):
+    """
+    Menghitung statistik laporan secara streaming: file dibaca per chunk dan hanya kolom
+    ANALYZER_COLUMNS yang dimuat, sehingga riwayat hasil berukuran gigabyte tidak perlu muat di RAM.
+    Jika ada file Parquet pendamping yang lebih baru dari CSV, file itu yang dibaca.
+    """
+    def __init__(self, csv_file, chunksize=ANALYZER_CHUNK_SIZE, prefer_columnar=True):
+        import pandas as pd # Diimpor di sini agar mode scraping tidak perlu memuat pandas
+        self.source_file = csv_file
+        self.chunksize = chunksize
+        self.stats = None
         try:
-            self.df = pd.read_csv(csv_file)
-            if 'word_count' in self.df.columns:
-                self.df['word_count'] = pd.to_numeric(self.df['word_count'], errors='coerce').fillna(0)
-            if 'timestamp' in self.df.columns:
-                self.df['timestamp'] = pd.to_datetime(self.df['timestamp'], errors='coerce')
+            self.source_file = self._choose_source(csv_file, prefer_columnar)
+            self.stats = self._aggregate(self._iter_chunks())
         except FileNotFoundError:
-            self.df = pd.DataFrame() # Inisialisasi DataFrame kosong jika file tidak ditemukan
             print(f"File CSV '{csv_file}' tidak ditemukan. Analisis tidak dapat dilakukan.")
         except pd.errors.EmptyDataError:
-            self.df = pd.DataFrame()
             print(f"File CSV '{csv_file}' kosong. Analisis tidak dapat dilakukan.")
         except Exception as e:
-            self.df = pd.DataFrame()
             print(f"Terjadi kesalahan saat membaca file CSV: {e}")
 
+    @staticmethod
+    def _choose_source(csv_file, prefer_columnar):
+        if csv_file.endswith('.parquet') or not prefer_columnar:
+            return csv_file
+        parquet_file = columnar_sidecar_path(csv_file)
+        if (os.path.exists(parquet_file) and os.path.exists(csv_file)
+                and os.path.getmtime(parquet_file) >= os.path.getmtime(csv_file)):
+            return parquet_file
+        return csv_file
+
+    def _iter_chunks(self):
+        """Menghasilkan DataFrame kecil berisi kolom yang dibutuhkan saja, dari CSV atau Parquet."""
+        import pandas as pd
+        if self.source_file.endswith('.parquet'):
+            pq = _import_optional('pyarrow.parquet', "Membaca file Parquet", 'pyarrow')
+            parquet = pq.ParquetFile(self.source_file)
+            columns = [c for c in ANALYZER_COLUMNS if c in parquet.schema_arrow.names]
+            for batch in parquet.iter_batches(batch_size=self.chunksize, columns=columns):
+                yield batch.to_pandas()
+            return
+        reader = pd.read_csv(self.source_file, usecols=lambda column: column in ANALYZER_COLUMNS,
+                             dtype={'thread_id': 'category'}, chunksize=self.chunksize)
+        for chunk in reader:
+            yield chunk
+
+    @staticmethod
+    def _aggregate(chunks):
+        """Satu kali lintasan atas semua chunk; hanya agregat kecil yang disimpan."""
+        import pandas as pd
+        stats = {
+            'columns': set(), 'rows': 0, 'total_words': 0,
+            'thread_counts': defaultdict(int), 'thread_words': defaultdict(float),
+            'timestamp_rows': 0, 'first_timestamp': None, 'last_timestamp': None,
+        }
+        for chunk in chunks:
+            stats['columns'].update(chunk.columns)
+            stats['rows'] += len(chunk)
+            if 'word_count' in chunk.columns:
+                chunk['word_count'] = pd.to_numeric(chunk['word_count'], errors='coerce').fillna(0)
+                stats['total_words'] += chunk['word_count'].sum()
+            if 'thread_id' in chunk.columns and 'word_count' in chunk.columns:
+                grouped = chunk.groupby('thread_id', observed=True)['word_count'].agg(['size', 'sum'])
+                for thread_id, row in grouped.iterrows():
+                    stats['thread_counts'][str(thread_id)] += int(row['size'])
+                    stats['thread_words'][str(thread_id)] += row['sum']
+            if 'timestamp' in chunk.columns:
+                timestamps = pd.to_datetime(chunk['timestamp'], errors='coerce').dropna()
+                if not timestamps.empty:
+                    stats['timestamp_rows'] += len(timestamps)
+                    chunk_min, chunk_max = timestamps.min(), timestamps.max()
+                    if stats['first_timestamp'] is None or chunk_min < stats['first_timestamp']:
+                        stats['first_timestamp'] = chunk_min
+                    if stats['last_timestamp'] is None or chunk_max > stats['last_timestamp']:
+                        stats['last_timestamp'] = chunk_max
+        if stats['rows'] == 0:
+            return None
+        return stats
+
     def generate_comprehensive_report(self):
-        if self.df.empty:
-            return "Tidak ada data untuk dianalisis. Pastikan scraping berhasil dan file CSV tidak kosong."
+        return format_comprehensive_report(self.stats)
 
-        report = []
-        report.append("=" * 60)
-        report.append("LAPORAN ANALISIS SCRAPING ARTIKEL KOMPREHENSIF")
-        report.append("=" * 60)
-        
-        report.append(f"Total artikel yang berhasil diproses: {len(self.df)}")
-        
-        if 'word_count' in self.df.columns and self.df['word_count'].sum() > 0:
-            report.append(f"\nAnalisis Konten Artikel:")
-            report.append(f"   Rata-rata jumlah kata: {self.df['word_count'].mean():.2f} kata")
-            report.append(f"   Total kata yang di-scrape: {int(self.df['word_count'].sum()):,} kata")
-        else:
-            report.append("\nKolom 'word_count' tidak ditemukan atau tidak ada data kata.")
-        
-        if 'thread_id' in self.df.columns and not self.df['thread_id'].empty:
-            report.append(f"\nPerforma Thread:")
-            thread_summary = self.df.groupby('thread_id').agg(
-                count=('url', 'size'),
-                avg_words=('word_count', 'mean')
-            ).reset_index()
-            for index, row in thread_summary.iterrows():
-                report.append(f"   {row['thread_id']}: {row['count']} artikel, rata-rata {row['avg_words']:.0f} kata")
-        else:
-            report.append("\nKolom 'thread_id' tidak ditemukan atau tidak ada data thread.")
-
-        if 'timestamp' in self.df.columns and not self.df['timestamp'].empty:
-            valid_timestamps_df = self.df.dropna(subset=['timestamp'])
-            if not valid_timestamps_df.empty:
-                report.append(f"\nAnalisis Waktu:")
-                report.append(f"   Artikel pertama: {valid_timestamps_df['timestamp'].min().strftime('%Y-%m-%d %H:%M:%S')}")
-                report.append(f"   Artikel terakhir: {valid_timestamps_df['timestamp'].max().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                if len(valid_timestamps_df) > 1:
-                    total_duration_seconds = (valid_timestamps_df['timestamp'].max() - valid_timestamps_df['timestamp'].min()).total_seconds()
-                    if total_duration_seconds > 0:
-                        articles_per_second = len(valid_timestamps_df) / total_duration_seconds
-                        report.append(f"   Rata-rata kecepatan scraping: {articles_per_second:.2f} artikel per detik")
-                    else:
-                        report.append("   Durasi scraping terlalu singkat untuk menghitung kecepatan per detik.")
+def format_comprehensive_report(stats):
+    """Teks laporan komprehensif dari dict statistik (ArticleScrapingResultAnalyzer atau LiveScrapingAnalytics)."""
+    if not stats:
+        return "Tidak ada data untuk dianalisis. Pastikan scraping berhasil dan file CSV tidak kosong."
+
+    report = []
+    report.append("=" * 60)
+    report.append("LAPORAN ANALISIS SCRAPING ARTIKEL KOMPREHENSIF")
+    report.append("=" * 60)
+
+    report.append(f"Total artikel yang berhasil diproses: {stats['rows']}")
+
+    if 'word_count' in stats['columns'] and stats['total_words'] > 0:
+        report.append(f"\nAnalisis Konten Artikel:")
+        report.append(f"   Rata-rata jumlah kata: {stats['total_words'] / stats['rows']:.2f} kata")
+        report.append(f"   Total kata yang di-scrape: {int(stats['total_words']):,} kata")
+    else:
+        report.append("\nKolom 'word_count' tidak ditemukan atau tidak ada data kata.")
+
+    if 'thread_id' in stats['columns'] and stats['thread_counts']:
+        report.append(f"\nPerforma Thread:")
+        for thread_id in sorted(stats['thread_counts']):
+            count = stats['thread_counts'][thread_id]
+            avg_words = stats['thread_words'][thread_id] / count
+            report.append(f"   {thread_id}: {count} artikel, rata-rata {avg_words:.0f} kata")
+    else:
+        report.append("\nKolom 'thread_id' tidak ditemukan atau tidak ada data thread.")
+
+    if 'timestamp' in stats['columns']:
+        if stats['timestamp_rows'] > 0:
+            report.append(f"\nAnalisis Waktu:")
+            report.append(f"   Artikel pertama: {stats['first_timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
+            report.append(f"   Artikel terakhir: {stats['last_timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
+
+            if stats['timestamp_rows'] > 1:
+                total_duration_seconds = (stats['last_timestamp'] - stats['first_timestamp']).total_seconds()
+                if total_duration_seconds > 0:
+                    articles_per_second = stats['timestamp_rows'] / total_duration_seconds
+                    report.append(f"   Rata-rata kecepatan scraping: {articles_per_second:.2f} artikel per detik")
                 else:
-                    report.append("   Hanya ada satu artikel dengan timestamp valid, tidak bisa menghitung rata-rata waktu per artikel.")
+                    report.append("   Durasi scraping terlalu singkat untuk menghitung kecepatan per detik.")
             else:
-                report.append("\nKolom 'timestamp' tidak ditemukan atau tidak ada timestamp yang valid.")
+                report.append("   Hanya ada satu artikel dengan timestamp valid, tidak bisa menghitung rata-rata waktu per artikel.")
         else:
-            report.append("\nKolom 'timestamp' tidak ditemukan atau tidak ada data timestamp.")
-        
+            report.append("\nKolom 'timestamp' tidak ditemukan atau tidak ada timestamp yang valid.")
+    else:
+        report.append("\nKolom 'timestamp' tidak ditemukan atau tidak ada data timestamp.")
+
+    return "\n".join(report)
+
+class LogHistogram:
+    """
+    Histogram berbucket logaritmik untuk kuantil dengan galat relatif terbatas (bawaan 1%):
+    nilai v masuk bucket ceil(log_gamma(v)). Pembaruan O(1), memori sebanding dengan rentang nilai
+    (bukan jumlah data), dan dua histogram dapat digabung cukup dengan menjumlahkan bucketnya.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets = defaultdict(int)
+        self.zero_count = 0
+        self.count = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value, count=1):
+        if value <= 0:
+            self.zero_count += count
+        else:
+            self.buckets[math.ceil(math.log(value) / self._log_gamma)] += count
+        self.count += count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """Perkiraan kuantil q (0..1) dengan metode nearest-rank; None jika histogram kosong."""
+        if not self.count:
+            return None
+        # Nilai ke-rank (mulai dari 1) dalam urutan naik; round() meredam galat float, mis. 0.07 * 100 = 7.000000000000001
+        rank = max(1, math.ceil(round(q * self.count, 9)))
+        cumulative = self.zero_count
+        if rank <= cumulative:
+            return 0
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            if rank <= cumulative:
+                # Titik tengah bucket (dalam arti galat relatif), dibatasi min/max yang sebenarnya
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] += count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self):
+        return {'relative_accuracy': self.relative_accuracy, 'zero_count': self.zero_count, 'count': self.count,
+                'min': self.min, 'max': self.max, 'buckets': {str(index): count for index, count in self.buckets.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data['relative_accuracy'])
+        histogram.buckets.update({int(index): count for index, count in data['buckets'].items()})
+        histogram.zero_count, histogram.count = data['zero_count'], data['count']
+        histogram.min, histogram.max = data['min'], data['max']
+        return histogram
+
+def categorize_failure(error_reason):
+    """Mengelompokkan alasan gagal (teks dari engine/run_scraping_job) ke kategori untuk laporan."""
+    reason = error_reason or ''
+    if reason.startswith('HTTP Error:'):
+        status = reason[len('HTTP Error:'):].strip().split(' ', 1)[0]
+        if status == '429':
+            return 'HTTP 429 (dibatasi)'
+        return 'HTTP 5xx' if status.startswith('5') else 'HTTP 4xx'
+    for prefix, category in (('Timeout Error', 'Timeout'), ('Connection Error', 'Koneksi'),
+                             ('Konten artikel terlalu pendek', 'Konten terlalu pendek'),
+                             ('Duplikat', 'Duplikat'), ('Record arsip rusak', 'Arsip rusak'),
+                             ('Konten bukan HTML', 'Bukan HTML'), ('URL tidak valid', 'URL tidak valid')):
+        if reason.startswith(prefix):
+            return category
+    return 'Lainnya'
+
+LIVE_RATE_WINDOW_SECONDS = 60
+
+class LiveScrapingAnalytics:
+    """
+    Statistik scraping yang diperbarui secara inkremental setiap kali satu URL selesai (O(1) per
+    hasil): jumlah berhasil/gagal, total dan kuantil jumlah kata (LogHistogram), throughput per
+    thread dan per host, kategori kegagalan, serta deret artikel/detik dalam jendela geser.
+    Laporan komprehensif tersedia kapan saja selama crawl tanpa membaca ulang CSV. Agregat dapat
+    disimpan ke JSON di samping CSV dan digabung dengan run berikutnya (resume) tanpa memindai riwayat.
+    """
+
+    def __init__(self, rate_window_seconds=LIVE_RATE_WINDOW_SECONDS):
+        self.rate_window_seconds = rate_window_seconds
+        self.successes = 0
+        self.failures = 0
+        self.total_words = 0
+        self.word_counts = LogHistogram()
+        self.failure_categories = defaultdict(int)
+        # Per thread/host: jumlah, kata, gagal, dan detik aktif dari run sebelumnya (lihat merge)
+        self.threads = defaultdict(lambda: {'articles': 0, 'words': 0, 'failures': 0, 'previous_seconds': 0.0, 'first': None, 'last': None})
+        self.hosts = defaultdict(lambda: {'articles': 0, 'words': 0, 'failures': 0, 'previous_seconds': 0.0, 'first': None, 'last': None})
+        self.first_success = None # datetime, seperti kolom timestamp di CSV
+        self.last_success = None
+        self.previous_runs = 0
+        self._rate_buckets = [] # [detik, jumlah] untuk jendela geser, terurut naik
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _touch(entry, now):
+        if entry['first'] is None:
+            entry['first'] = now
+        entry['last'] = now
+
+    def record(self, url, result=None, error_reason=None, now=None):
+        """Mencatat satu URL selesai: dict hasil (berhasil) atau alasan gagal."""
+        now = time.time() if now is None else now
+        host = url_host(url)
+        with self._lock:
+            host_entry = self.hosts[host]
+            self._touch(host_entry, now)
+            if not result:
+                self.failures += 1
+                self.failure_categories[categorize_failure(error_reason)] += 1
+                host_entry['failures'] += 1
+                return
+            word_count = result['word_count']
+            self.successes += 1
+            self.total_words += word_count
+            self.word_counts.add(word_count)
+            host_entry['articles'] += 1
+            host_entry['words'] += word_count
+            thread_entry = self.threads[result.get('thread_id', 'Unknown')]
+            self._touch(thread_entry, now)
+            thread_entry['articles'] += 1
+            thread_entry['words'] += word_count
+
+            timestamp = datetime.fromtimestamp(now)
+            if self.first_success is None:
+                self.first_success = timestamp
+            self.last_success = timestamp
+
+            second = int(now)
+            if self._rate_buckets and self._rate_buckets[-1][0] == second:
+                self._rate_buckets[-1][1] += 1
+            else:
+                self._rate_buckets.append([second, 1])
+                while self._rate_buckets[0][0] <= second - self.rate_window_seconds:
+                    self._rate_buckets.pop(0) # Paling banyak satu elemen per detik, jadi murah
+
+    def rate_series(self, now=None):
+        """Deret artikel berhasil per detik untuk rate_window_seconds terakhir (terlama lebih dulu)."""
+        now_second = int(time.time() if now is None else now)
+        with self._lock:
+            counts = {second: count for second, count in self._rate_buckets}
+        return [counts.get(second, 0) for second in range(now_second - self.rate_window_seconds + 1, now_second + 1)]
+
+    def window_rate(self, now=None):
+        """Artikel per detik dalam jendela geser terakhir."""
+        series = self.rate_series(now)
+        return sum(series) / len(series) if series else 0.0
+
+    @staticmethod
+    def _throughput(entry):
+        seconds = entry['previous_seconds'] + ((entry['last'] - entry['first']) if entry['first'] is not None else 0.0)
+        return entry['articles'] / seconds if seconds > 0 else None
+
+    def report_stats(self):
+        """Statistik dalam bentuk yang sama dengan ArticleScrapingResultAnalyzer.stats (untuk format_comprehensive_report)."""
+        with self._lock:
+            if not self.successes:
+                return None
+            return {
+                'columns': set(ANALYZER_COLUMNS), 'rows': self.successes, 'total_words': self.total_words,
+                'thread_counts': {thread_id: entry['articles'] for thread_id, entry in self.threads.items() if entry['articles']},
+                'thread_words': {thread_id: entry['words'] for thread_id, entry in self.threads.items() if entry['articles']},
+                'timestamp_rows': self.successes, 'first_timestamp': self.first_success, 'last_timestamp': self.last_success,
+            }
+
+    def generate_comprehensive_report(self):
+        """Laporan yang sama dengan ArticleScrapingResultAnalyzer, ditambah bagian yang hanya tersedia secara live."""
+        report = [format_comprehensive_report(self.report_stats())]
+        with self._lock:
+            if self.word_counts.count:
+                report.append("\nDistribusi Jumlah Kata:")
+                report.append(f"   min {self.word_counts.min}, p50 {self.word_counts.quantile(0.5):.0f}, p90 {self.word_counts.quantile(0.9):.0f}, "
+                              f"p99 {self.word_counts.quantile(0.99):.0f}, maks {self.word_counts.max}")
+            if self.hosts:
+                report.append("\nPerforma per Host:")
+                for host in sorted(self.hosts):
+                    entry = self.hosts[host]
+                    throughput = self._throughput(entry)
+                    rate = f", {throughput:.2f} artikel/detik" if throughput else ""
+                    report.append(f"   {host}: {entry['articles']} berhasil, {entry['failures']} gagal{rate}")
+            if self.failures:
+                report.append(f"\nKategori Kegagalan ({self.failures} URL):")
+                for category, count in sorted(self.failure_categories.items(), key=lambda item: -item[1]):
+                    report.append(f"   {category}: {count}")
+        if self._rate_buckets: # Deret jendela geser hanya ada untuk run yang sedang/baru berjalan, tidak ikut disimpan
+            report.append(f"\nKecepatan {self.rate_window_seconds} detik terakhir: {self.window_rate():.2f} artikel per detik")
+        if self.previous_runs:
+            report.append(f"(Termasuk {self.previous_runs} run sebelumnya yang digabung)")
         return "\n".join(report)
 
+    def merge(self, other):
+        """Menggabungkan agregat lain (mis. run sebelumnya) ke dalam agregat ini."""
+        with self._lock:
+            self.successes += other.successes
+            self.failures += other.failures
+            self.total_words += other.total_words
+            self.word_counts.merge(other.word_counts)
+            for category, count in other.failure_categories.items():
+                self.failure_categories[category] += count
+            for mine, theirs in ((self.threads, other.threads), (self.hosts, other.hosts)):
+                for key, entry in theirs.items():
+                    merged = mine[key]
+                    for field in ('articles', 'words', 'failures'):
+                        merged[field] += entry[field]
+                    # Detik aktif run lain dijumlahkan, bukan direntangkan, agar jeda antar run tidak dihitung
+                    merged['previous_seconds'] += entry['previous_seconds'] + ((entry['last'] - entry['first']) if entry['first'] is not None else 0.0)
+            if other.first_success is not None:
+                self.first_success = min(self.first_success or other.first_success, other.first_success)
+                self.last_success = max(self.last_success or other.last_success, other.last_success)
+            self.previous_runs += other.previous_runs + 1
+
+    def to_dict(self):
+        def closed(entry):
+            active = (entry['last'] - entry['first']) if entry['first'] is not None else 0.0
+            return {'articles': entry['articles'], 'words': entry['words'], 'failures': entry['failures'],
+                    'previous_seconds': entry['previous_seconds'] + active}
+        with self._lock:
+            return {
+                'successes': self.successes, 'failures': self.failures, 'total_words': self.total_words,
+                'word_counts': self.word_counts.to_dict(), 'failure_categories': dict(self.failure_categories),
+                'threads': {key: closed(entry) for key, entry in self.threads.items()},
+                'hosts': {key: closed(entry) for key, entry in self.hosts.items()},
+                'first_success': self.first_success.isoformat() if self.first_success else None,
+                'last_success': self.last_success.isoformat() if self.last_success else None,
+                'previous_runs': self.previous_runs,
+            }
+
+    @classmethod
+    def from_dict(cls, data):
+        analytics = cls()
+        analytics.successes, analytics.failures, analytics.total_words = data['successes'], data['failures'], data['total_words']
+        analytics.word_counts = LogHistogram.from_dict(data['word_counts'])
+        analytics.failure_categories.update(data['failure_categories'])
+        for target, source in ((analytics.threads, data['threads']), (analytics.hosts, data['hosts'])):
+            for key, entry in source.items():
+                target[key].update(entry)
+        analytics.first_success = datetime.fromisoformat(data['first_success']) if data['first_success'] else None
+        analytics.last_success = datetime.fromisoformat(data['last_success']) if data['last_success'] else None
+        analytics.previous_runs = data['previous_runs']
+        return analytics
+
+    def save(self, path, csv_file=None):
+        """Menyimpan agregat ke JSON secara atomik; ukuran CSV dicatat agar pembaca tahu snapshot ini masih sesuai."""
+        data = self.to_dict()
+        data['csv_size'] = os.path.getsize(csv_file) if csv_file and os.path.exists(csv_file) else None
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, csv_file=None):
+        """Memuat agregat tersimpan; None jika tidak ada, rusak, atau CSV sudah berubah sejak disimpan."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if csv_file is not None and data.get('csv_size') != (os.path.getsize(csv_file) if os.path.exists(csv_file) else None):
+                return None
+            return cls.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+def live_analytics_path(csv_file):
+    """Lokasi snapshot LiveScrapingAnalytics untuk sebuah CSV hasil (hasil_scraping.csv.analytics.json)."""
+    return csv_file + '.analytics.json'
+
+# Tracing per tahap: durasi dan byte setiap URL per tahap fetch/parse/CSV
+DEFAULT_TRACE_PATH = os.path.join('.', 'scraping_trace.jsonl')
+DEFAULT_PROFILE_PATH = os.path.join('.', 'extract_profile.pstats')
+TRACE_STAGES = ('dns', 'connect', 'tls', 'ttfb', 'download', 'parse', 'select', 'csv')
+TRACE_BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRICS_FILE_INTERVAL_SECONDS = 10
+
+class StageTracer:
+    """
+    Mengumpulkan durasi (dan byte) per URL per tahap: dns, connect, tls, ttfb, download, parse,
+    select, csv. Tahap dicatat dari thread/proses mana pun lewat add_stages(); finish() menutup satu
+    URL, memasukkan durasinya ke histogram per tahap (LogHistogram untuk kuantil, bucket tetap untuk
+    Prometheus), dan menulis satu baris JSONL. Metrik dapat diekspor sebagai teks Prometheus ke file
+    atau lewat endpoint HTTP /metrics. Dengan profile_every=N, satu dari N ekstraksi dijalankan di
+    bawah cProfile dan statistiknya digabung ke file .pstats (hanya ekstraksi di proses ini, yaitu
+    engine thread/asyncio; worker process pipeline dan re-ekstraksi hanya melaporkan durasi).
+    Tanpa tracer (None, bawaan di semua engine) kode fetch/parse hanya membayar beberapa pemanggilan
+    perf_counter per halaman.
+    """
+
+    def __init__(self, jsonl_path=None, metrics_path=None, profile_every=0, profile_path=DEFAULT_PROFILE_PATH):
+        self.jsonl_path = jsonl_path
+        self.metrics_path = metrics_path
+        self.profile_every = profile_every
+        self.profile_path = profile_path
+        self.histograms = defaultdict(LogHistogram)
+        self.bucket_counts = defaultdict(lambda: [0] * (len(TRACE_BUCKETS_SECONDS) + 1)) # Bucket terakhir = +Inf
+        self.stage_seconds = defaultdict(float)
+        self.stage_bytes = defaultdict(int)
+        self.outcomes = defaultdict(int)
+        self.profiled_pages = 0
+        self._pending = {} # URL -> tahap yang sudah tercatat tetapi URL-nya belum selesai
+        self._lock = threading.Lock()
+        self._profile_lock = threading.Lock() # Hanya satu cProfile boleh aktif sekaligus
+        self._profile_counter = itertools.count()
+        self._profile_stats = None
+        self._metrics_written_at = 0.0
+        self._metrics_server = None
+        self._jsonl = open(jsonl_path, 'a', encoding='utf-8') if jsonl_path else None
+
+    def add_stages(self, url, stages):
+        """Menambahkan dict tahap -> [detik, byte] (dari end_stage_capture) ke URL yang belum selesai."""
+        if not stages:
+            return
+        with self._lock:
+            pending = self._pending.setdefault(url, {})
+            for stage, (seconds, nbytes) in stages.items():
+                entry = pending.setdefault(stage, [0.0, 0])
+                entry[0] += seconds
+                entry[1] += nbytes
+
+    def add_stage(self, url, stage, seconds, nbytes=0):
+        self.add_stages(url, {stage: (seconds, nbytes)})
+
+    def finish(self, url, error_reason=None):
+        """Menutup trace satu URL: agregasi ke histogram dan satu baris JSONL."""
+        outcome = 'failure' if error_reason else 'success'
+        with self._lock:
+            stages = self._pending.pop(url, {})
+            self.outcomes[outcome] += 1
+            for stage, (seconds, nbytes) in stages.items():
+                self.histograms[stage].add(seconds)
+                self.bucket_counts[stage][bisect.bisect_left(TRACE_BUCKETS_SECONDS, seconds)] += 1
+                self.stage_seconds[stage] += seconds
+                self.stage_bytes[stage] += nbytes
+            if self._jsonl is not None:
+                record = {'url': url, 'outcome': outcome, 'error': error_reason,
+                          'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+                          'stages': {stage: round(seconds, 6) for stage, (seconds, _) in stages.items()},
+                          'bytes': {stage: nbytes for stage, (_, nbytes) in stages.items() if nbytes}}
+                self._jsonl.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if self.metrics_path and time.monotonic() - self._metrics_written_at >= METRICS_FILE_INTERVAL_SECONDS:
+            self.write_metrics_file()
+
+    def should_profile(self):
+        return self.profile_every > 0 and next(self._profile_counter) % self.profile_every == 0
+
+    def profile_call(self, function, *args):
+        """Menjalankan function(*args) di bawah cProfile jika tidak ada profil lain yang sedang berjalan."""
+        if not self._profile_lock.acquire(blocking=False):
+            return function(*args)
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(function, *args)
+        finally:
+            if self._profile_stats is None:
+                self._profile_stats = pstats.Stats(profiler)
+            else:
+                self._profile_stats.add(profiler)
+            self.profiled_pages += 1
+            self._profile_lock.release()
+
+    def stage_summary(self):
+        """Ringkasan per tahap dalam urutan TRACE_STAGES: jumlah, total detik, p50/p99, byte."""
+        with self._lock:
+            return {stage: {'count': self.histograms[stage].count, 'total_seconds': self.stage_seconds[stage],
+                            'p50': self.histograms[stage].quantile(0.5), 'p99': self.histograms[stage].quantile(0.99),
+                            'bytes': self.stage_bytes[stage]}
+                    for stage in TRACE_STAGES if stage in self.histograms}
+
+    def prometheus_text(self):
+        """Metrik dalam format teks eksposisi Prometheus."""
+        lines = ["# HELP scraper_stage_duration_seconds Durasi per URL untuk setiap tahap scraping.",
+                 "# TYPE scraper_stage_duration_seconds histogram"]
+        with self._lock:
+            for stage in sorted(self.bucket_counts):
+                cumulative = 0
+                for bound, count in zip(TRACE_BUCKETS_SECONDS + ('+Inf',), self.bucket_counts[stage]):
+                    cumulative += count
+                    lines.append(f'scraper_stage_duration_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'scraper_stage_duration_seconds_sum{{stage="{stage}"}} {self.stage_seconds[stage]:.6f}')
+                lines.append(f'scraper_stage_duration_seconds_count{{stage="{stage}"}} {cumulative}')
+            lines.append("# HELP scraper_stage_bytes_total Byte yang diproses per tahap.")
+            lines.append("# TYPE scraper_stage_bytes_total counter")
+            for stage in sorted(self.stage_bytes):
+                lines.append(f'scraper_stage_bytes_total{{stage="{stage}"}} {self.stage_bytes[stage]}')
+            lines.append("# HELP scraper_urls_total URL yang selesai diproses per hasil.")
+            lines.append("# TYPE scraper_urls_total counter")
+            for outcome in sorted(self.outcomes):
+                lines.append(f'scraper_urls_total{{outcome="{outcome}"}} {self.outcomes[outcome]}')
+        return "\n".join(lines) + "\n"
+
+    def write_metrics_file(self):
+        """Menulis metrik Prometheus ke metrics_path secara atomik (cocok untuk textfile collector)."""
+        self._metrics_written_at = time.monotonic()
+        tmp_path = self.metrics_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, self.metrics_path)
+
+    def serve_metrics(self, port, host='127.0.0.1'):
+        """Menjalankan endpoint HTTP /metrics di thread daemon; mengembalikan port yang dipakai."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        tracer = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = tracer.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._metrics_server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._metrics_server.daemon_threads = True
+        threading.Thread(target=self._metrics_server.serve_forever, name='MetricsServer', daemon=True).start()
+        return self._metrics_server.server_address[1]
+
+    def close(self):
+        """Menutup file JSONL, menulis metrik dan profil terakhir, dan menghentikan endpoint /metrics."""
+        with self._lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+                self._jsonl = None
+        if self.metrics_path:
+            self.write_metrics_file()
+        if self._profile_stats is not None:
+            self._profile_stats.dump_stats(self.profile_path)
+        if self._metrics_server is not None:
+            self._metrics_server.shutdown()
+            self._metrics_server.server_close()
+            self._metrics_server = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def format_stage_summary(stage_summary):
+    """Baris-baris log dari StageTracer.stage_summary()."""
+    lines = []
+    for stage, stats in stage_summary.items():
+        size = f", {stats['bytes'] / 1024:,.0f} KiB" if stats['bytes'] else ""
+        lines.append(f"   {stage:<9} {stats['count']:>7} kali, total {stats['total_seconds']:.2f} s, "
+                     f"p50 {stats['p50'] * 1000:.1f} ms, p99 {stats['p99'] * 1000:.1f} ms{size}")
+    return lines or ["   Tidak ada tahap yang tercatat."]
+
 class RealTimeArticleScrapingMonitor:
-    def __init__(self, output_text_widget):
+    """
+    Worker thread hanya menaikkan penghitung dan mengirim event ringan ke antrean; teks log
+    dibentuk dan dirender oleh main loop Tk (lihat ArticleScraperGUI._poll_log_queue).
+    """
+    def __init__(self, event_queue):
         self.start_time = time.time()
         self.processed_articles = 0
         self.total_words = 0
         self.lock = threading.Lock()
-        self.output_text_widget = output_text_widget
+        self.event_queue = event_queue
     
     def update_stats(self, url, word_count, thread_id):
         with self.lock:
             self.processed_articles += 1
             self.total_words += word_count
-            elapsed_time = time.time() - self.start_time
-            
-            log_message = (
-                f"[{elapsed_time:.1f}s] {thread_id}: {url}\n"
-                f"   Content: {word_count:,} words\n"
-                f"   Progress: {self.processed_articles} articles, {self.total_words:,} words total\n"
-            )
-            if elapsed_time > 0:
-                log_message += (
-                    f"   Rate: {self.processed_articles/elapsed_time:.2f} articles/sec, "
-                    f"{self.total_words/elapsed_time:.0f} words/sec\n"
-                )
-            log_message += "-" * 80 + "\n"
-            self.output_text_widget.insert(tk.END, log_message)
-            self.output_text_widget.see(tk.END) # Scroll to the end
+            event = ('article', time.time() - self.start_time, thread_id, url, word_count,
+                     self.processed_articles, self.total_words)
+        self.event_queue.put(event)
+
+def format_article_event(event):
+    """Mengubah event 'article' dari RealTimeArticleScrapingMonitor menjadi teks log multi-baris."""
+    _, elapsed_time, thread_id, url, word_count, processed_articles, total_words = event
+    log_message = (
+        f"[{elapsed_time:.1f}s] {thread_id}: {url}\n"
+        f"   Content: {word_count:,} words\n"
+        f"   Progress: {processed_articles} articles, {total_words:,} words total\n"
+    )
+    if elapsed_time > 0:
+        log_message += (
+            f"   Rate: {processed_articles/elapsed_time:.2f} articles/sec, "
+            f"{total_words/elapsed_time:.0f} words/sec\n"
+        )
+    log_message += "-" * 80 + "\n"
+    return log_message
+
+class ConsoleProgressMonitor:
+    """Padanan RealTimeArticleScrapingMonitor untuk mode headless: ringkasan progres berkala ke stderr."""
+
+    def __init__(self, interval_seconds=5.0, stream=None):
+        self.start_time = time.time()
+        self.processed_articles = 0
+        self.total_words = 0
+        self.interval_seconds = interval_seconds
+        self.stream = stream or sys.stderr
+        self._last_report = self.start_time
+        self.lock = threading.Lock()
+
+    def update_stats(self, url, word_count, thread_id):
+        with self.lock:
+            self.processed_articles += 1
+            self.total_words += word_count
+            now = time.time()
+            if now - self._last_report < self.interval_seconds:
+                return
+            self._last_report = now
+            elapsed_time = now - self.start_time
+            print(f"[{elapsed_time:.1f}s] Progress: {self.processed_articles} articles, {self.total_words:,} words total, "
+                  f"{self.processed_articles/elapsed_time:.2f} articles/sec", file=self.stream)
 
 def extract_article_content(soup, url):
     """
@@ -179,259 +832,3428 @@ def extract_article_content(soup, url):
         'content_preview': article_content[:500] # Batasi panjang string untuk CSV
     }
 
-# GUI Class
-class ArticleScraperGUI:
-    def __init__(self, master):
-        self.master = master
-        master.title("Advanced Article Scraper & Analyzer")
+# Penangkap durasi per tahap untuk tracing. Kode fetch/parse selalu memanggil record_stage();
+# selama tidak ada penangkapan aktif di thread itu, pemanggilannya hanya satu getattr.
+_stage_capture = threading.local()
 
-        # Frame untuk input URL
-        input_frame = tk.LabelFrame(master, text="Masukkan URL Artikel (satu per baris):", padx=10, pady=10)
-        input_frame.pack(pady=10, padx=10, fill="both", expand=True)
+def begin_stage_capture():
+    """Mulai menampung durasi tahap yang dicatat di thread ini (lihat end_stage_capture)."""
+    _stage_capture.stages = {}
 
-        self.url_input = scrolledtext.ScrolledText(input_frame, width=80, height=10)
-        self.url_input.pack(pady=5, fill="both", expand=True)
-        # URL contoh telah dihapus agar inputan kosong
-        # self.url_input.insert(tk.END, """URL_CONTOH_1
-        # URL_CONTOH_2
-        # ...""")
+def end_stage_capture():
+    """Mengakhiri penampungan; mengembalikan dict tahap -> [detik, byte], atau None jika tidak aktif."""
+    stages = getattr(_stage_capture, 'stages', None)
+    _stage_capture.stages = None
+    return stages
 
-        # Frame untuk tombol
-        button_frame = tk.Frame(master)
-        button_frame.pack(pady=5)
+def record_stage(stage, seconds, nbytes=0):
+    stages = getattr(_stage_capture, 'stages', None)
+    if stages is None:
+        return
+    entry = stages.setdefault(stage, [0.0, 0])
+    entry[0] += seconds
+    entry[1] += nbytes
 
-        self.scrape_button = tk.Button(button_frame, text="Mulai Scraping", command=self.start_scraping)
-        self.scrape_button.pack(side=tk.LEFT, padx=5)
+def captured_stage_seconds(*stage_names):
+    """Total detik yang sudah tertampung untuk tahap-tahap tersebut di thread ini."""
+    stages = getattr(_stage_capture, 'stages', None) or {}
+    return sum(stages[stage][0] for stage in stage_names if stage in stages)
 
-        self.analyze_button = tk.Button(button_frame, text="Analisis Hasil Scraping", command=self.analyze_results)
-        self.analyze_button.pack(side=tk.LEFT, padx=5)
+# Backend ekstraksi yang dapat dipilih
+DEFAULT_SELECTOR_PROFILE_PATH = os.path.join('.', 'selector_profiles.json')
+JUNK_TAGS = ["script", "style", "nav", "header", "footer", "aside", "form"]
+CHARSET_PATTERN = re.compile(rb'charset=["\']?([A-Za-z0-9_-]+)', re.IGNORECASE)
 
-        # Frame untuk output log
-        output_frame = tk.LabelFrame(master, text="Log Scraping & Analisis:", padx=10, pady=10)
-        output_frame.pack(pady=10, padx=10, fill="both", expand=True)
+def _css_to_xpath(selector):
+    """Menerjemahkan selektor CSS sederhana yang dipakai extract_article_content menjadi XPath."""
+    if selector.startswith('.'):
+        return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {selector[1:]} ')]"
+    if selector.startswith('[') and '=' in selector:
+        attr_name, attr_value = selector[1:-1].split('=', 1)
+        return f"//*[@{attr_name}='{attr_value.strip(chr(34))}']"
+    if selector.startswith('['):
+        return f"//*[@{selector[1:-1]}]"
+    return f"//{selector}"
 
-        self.output_text = scrolledtext.ScrolledText(output_frame, width=100, height=15, state='disabled')
-        self.output_text.pack(pady=5, fill="both", expand=True)
+class SelectorProfileCache:
+    """
+    Menyimpan selektor pemenang (title/content/author/date) per host, disimpan ke file JSON
+    di antara run. Halaman berikutnya dari domain yang sama langsung mencoba selektor pemenang.
+    """
 
-        self.csv_output_path = os.path.join('.', 'hasil_scraping.csv')
+    def __init__(self, path=DEFAULT_SELECTOR_PROFILE_PATH):
+        self.path = path
+        self.profiles = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.profiles = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Profil selektor '{path}' tidak dapat dibaca, mulai dari kosong: {e}")
 
-    def log_to_gui(self, message):
-        """Menulis pesan ke widget teks output di GUI."""
-        self.output_text.config(state='normal')
-        self.output_text.insert(tk.END, message + "\n")
-        self.output_text.see(tk.END) # Scroll to the end
-        self.output_text.config(state='disabled')
+    def get(self, host):
+        return self.profiles.get(host, {})
 
-    def start_scraping(self):
-        """Memulai proses scraping di thread terpisah."""
-        urls_str = self.url_input.get("1.0", tk.END).strip()
-        article_urls = [url.strip() for url in urls_str.split('\n') if url.strip()]
+    def record(self, host, field, selector):
+        if self.profiles.get(host, {}).get(field) == selector:
+            return
+        with self._lock:
+            self.profiles.setdefault(host, {})[field] = selector
+            self._dirty = True
 
-        if not article_urls:
-            messagebox.showwarning("Input Kosong", "Harap masukkan setidaknya satu URL di kolom input.")
+    def merge(self, host, profile):
+        """Menggabungkan profil yang dipelajari di proses lain (mis. worker process pool)."""
+        for field, selector in (profile or {}).items():
+            self.record(host, field, selector)
+
+    def save(self):
+        """Menulis profil ke disk secara atomik, hanya jika ada perubahan."""
+        if not self.path or not self._dirty:
             return
+        with self._lock:
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.profiles, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
 
-        # Membersihkan log sebelumnya dan mengaktifkan widget
-        self.output_text.config(state='normal')
-        self.output_text.delete("1.0", tk.END) 
-        self.output_text.config(state='disabled') # Nonaktifkan lagi sementara
+class BeautifulSoupExtractionBackend:
+    """Backend bawaan: html.parser + extract_article_content, tanpa profil selektor."""
+    name = 'bs4'
 
-        self.log_to_gui("Memulai Demo Scraping Artikel Multithreading Lanjutan...")
-        self.log_to_gui("=" * 80)
-        self.output_text.config(state='normal') # Aktifkan untuk penulisan log oleh monitor
-        
-        # Nonaktifkan tombol saat scraping berlangsung
-        self.scrape_button.config(state='disabled')
-        self.analyze_button.config(state='disabled')
+    def __init__(self, profile_path=None):
+        self.profile_path = profile_path
+        self._beautiful_soup = _import_optional('bs4', "Backend ekstraksi 'bs4'", 'beautifulsoup4').BeautifulSoup
 
-        # Jalankan scraping di thread terpisah agar GUI tidak hang
-        threading.Thread(target=self._run_scraping_logic, args=(article_urls,)).start()
+    def extract(self, html_content, url):
+        start = time.perf_counter()
+        soup = self._beautiful_soup(html_content, 'html.parser')
+        parsed = time.perf_counter()
+        record_stage('parse', parsed - start, len(html_content))
+        article_data = extract_article_content(soup, url)
+        record_stage('select', time.perf_counter() - parsed)
+        return article_data
 
-    def _run_scraping_logic(self, article_urls):
-        """Logika inti scraping yang berjalan di thread terpisah."""
-        monitor = RealTimeArticleScrapingMonitor(self.output_text)
-        successful_results = []
-        failed_urls_info = []
+    def profile_for(self, host):
+        return None
 
-        def enhanced_article_fetch(url):
-            """Fungsi untuk mengambil dan mengurai satu artikel."""
-            thread_name = threading.current_thread().name
-            try:
-                session = requests.Session()
-                session.headers.update({
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive'
-                })
-                
-                response = session.get(url, timeout=15)
-                response.raise_for_status() # Akan memunculkan HTTPError untuk status kode 4xx/5xx
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                article_data = extract_article_content(soup, url)
-                
-                # Kunci: Menentukan apakah scraping dianggap berhasil berdasarkan jumlah kata
-                if article_data['word_count'] < 100: # Jika kurang dari 100 kata, anggap bukan artikel yang valid
-                    error_msg = f"Konten artikel terlalu pendek ({article_data['word_count']} kata), mungkin bukan artikel utama atau konten valid."
-                    return None, error_msg 
-                
-                result = {
-                    'url': url,
-                    'title': article_data['title'],
-                    'word_count': article_data['word_count'],
-                    'author': article_data['author'],
-                    'publish_date': article_data['publish_date'],
-                    'meta_description': article_data['meta_description'],
-                    'content_preview': article_data['content_preview'],
-                    'thread_id': thread_name,
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                monitor.update_stats(url, article_data['word_count'], thread_name)
-                
-                return result, None # Mengembalikan hasil dan None untuk error (berhasil)
-                
-            except requests.exceptions.HTTPError as e:
-                error_msg = f"HTTP Error: {e.response.status_code} - {e.response.reason}"
-                return None, error_msg
-            except requests.exceptions.ConnectionError as e:
-                error_msg = f"Connection Error: {e}"
-                return None, error_msg
-            except requests.exceptions.Timeout as e:
-                error_msg = f"Timeout Error: {e}"
-                return None, error_msg
-            except requests.exceptions.RequestException as e:
-                error_msg = f"Requests Error: {e}"
-                return None, error_msg
-            except Exception as e:
-                error_msg = f"Unexpected Error: {e}"
-                return None, error_msg
-        
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Membuat kamus yang memetakan objek Future ke URL aslinya
-            futures_map = {executor.submit(enhanced_article_fetch, url): url for url in article_urls}
-            
-            # Mengumpulkan hasil saat future selesai
-            for future in as_completed(futures_map):
-                original_url = futures_map[future] # Dapatkan URL asli dari future yang selesai
-                try:
-                    # Dapatkan hasil dan pesan error dari fungsi fetch
-                    result, error_reason = future.result() 
-                    if result:
-                        successful_results.append(result)
-                    else:
-                        # Jika result adalah None, tambahkan ke daftar gagal
-                        failed_urls_info.append({'url': original_url, 'reason': error_reason})
-                except Exception as e:
-                    # Tangani pengecualian yang sangat jarang terjadi jika future.result() itu sendiri gagal
-                    failed_urls_info.append({'url': original_url, 'reason': f"Kesalahan tak terduga saat mendapatkan hasil: {e}"})
-
-        # --- Laporan Akhir (Diperbarui) ---
-        if successful_results or failed_urls_info:
-            fieldnames = ['url', 'title', 'word_count', 
-                          'author', 'publish_date', 'meta_description',
-                          'content_preview', 'thread_id', 'timestamp']
-            
-            output_dir = '.' 
-            os.makedirs(output_dir, exist_ok=True)
-            
-            with open(self.csv_output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for result in successful_results:
-                    csv_row = {}
-                    for field in fieldnames:
-                        value = result.get(field, '')
-                        if isinstance(value, str):
-                            # Bersihkan newline dari string sebelum menulis ke CSV
-                            value = value.replace('\n', ' ').replace('\r', ' ')
-                        csv_row[field] = value
-                    writer.writerow(csv_row)
-        
-        self.log_to_gui(f"\nScraping artikel selesai! Hasil berhasil disimpan ke '{self.csv_output_path}'")
-        
-        self.log_to_gui("\n" + "=" * 60)
-        self.log_to_gui("Analisis Artikel Cepat:")
-        self.log_to_gui("=" * 60)
-        self.log_to_gui(f"Total URL yang dicoba: {len(article_urls)}")
-        self.log_to_gui(f"Berhasil di-scrape: {len(successful_results)}")
-        self.log_to_gui(f"Gagal di-scrape: {len(failed_urls_info)}")
-        
-        if len(article_urls) > 0:
-            success_rate = (len(successful_results) / len(article_urls)) * 100
-            self.log_to_gui(f"Tingkat keberhasilan: {success_rate:.2f}%")
-        
-        # Buat kamus untuk pencarian cepat berdasarkan URL
-        successful_results_map = {res['url']: res for res in successful_results}
-        failed_urls_map = {info['url']: info['reason'] for info in failed_urls_info}
+    def merge_profile(self, host, profile):
+        pass
 
-        self.log_to_gui("\nRingkasan Hasil per URL Input (Terurut):")
-        for i, url in enumerate(article_urls):
-            status = "BERHASIL"
-            detail = ""
-            if url in successful_results_map:
-                article_info = successful_results_map[url]
-                detail = f"Judul: '{article_info['title']}' ({article_info['word_count']} kata)"
-            elif url in failed_urls_map:
-                status = "GAGAL"
-                detail = f"Alasan: {failed_urls_map[url]}"
-            else:
-                status = "TIDAK DIKETAHUI" # Seharusnya tidak terjadi jika semua futures diproses
+    def save_profiles(self):
+        pass
 
-            self.log_to_gui(f"   {i+1}. URL: {url}\n      Status: {status}\n      Detail: {detail}")
-            self.log_to_gui("-" * 30)
+class LxmlExtractionBackend:
+    """
+    Backend cepat berbasis pohon lxml (C). Selektor yang sama dengan extract_article_content
+    diterjemahkan ke XPath terkompilasi, dan per host selektor pemenang diingat lewat
+    SelectorProfileCache sehingga halaman berikutnya tidak perlu mencoba semua selektor.
+    Kunci dict yang dikembalikan sama persis dengan extract_article_content.
+    """
+    name = 'lxml'
 
-        if successful_results:
-            total_words = sum(r.get('word_count', 0) for r in successful_results)
-            avg_words = total_words / len(successful_results) if successful_results else 0
-            
-            self.log_to_gui(f"\nRata-rata panjang artikel (berhasil): {avg_words:.0f} kata")
-            self.log_to_gui(f"Total kata yang di-scrape (berhasil): {total_words:,} kata")
-            
-            # Contoh judul akan tetap 5 pertama dari yang berhasil (tidak harus terurut berdasarkan input URL)
-            self.log_to_gui(f"\nContoh Judul Artikel (5 pertama yang berhasil):")
-            for i, result in enumerate(successful_results[:5]):
-                title = result.get('title', 'No Title')[:80]
-                word_count = result.get('word_count', 0)
-                self.log_to_gui(f"   {i+1}. {title}... ({word_count} kata)")
-        else:
-            self.log_to_gui("\nTidak ada artikel yang berhasil di-scrape untuk analisis cepat.")
+    TITLE_SELECTORS = ['h1', 'title', '.title', '.headline', '.entry-title']
+    CONTENT_SELECTORS = [
+        'article', '.article', '.content', '.entry-content', '.post-content',
+        '.article-body', '.story-body', '.main-content', 'main', '.post-body'
+    ]
+    AUTHOR_SELECTORS = ['.author', '.byline', '[rel="author"]', '.post-author', '.article-author', '.read__info']
+    DATE_SELECTORS = ['time', '.date', '.published', '.post-date', '[datetime]', '.read__time']
 
-        self.output_text.config(state='disabled') # Nonaktifkan editing setelah scraping
-        messagebox.showinfo("Scraping Selesai", "Scraping artikel telah selesai! Hasil disimpan ke 'hasil_scraping.csv'")
-        
-        # Aktifkan kembali tombol setelah scraping selesai
-        self.scrape_button.config(state='normal')
-        self.analyze_button.config(state='normal')
+    def __init__(self, profile_path=DEFAULT_SELECTOR_PROFILE_PATH):
+        _load_lxml()
+        self.profile_path = profile_path
+        self.profiles = SelectorProfileCache(profile_path)
+        all_selectors = self.TITLE_SELECTORS + self.CONTENT_SELECTORS + self.AUTHOR_SELECTORS + self.DATE_SELECTORS
+        self._xpaths = {selector: etree.XPath(_css_to_xpath(selector)) for selector in all_selectors}
+        self._union_xpaths = {
+            'author': etree.XPath(' | '.join(_css_to_xpath(s) for s in self.AUTHOR_SELECTORS)),
+            'date': etree.XPath(' | '.join(_css_to_xpath(s) for s in self.DATE_SELECTORS)),
+        }
+        self._junk_xpath = etree.XPath(' | '.join(f".//{tag}" for tag in JUNK_TAGS))
+        self._meta_description_xpath = etree.XPath("//meta[@name='description']")
+        self._parsers = {}
 
-    def analyze_results(self):
-        """Menganalisis hasil scraping dari CSV dan menampilkannya di GUI."""
-        self.output_text.config(state='normal')
-        self.output_text.delete("1.0", tk.END) # Hapus log sebelumnya
-        
-        if os.path.exists(self.csv_output_path) and os.path.getsize(self.csv_output_path) > 0:
-            self.log_to_gui("\n" + "=" * 80)
-            self.log_to_gui("MENGANALISIS HASIL SCRAPING ARTIKEL (Detail Laporan)...")
+    def _parse(self, html_content):
+        """Mem-parse bytes dengan charset dari <meta> (bawaan UTF-8); lxml sendiri akan mengira Latin-1."""
+        if isinstance(html_content, str):
+            return lxml_html.fromstring(html_content)
+        charset_match = CHARSET_PATTERN.search(html_content[:4096])
+        encoding = charset_match.group(1).decode('ascii').lower() if charset_match else 'utf-8'
+        parser = self._parsers.get(encoding)
+        if parser is None:
             try:
-                analyzer = ArticleScrapingResultAnalyzer(self.csv_output_path)
-                report = analyzer.generate_comprehensive_report()
-                self.log_to_gui(report)
-                self.log_to_gui("\nAnalisis selesai! Periksa file CSV untuk hasil detail.")
-            except Exception as e:
-                self.log_to_gui(f"Terjadi kesalahan saat menganalisis hasil scraping: {e}")
-                self.log_to_gui("Pastikan file 'hasil_scraping.csv' tidak kosong atau rusak.")
-        else:
-            self.log_to_gui("Tidak ditemukan file hasil untuk dianalisis atau file kosong. Pastikan scraping berhasil.")
-        self.output_text.config(state='disabled')
+                parser = lxml_html.HTMLParser(encoding=encoding)
+            except LookupError:
+                parser = lxml_html.HTMLParser(encoding='utf-8')
+            self._parsers[encoding] = parser
+        return lxml_html.fromstring(html_content, parser=parser)
+
+    def _first(self, tree, selector):
+        matches = self._xpaths[selector](tree)
+        return matches[0] if matches else None
+
+    def _ordered(self, selectors, learned):
+        """Selektor pemenang (jika ada) dicoba lebih dulu, sisanya dalam urutan aslinya."""
+        if learned in selectors:
+            return [learned] + [s for s in selectors if s != learned]
+        return selectors
+
+    def _remove_junk(self, elem):
+        for junk_elem in self._junk_xpath(elem):
+            junk_elem.drop_tree() # Teks ekor (tail) tetap dipertahankan, sama seperti decompose()
+
+    def _match_first_in_document(self, tree, field, selectors, learned, host):
+        """Untuk author/date: elemen pertama dalam urutan dokumen di antara semua selektor."""
+        if learned:
+            elem = self._first(tree, learned)
+            if elem is not None:
+                return elem
+        matches = self._union_xpaths[field](tree)
+        if not matches:
+            return None
+        elem = matches[0]
+        for selector in selectors:
+            if elem in self._xpaths[selector](tree):
+                self.profiles.record(host, field, selector)
+                break
+        return elem
+
+    def extract(self, html_content, url):
+        start = time.perf_counter()
+        tree = self._parse(html_content)
+        parsed = time.perf_counter()
+        record_stage('parse', parsed - start, len(html_content))
+        host = urlparse(url).netloc
+        profile = self.profiles.get(host)
+
+        title = "No Title"
+        for selector in self._ordered(self.TITLE_SELECTORS, profile.get('title')):
+            title_elem = self._first(tree, selector)
+            if title_elem is not None:
+                title_text = title_elem.text_content().strip()
+                if title_text:
+                    title = title_text
+                    self.profiles.record(host, 'title', selector)
+                    break
+
+        article_content = ""
+        for selector in self._ordered(self.CONTENT_SELECTORS, profile.get('content')):
+            content_elem = self._first(tree, selector)
+            if content_elem is not None:
+                self._remove_junk(content_elem)
+                article_content = content_elem.text_content()
+                self.profiles.record(host, 'content', selector)
+                break
+
+        # Fallback: Jika tidak ada konten spesifik artikel yang ditemukan, ambil semua teks dari body
+        if not article_content:
+            body_elem = tree.find('.//body') if tree.tag != 'body' else tree
+            if body_elem is not None:
+                self._remove_junk(body_elem)
+                article_content = body_elem.text_content()
+
+        # split() tanpa argumen sudah memecah semua whitespace, jadi re.sub pada seluruh dokumen
+        # tidak diperlukan; hanya kata-kata awal yang digabung untuk pratinjau 500 karakter
+        words = article_content.split()
+        word_count = len(words)
+        preview_words = []
+        preview_length = 0
+        for word in words:
+            if preview_length > 500:
+                break
+            preview_words.append(word)
+            preview_length += len(word) + 1
+        content_preview = ' '.join(preview_words)
+
+        meta_description = ""
+        meta_matches = self._meta_description_xpath(tree)
+        if meta_matches:
+            meta_description = meta_matches[0].get('content', '')
+
+        author = "Unknown"
+        author_elem = self._match_first_in_document(tree, 'author', self.AUTHOR_SELECTORS, profile.get('author'), host)
+        if author_elem is not None:
+            author = author_elem.text_content().strip()
+
+        publish_date = "Unknown"
+        date_elem = self._match_first_in_document(tree, 'date', self.DATE_SELECTORS, profile.get('date'), host)
+        if date_elem is not None:
+            publish_date = date_elem.get('datetime', date_elem.text_content().strip())
+
+        record_stage('select', time.perf_counter() - parsed)
+        return {
+            'title': title[:200], # Batasi panjang string untuk CSV
+            'word_count': word_count,
+            'author': author[:100],
+            'publish_date': publish_date[:50],
+            'meta_description': meta_description[:200],
+            'content_preview': content_preview[:500] # Batasi panjang string untuk CSV
+        }
+
+    def profile_for(self, host):
+        return self.profiles.get(host)
+
+    def merge_profile(self, host, profile):
+        self.profiles.merge(host, profile)
+
+    def save_profiles(self):
+        self.profiles.save()
+
+def _element_strainer(bs4_module, wanted):
+    """
+    parse_only untuk BeautifulSoup yang memutuskan lewat wanted(name, attrs) elemen tingkat atas mana
+    yang dibangun; turunan elemen yang diterima selalu ikut dibangun, teks di luarnya dibuang.
+    """
+    element_filter = getattr(bs4_module, 'ElementFilter', None)
+    if element_filter is None: # bs4 < 4.13: fungsi name pada SoupStrainer dipanggil dengan (name, attrs)
+        return bs4_module.SoupStrainer(wanted)
+
+    class ArticleElementFilter(element_filter):
+        def allow_tag_creation(self, nsprefix, name, attrs):
+            return wanted(name, attrs or {})
+
+        def allow_string_creation(self, string):
+            return False
+
+    return ArticleElementFilter()
+
+class PartialTreeExtractionBackend(BeautifulSoupExtractionBackend):
+    """
+    Seperti backend 'bs4', tetapi pohon hanya dibangun untuk elemen yang bisa dicocokkan selektor
+    extract_article_content (title, meta, h1, article/main, penulis/tanggal, dan elemen dengan class
+    selektor tersebut) beserta isinya. Skrip, iklan, navigasi, dan komentar di luar elemen itu tidak
+    pernah menjadi node, sehingga memori dan waktu parsing per halaman turun. Halaman tanpa elemen
+    konten sama sekali di-parse ulang secara penuh karena fallback-nya membutuhkan <body>.
+    """
+    name = 'partial'
+
+    def __init__(self, profile_path=None):
+        super().__init__(profile_path)
+        selectors = (LxmlExtractionBackend.TITLE_SELECTORS + LxmlExtractionBackend.CONTENT_SELECTORS
+                     + LxmlExtractionBackend.AUTHOR_SELECTORS + LxmlExtractionBackend.DATE_SELECTORS)
+        self._tags = frozenset([s for s in selectors if s[0].isalpha()] + ['meta'])
+        self._classes = frozenset(s[1:] for s in selectors if s.startswith('.'))
+        self._content_selector = ', '.join(LxmlExtractionBackend.CONTENT_SELECTORS)
+        self._strainer = _element_strainer(_import_optional('bs4', "Backend ekstraksi 'partial'", 'beautifulsoup4'), self._wants_element)
+
+    def _wants_element(self, name, attrs):
+        if name in self._tags or 'datetime' in attrs:
+            return True
+        for attr_name, wanted_values in (('class', self._classes), ('rel', ('author',))):
+            values = attrs.get(attr_name)
+            if values:
+                if isinstance(values, str):
+                    values = values.split()
+                if not set(values).isdisjoint(wanted_values):
+                    return True
+        return False
+
+    def extract(self, html_content, url):
+        start = time.perf_counter()
+        soup = self._beautiful_soup(html_content, 'html.parser', parse_only=self._strainer)
+        if soup.select_one(self._content_selector) is None:
+            soup = self._beautiful_soup(html_content, 'html.parser')
+        parsed = time.perf_counter()
+        record_stage('parse', parsed - start, len(html_content))
+        article_data = extract_article_content(soup, url)
+        record_stage('select', time.perf_counter() - parsed)
+        return article_data
+
+EXTRACTION_BACKENDS = {
+    BeautifulSoupExtractionBackend.name: BeautifulSoupExtractionBackend,
+    LxmlExtractionBackend.name: LxmlExtractionBackend,
+    PartialTreeExtractionBackend.name: PartialTreeExtractionBackend,
+}
+_extraction_backend_instances = {}
+_extraction_backend_lock = threading.Lock()
+
+def get_extraction_backend(name='bs4', profile_path=DEFAULT_SELECTOR_PROFILE_PATH):
+    """Mengembalikan instance backend ekstraksi bersama (satu per proses) untuk nama dan file profil tersebut."""
+    if name not in EXTRACTION_BACKENDS:
+        raise ValueError(f"Backend ekstraksi tidak dikenal: '{name}'. Pilihan: {', '.join(EXTRACTION_BACKENDS)}")
+    with _extraction_backend_lock:
+        key = (name, profile_path)
+        if key not in _extraction_backend_instances:
+            _extraction_backend_instances[key] = EXTRACTION_BACKENDS[name](profile_path)
+        return _extraction_backend_instances[key]
+
+# Konfigurasi bersama untuk semua engine fetch
+DEFAULT_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive'
+}
+REQUEST_TIMEOUT = 15
+DEFAULT_MAX_RESPONSE_BYTES = 2 * 1024 * 1024 # Halaman artikel jauh lebih kecil; sisa respons raksasa tidak diunduh
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+STREAM_CHUNK_SIZE = 64 * 1024
+MIN_ARTICLE_WORD_COUNT = 100 # Jika kurang dari 100 kata, anggap bukan artikel yang valid
+
+def build_article_result(html_content, url, thread_name, extraction_backend=None):
+    """
+    Mengurai HTML mentah satu halaman dan membentuk dict hasil yang siap ditulis ke CSV.
+    Mengembalikan tuple (result, error_msg); salah satunya selalu None.
+    """
+    extraction_backend = extraction_backend or get_extraction_backend()
+    article_data = extraction_backend.extract(html_content, url)
+
+    # Kunci: Menentukan apakah scraping dianggap berhasil berdasarkan jumlah kata
+    if article_data['word_count'] < MIN_ARTICLE_WORD_COUNT:
+        error_msg = f"Konten artikel terlalu pendek ({article_data['word_count']} kata), mungkin bukan artikel utama atau konten valid."
+        return None, error_msg
+
+    result = {
+        'url': url,
+        'title': article_data['title'],
+        'word_count': article_data['word_count'],
+        'author': article_data['author'],
+        'publish_date': article_data['publish_date'],
+        'meta_description': article_data['meta_description'],
+        'content_preview': article_data['content_preview'],
+        'thread_id': thread_name,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    return result, None
+
+class _CountingHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter yang mencatat pool urllib3 per host agar penghitung koneksinya dapat dibaca."""
+
+    def __init__(self, *args, **kwargs):
+        self.pools_by_host = {}
+        self._pools_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _remember_pool(self, pool):
+        with self._pools_lock:
+            self.pools_by_host[f"{pool.host}:{pool.port}"] = pool
+        return pool
+
+    def get_connection_with_tls_context(self, *args, **kwargs): # requests >= 2.32
+        return self._remember_pool(super().get_connection_with_tls_context(*args, **kwargs))
+
+    def get_connection(self, *args, **kwargs): # requests < 2.32
+        return self._remember_pool(super().get_connection(*args, **kwargs))
+
+class _TracedConnectionMixin:
+    """Mencatat waktu membuka socket (DNS + TCP connect) koneksi urllib3 baru ke tahap 'connect'."""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        self._connect_seconds = time.perf_counter() - start
+        record_stage('connect', self._connect_seconds)
+        return sock
+
+class _TracedHTTPConnection(_TracedConnectionMixin, urllib3.connection.HTTPConnection):
+    pass
+
+class _TracedHTTPSConnection(_TracedConnectionMixin, urllib3.connection.HTTPSConnection):
+    def connect(self):
+        self._connect_seconds = 0.0
+        start = time.perf_counter()
+        super().connect() # _new_conn() lalu handshake TLS
+        record_stage('tls', time.perf_counter() - start - self._connect_seconds)
+
+class _TracedHTTPConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
+    ConnectionCls = _TracedHTTPConnection
+
+class _TracedHTTPSConnectionPool(urllib3.connectionpool.HTTPSConnectionPool):
+    ConnectionCls = _TracedHTTPSConnection
+
+class PooledHTTPSessionManager:
+    """
+    Pool koneksi HTTP bersama untuk semua worker thread.
+    Setiap thread memakai requests.Session miliknya sendiri (cookie jar tidak thread-safe),
+    tetapi semuanya memasang HTTPAdapter yang sama sehingga koneksi keep-alive dan sesi TLS
+    per host dipakai ulang lintas thread alih-alih handshake baru untuk setiap artikel.
+    """
+
+    def __init__(self, pool_maxsize=10, pool_connections=10, keep_alive=True, traced=False):
+        # pool_connections = jumlah host yang pool-nya disimpan, pool_maxsize = koneksi yang disimpan per host
+        self.adapter = _CountingHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        if traced:
+            # Koneksi baru mencatat waktu connect/TLS ke record_stage(); DNS termasuk dalam 'connect'
+            # karena urllib3 me-resolve nama di dalam create_connection
+            self.adapter.poolmanager.pool_classes_by_scheme = {'http': _TracedHTTPConnectionPool,
+                                                               'https': _TracedHTTPSConnectionPool}
+        self.keep_alive = keep_alive
+        self._local = threading.local()
+
+    def get_session(self):
+        """Mengembalikan Session milik thread pemanggil, dibuat sekali per thread."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_REQUEST_HEADERS)
+            if not self.keep_alive:
+                session.headers['Connection'] = 'close'
+            session.mount('http://', self.adapter)
+            session.mount('https://', self.adapter)
+            self._local.session = session
+        return session
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        return self.get_session().get(url, **kwargs)
+
+    def connection_stats(self):
+        """
+        Menghitung koneksi baru vs. koneksi yang dipakai ulang per host dari penghitung pool urllib3.
+        Catatan: jika jumlah host melebihi pool_connections, pool lama dibuang dan penghitungnya ikut hilang.
+        """
+        with self.adapter._pools_lock:
+            pools = sorted(self.adapter.pools_by_host.items())
+        stats = {}
+        for host, pool in pools:
+            stats[host] = {
+                'requests': pool.num_requests,
+                'new_connections': pool.num_connections,
+                'reused_connections': max(pool.num_requests - pool.num_connections, 0),
+            }
+        return stats
+
+    def close(self):
+        self.adapter.close()
+
+def format_connection_stats(stats):
+    """Mengubah hasil connection_stats() menjadi baris-baris teks untuk log."""
+    if not stats:
+        return ["   Tidak ada statistik koneksi."]
+    lines = []
+    total_new = total_reused = 0
+    for host, host_stats in stats.items():
+        total_new += host_stats['new_connections']
+        total_reused += host_stats['reused_connections']
+        lines.append(f"   {host}: {host_stats['new_connections']} koneksi baru, {host_stats['reused_connections']} dipakai ulang")
+    lines.append(f"   Total: {total_new} koneksi baru, {total_reused} dipakai ulang")
+    return lines
+
+_default_session_manager = None
+_default_session_manager_lock = threading.Lock()
+
+def get_default_session_manager():
+    """Pool koneksi bersama tingkat modul untuk pemanggil yang tidak membawa pool sendiri."""
+    global _default_session_manager
+    with _default_session_manager_lock:
+        if _default_session_manager is None:
+            _default_session_manager = PooledHTTPSessionManager()
+        return _default_session_manager
+
+# Retry dan pengendalian konkurensi adaptif per host
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+THROTTLE_STATUS_CODES = {429, 503} # Sinyal bahwa host kewalahan: batas konkurensinya diturunkan
+MAX_RETRY_AFTER_SECONDS = 300 # Retry-After yang lebih lama dipotong agar satu host tidak menahan run selamanya
+DEFAULT_MAX_RETRIES = 3
+ADAPTIVE_INITIAL_HOST_LIMIT = 4
+
+def parse_retry_after(value):
+    """Mengubah header Retry-After (detik atau HTTP-date) menjadi detik menunggu; None jika tidak ada/tidak valid."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+def _fetch_failure(kind, retry_after=None):
+    """
+    Keterangan kegagalan satu percobaan fetch untuk keputusan retry:
+    'throttled' (429/503/timeout, host perlu dikurangi bebannya), 'error' (5xx lain/koneksi putus,
+    layak dicoba lagi), atau 'fatal' (4xx lain/error tak terduga, percuma dicoba lagi).
+    """
+    return {'kind': kind, 'retry_after': retry_after}
+
+def _http_failure(status_code, retry_after_header):
+    if status_code in THROTTLE_STATUS_CODES:
+        return _fetch_failure('throttled', parse_retry_after(retry_after_header))
+    if status_code in RETRYABLE_STATUS_CODES:
+        return _fetch_failure('error', parse_retry_after(retry_after_header))
+    return _fetch_failure('fatal')
+
+class AdaptiveHostLimiter:
+    """
+    Pengendali konkurensi per host bergaya AIMD (seperti kontrol kongesti TCP). Setiap host mulai
+    dengan batas kecil; selama latensi dan tingkat error host sehat, batasnya naik kira-kira +1 per
+    putaran (setiap `limit` respons sukses) hingga max_limit, dan pada 429/503/timeout batas dipotong
+    setengah. Retry-After dari server menahan semua request ke host itu sampai waktunya lewat.
+    Dipakai oleh worker thread (acquire) maupun coroutine (acquire_async). clock dapat diganti (mis. di tes).
+    """
+    LATENCY_DEGRADED_FACTOR = 3.0 # Latensi di atas 3x latensi terbaik host dianggap tidak sehat
+    ERROR_RATE_THRESHOLD = 0.1
+    EWMA_ALPHA = 0.1
+    DECREASE_COOLDOWN = 0.5 # Satu gelombang 429 dari request yang sama-sama sedang berjalan hanya memotong batas sekali
+    MIN_LATENCY_BASELINE = 0.05
+
+    def __init__(self, max_limit, initial_limit=ADAPTIVE_INITIAL_HOST_LIMIT, adaptive=True, clock=time.monotonic):
+        self.max_limit = max(1, max_limit)
+        self.clock = clock
+        self.adaptive = adaptive
+        self.initial_limit = min(initial_limit, self.max_limit) if adaptive else self.max_limit
+        self._hosts = {}
+        self._condition = threading.Condition()
+
+    def _state(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = {
+                'limit': float(self.initial_limit), 'peak_limit': self.initial_limit, 'in_flight': 0,
+                'blocked_until': 0.0, 'best_latency': None, 'error_rate': 0.0, 'last_decrease': 0.0,
+                'requests': 0, 'throttled': 0, 'slot_released': None,
+            }
+        return state
+
+    def try_acquire(self, host):
+        """
+        Mengambil satu slot untuk host tanpa menunggu. Mengembalikan None jika slot didapat, atau
+        perkiraan detik menunggu (math.inf jika harus menunggu request lain ke host ini selesai).
+        """
+        with self._condition:
+            state = self._state(host)
+            blocked_for = state['blocked_until'] - self.clock()
+            if blocked_for > 0:
+                return blocked_for
+            if state['in_flight'] >= int(state['limit']):
+                return math.inf
+            state['in_flight'] += 1
+            state['requests'] += 1
+            return None
+
+    def acquire(self, host):
+        with self._condition:
+            while True:
+                wait_seconds = self.try_acquire(host) # Condition memakai RLock, jadi aman dipanggil ulang
+                if wait_seconds is None:
+                    return
+                self._condition.wait(None if wait_seconds == math.inf else wait_seconds)
+
+    async def acquire_async(self, host):
+        while True:
+            wait_seconds = self.try_acquire(host)
+            if wait_seconds is None:
+                return
+            if wait_seconds != math.inf:
+                await asyncio.sleep(wait_seconds)
+                continue
+            # Dibangunkan oleh release() untuk host ini (dipanggil dari event loop yang sama)
+            with self._condition:
+                state = self._state(host)
+                if state['slot_released'] is None:
+                    state['slot_released'] = asyncio.Event()
+                slot_released = state['slot_released']
+            await slot_released.wait()
+
+    def release(self, host, latency, failure=None):
+        """Melepas slot dan menyesuaikan batas host dari hasil request (failure dari _fetch_failure, None jika sukses)."""
+        with self._condition:
+            state = self._state(host)
+            state['in_flight'] -= 1
+            now = self.clock()
+            kind = failure['kind'] if failure else None
+            failed = kind in ('throttled', 'error')
+            state['error_rate'] += self.EWMA_ALPHA * ((1.0 if failed else 0.0) - state['error_rate'])
+            if failure and failure['retry_after']:
+                state['blocked_until'] = max(state['blocked_until'], now + failure['retry_after'])
+
+            if kind == 'throttled':
+                state['throttled'] += 1
+                if self.adaptive and now - state['last_decrease'] >= self.DECREASE_COOLDOWN:
+                    state['limit'] = max(1.0, state['limit'] / 2)
+                    state['last_decrease'] = now
+            elif not failed:
+                # Respons 404 dan sejenisnya tetap menandakan host menjawab dengan normal
+                best = state['best_latency'] = latency if state['best_latency'] is None else min(state['best_latency'], latency)
+                healthy = (latency <= max(best, self.MIN_LATENCY_BASELINE) * self.LATENCY_DEGRADED_FACTOR
+                           and state['error_rate'] < self.ERROR_RATE_THRESHOLD)
+                if self.adaptive and healthy:
+                    state['limit'] = min(float(self.max_limit), state['limit'] + 1 / state['limit'])
+            state['peak_limit'] = max(state['peak_limit'], int(state['limit']))
+            if state['slot_released'] is not None:
+                state['slot_released'].set()
+                state['slot_released'] = None
+            self._condition.notify_all()
+
+    def snapshot(self):
+        """Batas akhir, batas tertinggi, jumlah request dan jumlah respons throttled per host."""
+        with self._condition:
+            return {host: {'limit': int(state['limit']), 'peak_limit': state['peak_limit'],
+                           'requests': state['requests'], 'throttled': state['throttled']}
+                    for host, state in sorted(self._hosts.items())}
+
+class RetryPolicy:
+    """
+    Backoff eksponensial dengan full jitter: sebelum percobaan ulang ke-n, tunggu acak antara 0 dan
+    min(max_delay, base_delay * 2^n) detik, tetapi tidak kurang dari Retry-After yang diminta server.
+    rng (bawaan modul random) dapat diganti dengan random.Random ber-seed agar jitter dapat diulang.
+    """
+
+    def __init__(self, max_retries=DEFAULT_MAX_RETRIES, base_delay=0.5, max_delay=30.0, rng=None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random
+
+    def retry_delay(self, failure, attempt):
+        """Detik menunggu sebelum percobaan berikutnya, atau None jika URL tidak perlu/tidak boleh dicoba lagi."""
+        if failure is None or failure['kind'] == 'fatal' or attempt >= self.max_retries:
+            return None
+        delay = self.rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        return max(delay, failure['retry_after'] or 0.0)
+
+class RetryQueue:
+    """
+    Antrean URL bersama untuk worker engine fetch. URL input ditarik secara lazy, URL yang gagal
+    sementara dijadwalkan ulang dengan waktu tunggu, dan URL yang sudah jatuh tempo didahulukan
+    dari URL baru. Antrean selesai ketika input habis, tidak ada retry tertunda, dan tidak ada
+    URL yang masih diproses (URL yang sedang diproses masih mungkin dijadwalkan ulang).
+    Input ditarik di luar kunci antrean oleh satu pemanggil sekaligus, karena iterator lazy bisa
+    lama (mis. menyewa batch dari CrawlFrontier); finish() dan pemanggil lain tidak ikut tertahan.
+    """
+
+    def __init__(self, article_urls, retry_policy=None, clock=time.monotonic):
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.clock = clock
+        self.retry_count = 0
+        self._urls = iter(article_urls)
+        self._urls_exhausted = False
+        self._input_may_block = not isinstance(article_urls, (list, tuple)) # Generator dsb. ditarik get_async() di thread executor
+        self._pulling = False # Ada pemanggil yang sedang menarik URL input
+        self._delayed = [] # heap berisi (waktu_siap, urutan, url, attempt)
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def _reserve(self):
+        """
+        Bagian poll() di bawah kunci: (item, detik_tunggu, tarik_input). tarik_input=True berarti
+        pemanggil mendapat giliran menarik URL input berikutnya lewat _next_input().
+        """
+        now = self.clock()
+        if self._delayed and self._delayed[0][0] <= now:
+            _, _, url, attempt = heapq.heappop(self._delayed)
+            self._in_flight += 1
+            return (url, attempt), 0, False
+        if not self._urls_exhausted and not self._pulling:
+            self._pulling = True
+            return None, 0, True
+        if self._delayed:
+            return None, self._delayed[0][0] - now, False
+        if self._in_flight or self._pulling:
+            return None, math.inf, False
+        return None, None, False
+
+    def _next_input(self):
+        """Menarik URL input berikutnya tanpa memegang kunci antrean; None jika input habis."""
+        url = None
+        try:
+            url = next(self._urls, None)
+        finally:
+            with self._condition:
+                self._pulling = False
+                if url is None:
+                    self._urls_exhausted = True
+                else:
+                    self._in_flight += 1
+                self._condition.notify_all()
+        return url
+
+    def poll(self):
+        """
+        Tanpa menunggu (selain menarik URL input berikutnya): mengembalikan ((url, attempt), 0) jika ada URL siap, (None, detik_tunggu)
+        jika belum ada (math.inf = menunggu URL yang sedang diproses), atau (None, None) jika selesai.
+        """
+        while True:
+            with self._condition:
+                item, wait_seconds, pull = self._reserve()
+            if not pull:
+                return item, wait_seconds
+            url = self._next_input()
+            if url is not None:
+                return (url, 0), 0
+
+    def get(self):
+        """Seperti poll(), tetapi menunggu sampai ada URL siap. Mengembalikan None jika antrean selesai."""
+        while True:
+            with self._condition:
+                item, wait_seconds, pull = self._reserve()
+                if not pull:
+                    if item is not None or wait_seconds is None:
+                        return item
+                    self._condition.wait(None if wait_seconds == math.inf else wait_seconds)
+                    continue
+            url = self._next_input()
+            if url is not None:
+                return url, 0
+
+    async def get_async(self):
+        while True:
+            with self._condition:
+                item, wait_seconds, pull = self._reserve()
+            if pull:
+                # Input yang bisa memblok ditarik di thread executor agar event loop tidak ikut tertahan
+                if self._input_may_block:
+                    url = await asyncio.get_running_loop().run_in_executor(None, self._next_input)
+                else:
+                    url = self._next_input()
+                if url is not None:
+                    return url, 0
+                continue
+            if item is not None or wait_seconds is None:
+                return item
+            await asyncio.sleep(min(wait_seconds, 0.05))
+
+    def finish(self, url, attempt, failure=None):
+        """
+        Menandai satu percobaan selesai. Jika kegagalannya sementara dan jatah retry masih ada, URL
+        dijadwalkan ulang dan True dikembalikan; pemanggil tidak boleh melaporkan URL tersebut dulu.
+        """
+        delay = self.retry_policy.retry_delay(failure, attempt)
+        with self._condition:
+            self._in_flight -= 1
+            if delay is not None:
+                heapq.heappush(self._delayed, (self.clock() + delay, next(self._sequence), url, attempt + 1))
+                self.retry_count += 1
+            self._condition.notify_all()
+        return delay is not None
+
+def _worker_count(article_urls, max_workers):
+    """Jumlah worker engine: max_workers, atau sebanyak URL jika daftarnya lebih pendek (iterable tanpa len() memakai max_workers)."""
+    try:
+        return max(1, min(max_workers, len(article_urls)))
+    except TypeError:
+        return max_workers
+
+def _with_attempt_count(error_reason, attempt):
+    """Menambahkan jumlah percobaan ke alasan gagal untuk URL yang sudah pernah dicoba ulang."""
+    if error_reason and attempt:
+        return f"{error_reason} (gagal setelah {attempt + 1} percobaan)"
+    return error_reason
+
+def non_html_content_type(content_type):
+    """Media type dari header Content-Type jika jelas bukan HTML; None jika HTML atau header tidak ada."""
+    media_type = (content_type or '').split(';', 1)[0].strip().lower()
+    if media_type and media_type not in HTML_CONTENT_TYPES:
+        return media_type
+    return None
+
+def _read_capped_body(response, max_bytes):
+    """
+    Membaca body respons requests (stream=True) paling banyak max_bytes, lalu berhenti dan menutup
+    koneksinya. Unduhan dibatasi REQUEST_TIMEOUT secara total, bukan hanya per pembacaan socket,
+    sehingga server yang mengirim sangat lambat tidak menahan worker. Mengembalikan tuple seperti
+    fetch_article_attempt; halaman yang terpotong tetap dikembalikan karena isi artikel ada di awal.
+    """
+    media_type = non_html_content_type(response.headers.get('Content-Type'))
+    if media_type:
+        return None, f"Konten bukan HTML ({media_type})", _fetch_failure('fatal')
+    deadline = time.monotonic() + REQUEST_TIMEOUT
+    read1 = getattr(response.raw, 'read1', None)
+    if read1 is not None:
+        # urllib3 >= 2: kembali dengan data yang sudah tiba tanpa menunggu satu chunk penuh, jadi
+        # tenggat total tetap diperiksa walaupun server mengirim byte demi byte
+        body_chunks = iter(lambda: read1(STREAM_CHUNK_SIZE, decode_content=True), b'')
+    else:
+        body_chunks = response.iter_content(STREAM_CHUNK_SIZE)
+    chunks = []
+    received = 0
+    for chunk in body_chunks:
+        chunks.append(chunk)
+        received += len(chunk)
+        if received >= max_bytes:
+            break
+        if time.monotonic() > deadline:
+            return None, f"Timeout Error: unduhan body melebihi {REQUEST_TIMEOUT} detik", _fetch_failure('throttled')
+    return b''.join(chunks)[:max_bytes], None, None
+
+def fetch_article_attempt(url, session_manager=None, host_limiter=None, max_bytes=None, tracer=None):
+    """
+    Satu percobaan fetch HTML mentah. Mengembalikan tuple (html_content, error_msg, failure);
+    failure None jika berhasil, atau dict dari _fetch_failure untuk keputusan retry. Jika host_limiter
+    diberikan, slot host diambil sebelum request dan hasilnya dilaporkan ke limiter sesudahnya.
+    Dengan max_bytes, respons di-stream: yang bukan HTML ditolak tanpa mengunduh body-nya, dan body
+    dipotong setelah max_bytes (lihat _read_capped_body). Dengan tracer, durasi connect/TLS (jika
+    session_manager dibuat dengan traced=True), TTFB, dan unduhan body dicatat ke StageTracer.
+    """
+    host = urlparse(url).netloc
+    if host_limiter is not None:
+        host_limiter.acquire(host)
+    start = time.monotonic()
+    failure = None
+    if tracer is not None:
+        begin_stage_capture()
+    try:
+        session_manager = session_manager or get_default_session_manager()
+        if max_bytes or tracer is not None:
+            request_start = time.perf_counter()
+            with session_manager.get(url, stream=True) as response:
+                headers_received = time.perf_counter()
+                # TTFB tanpa waktu membuka koneksi baru, yang sudah tercatat sebagai connect/tls
+                record_stage('ttfb', headers_received - request_start - captured_stage_seconds('connect', 'tls'))
+                response.raise_for_status()
+                if max_bytes:
+                    html_content, error_msg, failure = _read_capped_body(response, max_bytes)
+                else:
+                    html_content, error_msg = response.content, None
+                record_stage('download', time.perf_counter() - headers_received, len(html_content or b''))
+                return html_content, error_msg, failure
+        response = session_manager.get(url)
+        response.raise_for_status() # Akan memunculkan HTTPError untuk status kode 4xx/5xx
+        return response.content, None, None
+
+    except requests.exceptions.HTTPError as e:
+        failure = _http_failure(e.response.status_code, e.response.headers.get('Retry-After'))
+        error_msg = f"HTTP Error: {e.response.status_code} - {e.response.reason}"
+        return None, error_msg, failure
+    except requests.exceptions.ConnectionError as e:
+        # ConnectTimeout turunan ConnectionError sekaligus Timeout
+        failure = _fetch_failure('throttled' if isinstance(e, requests.exceptions.Timeout) else 'error')
+        error_msg = f"Connection Error: {e}"
+        return None, error_msg, failure
+    except requests.exceptions.Timeout as e:
+        failure = _fetch_failure('throttled')
+        error_msg = f"Timeout Error: {e}"
+        return None, error_msg, failure
+    except requests.exceptions.RequestException as e:
+        failure = _fetch_failure('error')
+        error_msg = f"Requests Error: {e}"
+        return None, error_msg, failure
+    except Exception as e:
+        failure = _fetch_failure('fatal')
+        error_msg = f"Unexpected Error: {e}"
+        return None, error_msg, failure
+    finally:
+        if host_limiter is not None:
+            host_limiter.release(host, time.monotonic() - start, failure)
+        if tracer is not None:
+            tracer.add_stages(url, end_stage_capture())
+
+def fetch_article_html(url, session_manager=None, max_bytes=None):
+    """Tahap I/O saja: mengunduh HTML mentah satu URL (satu percobaan). Mengembalikan tuple (html_content, error_msg)."""
+    html_content, error_msg, _ = fetch_article_attempt(url, session_manager, max_bytes=max_bytes)
+    return html_content, error_msg
+
+def _build_article_result_safely(html_content, url, thread_name, extraction_backend=None, page_filter=None, tracer=None):
+    """
+    Seperti build_article_result, tetapi pengecualian parsing dikembalikan sebagai pesan error.
+    page_filter(url, html_content) opsional dijalankan sebelum parsing; jika mengembalikan alasan,
+    halaman dilewati tanpa di-parse (mis. duplikat persis dari ContentDedupIndex).
+    Dengan tracer, durasi parse/select dicatat dan sebagian ekstraksi diprofilkan (profile_every).
+    """
+    if tracer is not None:
+        begin_stage_capture()
+    try:
+        if page_filter is not None:
+            skip_reason = page_filter(url, html_content)
+            if skip_reason:
+                return None, skip_reason
+        if tracer is not None and tracer.should_profile():
+            return tracer.profile_call(build_article_result, html_content, url, thread_name, extraction_backend)
+        return build_article_result(html_content, url, thread_name, extraction_backend)
+    except Exception as e:
+        return None, f"Unexpected Error: {e}"
+    finally:
+        if tracer is not None:
+            tracer.add_stages(url, end_stage_capture())
+
+def _build_article_result_in_process(html_content, url, thread_name, backend_name, profile_path, trace=False):
+    """
+    Dijalankan di worker process pool. Backend dibuat sekali per proses; profil selektor yang
+    dipelajari untuk host ini ikut dikembalikan agar proses induk dapat menggabung dan menyimpannya.
+    Dengan trace=True, durasi parse/select ikut dikembalikan untuk StageTracer di proses induk.
+    """
+    extraction_backend = get_extraction_backend(backend_name, profile_path)
+    if trace:
+        begin_stage_capture()
+    result, error_reason = _build_article_result_safely(html_content, url, thread_name, extraction_backend)
+    stages = end_stage_capture() if trace else None
+    return result, error_reason, extraction_backend.profile_for(urlparse(url).netloc), stages
+
+class ThreadedFetchEngine:
+    """
+    Engine bawaan: setiap URL diambil dengan panggilan requests yang blocking di ThreadPoolExecutor.
+    max_concurrency adalah jumlah worker; di dalamnya AdaptiveHostLimiter menentukan berapa yang
+    boleh menghubungi host yang sama, dan URL yang gagal sementara dicoba ulang lewat RetryQueue.
+    """
+    name = 'thread'
+
+    def __init__(self, max_concurrency=16, per_host_limit=None, keep_alive=True, extraction_backend=None, page_filter=None,
+                 retry_policy=None, adaptive=True, max_response_bytes=None, tracer=None):
+        self.max_concurrency = max_concurrency
+        self.extraction_backend = extraction_backend or get_extraction_backend()
+        self.page_filter = page_filter
+        self.max_response_bytes = max_response_bytes
+        self.tracer = tracer
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.host_limiter = AdaptiveHostLimiter(per_host_limit or max_concurrency, adaptive=adaptive)
+        self.retry_count = 0
+        # Jumlah worker sudah menjadi batas global; per_host_limit menentukan ukuran pool koneksi per host
+        self.session_manager = PooledHTTPSessionManager(pool_maxsize=per_host_limit or max_concurrency, keep_alive=keep_alive,
+                                                        traced=tracer is not None)
+
+    def _fetch_and_build(self, url):
+        html_content, error_msg, failure = fetch_article_attempt(url, self.session_manager, self.host_limiter, self.max_response_bytes, self.tracer)
+        if error_msg:
+            return None, error_msg, failure
+        result, error_reason = _build_article_result_safely(html_content, url, threading.current_thread().name, self.extraction_backend, self.page_filter,
+                                                            self.tracer)
+        return result, error_reason, None
+
+    def run(self, article_urls, on_complete):
+        """Menjalankan scraping dan memanggil on_complete(url, result, error_reason) untuk setiap URL."""
+        url_queue = RetryQueue(article_urls, self.retry_policy)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # Future yang sedang berjalan dipetakan ke (URL, nomor percobaan); jumlahnya dibatasi jumlah worker
+            futures_map = {}
+            while True:
+                wait_seconds = None
+                while len(futures_map) < self.max_concurrency:
+                    item, wait_seconds = url_queue.poll()
+                    if item is None:
+                        break
+                    futures_map[executor.submit(self._fetch_and_build, item[0])] = item
+                if not futures_map:
+                    if wait_seconds is None:
+                        break
+                    time.sleep(wait_seconds) # Hanya retry tertunda yang tersisa
+                    continue
+
+                # Bangun lebih awal jika retry tertunda jatuh tempo dan masih ada worker kosong
+                timeout = wait_seconds if len(futures_map) < self.max_concurrency and wait_seconds != math.inf else None
+                done, _ = wait(futures_map, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    original_url, attempt = futures_map.pop(future) # Dapatkan URL asli dari future yang selesai
+                    try:
+                        # Dapatkan hasil dan pesan error dari fungsi fetch
+                        result, error_reason, failure = future.result()
+                    except Exception as e:
+                        # Tangani pengecualian yang sangat jarang terjadi jika future.result() itu sendiri gagal
+                        result, error_reason, failure = None, f"Kesalahan tak terduga saat mendapatkan hasil: {e}", None
+                    if url_queue.finish(original_url, attempt, failure):
+                        continue # Dijadwalkan ulang dengan backoff
+                    on_complete(original_url, result, _with_attempt_count(error_reason, attempt))
+        self.retry_count += url_queue.retry_count
+
+    def connection_stats(self):
+        return self.session_manager.connection_stats()
+
+    def host_limit_stats(self):
+        return self.host_limiter.snapshot()
+
+class AsyncioFetchEngine:
+    """
+    Engine asyncio berbasis aiohttp: ratusan koneksi dapat terbuka bersamaan.
+    Jumlah request yang berjalan dibatasi secara global dan per host (adaptif, lewat
+    AdaptiveHostLimiter, dengan per_host_limit sebagai batas atas); parsing HTML
+    dijalankan di thread pool kecil agar event loop tidak tertahan oleh BeautifulSoup.
+    """
+    name = 'asyncio'
+
+    def __init__(self, max_concurrency=200, per_host_limit=20, keep_alive=True, extraction_backend=None, page_filter=None, parse_workers=None,
+                 retry_policy=None, adaptive=True, max_response_bytes=None, tracer=None):
+        self.max_concurrency = max_concurrency
+        self.extraction_backend = extraction_backend or get_extraction_backend()
+        self.page_filter = page_filter
+        self.max_response_bytes = max_response_bytes
+        self.tracer = tracer
+        self.per_host_limit = per_host_limit
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.host_limiter = AdaptiveHostLimiter(per_host_limit, adaptive=adaptive)
+        self.retry_count = 0
+        self.parse_workers = parse_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._connection_counts = defaultdict(lambda: {'requests': 0, 'new_connections': 0, 'reused_connections': 0})
+
+    def run(self, article_urls, on_complete):
+        """Menjalankan scraping dan memanggil on_complete(url, result, error_reason) untuk setiap URL."""
+        _load_aiohttp()
+        asyncio.run(self._run(article_urls, on_complete))
+
+    async def _run(self, article_urls, on_complete):
+        loop = asyncio.get_running_loop()
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host_limit,
+                                         ttl_dns_cache=300, force_close=not self.keep_alive)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        url_queue = RetryQueue(article_urls, self.retry_policy)
+        trace_configs = [self._connection_trace_config()]
+        if self.tracer is not None:
+            trace_configs.append(self._stage_trace_config())
+
+        with ThreadPoolExecutor(max_workers=self.parse_workers, thread_name_prefix='AsyncParse') as parse_executor:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=DEFAULT_REQUEST_HEADERS,
+                                             trace_configs=trace_configs) as session:
+
+                async def worker():
+                    # Setiap worker menarik URL berikutnya dari antrean bersama, sehingga jumlah
+                    # coroutine tetap sebesar batas global walaupun daftar URL berisi puluhan ribu baris
+                    while True:
+                        item = await url_queue.get_async()
+                        if item is None:
+                            break
+                        url, attempt = item
+                        html_content, error_reason, failure = await self._fetch_html(session, url)
+                        if url_queue.finish(url, attempt, failure):
+                            continue # Dijadwalkan ulang dengan backoff
+                        result = None
+                        if not error_reason:
+                            result, error_reason = await loop.run_in_executor(parse_executor, self._build_article_result_in_thread, html_content, url)
+                        on_complete(url, result, _with_attempt_count(error_reason, attempt))
+
+                workers = [asyncio.create_task(worker()) for _ in range(_worker_count(article_urls, self.max_concurrency))]
+                await asyncio.gather(*workers)
+        self.retry_count += url_queue.retry_count
+
+    def _build_article_result_in_thread(self, html_content, url):
+        """Pembungkus build_article_result untuk thread parsing; thread_id diisi nama thread parser."""
+        return _build_article_result_safely(html_content, url, threading.current_thread().name, self.extraction_backend, self.page_filter,
+                                            self.tracer)
+
+    def _stage_trace_config(self):
+        """
+        TraceConfig aiohttp untuk tahap dns, connect (termasuk TLS, yang tidak dipisahkan aiohttp) dan
+        ttfb; hasilnya ditampung di trace_request_ctx milik request dan dicatat oleh _fetch_html.
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        def stages(context):
+            return context.trace_request_ctx['stages']
+
+        async def on_request_start(session, context, params):
+            context.request_start = time.perf_counter()
+
+        async def on_dns_resolvehost_start(session, context, params):
+            context.dns_start = time.perf_counter()
+
+        async def on_dns_resolvehost_end(session, context, params):
+            stages(context)['dns'] = [time.perf_counter() - context.dns_start, 0]
+
+        async def on_connection_create_start(session, context, params):
+            context.connect_start = time.perf_counter()
+
+        async def on_connection_create_end(session, context, params):
+            dns_seconds = stages(context).get('dns', [0.0])[0]
+            stages(context)['connect'] = [time.perf_counter() - context.connect_start - dns_seconds, 0]
+
+        async def on_request_end(session, context, params):
+            opened = sum(stages(context).get(stage, [0.0])[0] for stage in ('dns', 'connect'))
+            stages(context)['ttfb'] = [time.perf_counter() - context.request_start - opened, 0]
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    def _connection_trace_config(self):
+        """TraceConfig aiohttp untuk menghitung koneksi baru vs. koneksi keep-alive yang dipakai ulang."""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            context.host = f"{params.url.host}:{params.url.port}"
+            self._connection_counts[context.host]['requests'] += 1
+
+        async def on_connection_create_end(session, context, params):
+            self._connection_counts[context.host]['new_connections'] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self._connection_counts[context.host]['reused_connections'] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def connection_stats(self):
+        return {host: dict(counts) for host, counts in sorted(self._connection_counts.items())}
+
+    def host_limit_stats(self):
+        return self.host_limiter.snapshot()
+
+    async def _fetch_html(self, session, url):
+        """Satu percobaan fetch di bawah slot AdaptiveHostLimiter. Mengembalikan (html_content, error_msg, failure)."""
+        host = urlparse(url).netloc
+        await self.host_limiter.acquire_async(host)
+        start = time.monotonic()
+        failure = None
+        trace_ctx = {'stages': {}} if self.tracer is not None else None
+        try:
+            async with session.get(url, trace_request_ctx=trace_ctx) as response:
+                if response.status >= 400:
+                    failure = _http_failure(response.status, response.headers.get('Retry-After'))
+                    return None, f"HTTP Error: {response.status} - {response.reason}", failure
+                body_start = time.perf_counter()
+                html_content, error_msg, failure = await self._read_body(response)
+                if trace_ctx is not None:
+                    trace_ctx['stages']['download'] = [time.perf_counter() - body_start, len(html_content or b'')]
+                return html_content, error_msg, failure
+
+        except asyncio.TimeoutError as e:
+            failure = _fetch_failure('throttled')
+            return None, f"Timeout Error: {e}", failure
+        except aiohttp.ClientConnectionError as e:
+            failure = _fetch_failure('error')
+            return None, f"Connection Error: {e}", failure
+        except aiohttp.ClientError as e:
+            failure = _fetch_failure('error')
+            return None, f"Requests Error: {e}", failure
+        except Exception as e:
+            failure = _fetch_failure('fatal')
+            return None, f"Unexpected Error: {e}", failure
+        finally:
+            self.host_limiter.release(host, time.monotonic() - start, failure)
+            if trace_ctx is not None:
+                self.tracer.add_stages(url, trace_ctx['stages'])
+
+    async def _read_body(self, response):
+        """Membaca body respons sukses, dengan cek Content-Type dan batas byte jika max_response_bytes diatur."""
+        if not self.max_response_bytes:
+            return await response.read(), None, None
+        # Batas waktu total ClientTimeout sudah mencakup unduhan body, jadi cukup batas byte di sini
+        media_type = non_html_content_type(response.headers.get('Content-Type'))
+        if media_type:
+            return None, f"Konten bukan HTML ({media_type})", _fetch_failure('fatal')
+        chunks = []
+        received = 0
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= self.max_response_bytes:
+                break
+        return b''.join(chunks)[:self.max_response_bytes], None, None
+
+
+class PipelinedFetchEngine:
+    """
+    Pipeline dua tahap: thread I/O hanya mengunduh HTML mentah ke antrean berukuran terbatas,
+    lalu process pool seukuran jumlah core melakukan parsing/ekstraksi dan hanya mengembalikan
+    dict hasil yang kecil. Parsing yang CPU-bound tidak lagi berebut GIL dengan thread I/O, dan
+    antrean penuh membuat thread I/O menunggu (backpressure) sehingga memori tetap datar.
+    """
+    name = 'pipeline'
+
+    _FETCHER_DONE = object() # Penanda bahwa satu thread I/O sudah kehabisan URL
+
+    def __init__(self, max_concurrency=16, per_host_limit=None, keep_alive=True, extraction_backend=None, page_filter=None, parse_processes=None, queue_size=None,
+                 retry_policy=None, adaptive=True, max_response_bytes=None, tracer=None):
+        self.max_concurrency = max_concurrency
+        self.max_response_bytes = max_response_bytes
+        self.tracer = tracer
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.host_limiter = AdaptiveHostLimiter(per_host_limit or max_concurrency, adaptive=adaptive)
+        self.retry_count = 0
+        # Backend di proses induk hanya menampung profil selektor gabungan; ekstraksi terjadi di worker process
+        self.extraction_backend = extraction_backend or get_extraction_backend()
+        # page_filter dijalankan di proses induk (thread dispatcher) sebelum halaman dikirim ke process pool
+        self.page_filter = page_filter
+        self.parse_processes = parse_processes or os.cpu_count() or 1
+        self.queue_size = queue_size or self.parse_processes * 4
+        self.session_manager = PooledHTTPSessionManager(pool_maxsize=per_host_limit or max_concurrency, keep_alive=keep_alive,
+                                                        traced=tracer is not None)
+
+    def run(self, article_urls, on_complete):
+        """Menjalankan scraping dan memanggil on_complete(url, result, error_reason) untuk setiap URL."""
+        fetched_pages = queue.Queue(maxsize=self.queue_size)
+        url_queue = RetryQueue(article_urls, self.retry_policy)
+        fetcher_count = _worker_count(article_urls, self.max_concurrency)
+
+        def fetch_worker():
+            thread_name = threading.current_thread().name
+            while True:
+                item = url_queue.get()
+                if item is None:
+                    break
+                url, attempt = item
+                html_content, error_msg, failure = fetch_article_attempt(url, self.session_manager, self.host_limiter, self.max_response_bytes,
+                                                                         self.tracer)
+                # Retry diputuskan di thread I/O; halaman yang sudah terunduh tidak pernah diambil ulang
+                if url_queue.finish(url, attempt, failure):
+                    continue
+                fetched_pages.put((url, html_content, _with_attempt_count(error_msg, attempt), thread_name)) # Blok jika antrean penuh
+            fetched_pages.put(self._FETCHER_DONE)
+
+        # 'spawn' dipakai karena proses ini sudah memiliki banyak thread (GUI, I/O); fork dari proses
+        # multithread bisa mewarisi lock yang sedang terkunci
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.parse_processes, mp_context=mp_context) as parse_executor:
+            fetchers = [threading.Thread(target=fetch_worker, name=f"PipelineFetch_{i}", daemon=True) for i in range(fetcher_count)]
+            for fetcher in fetchers:
+                fetcher.start()
+
+            # Batas jumlah halaman yang sedang di-parse, agar HTML mentah tidak menumpuk di antrean process pool
+            max_pending = self.parse_processes * 2
+            pending = {}
+            finished_fetchers = 0
+
+            def deliver(done_futures):
+                for future in done_futures:
+                    url = pending.pop(future)
+                    try:
+                        result, error_reason, learned_profile, stages = future.result()
+                        self.extraction_backend.merge_profile(urlparse(url).netloc, learned_profile)
+                        if self.tracer is not None:
+                            self.tracer.add_stages(url, stages)
+                    except Exception as e:
+                        result, error_reason = None, f"Kesalahan tak terduga saat mendapatkan hasil: {e}"
+                    on_complete(url, result, error_reason)
+
+            while finished_fetchers < fetcher_count or pending:
+                if len(pending) >= max_pending or finished_fetchers == fetcher_count:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    deliver(done)
+                    continue
+                try:
+                    item = fetched_pages.get(timeout=0.05)
+                except queue.Empty:
+                    if pending:
+                        done, _ = wait(pending, timeout=0, return_when=FIRST_COMPLETED)
+                        deliver(done)
+                    continue
+
+                if item is self._FETCHER_DONE:
+                    finished_fetchers += 1
+                    continue
+                url, html_content, error_msg, thread_name = item
+                if not error_msg and self.page_filter is not None:
+                    try:
+                        error_msg = self.page_filter(url, html_content)
+                    except Exception as e:
+                        error_msg = f"Unexpected Error: {e}"
+                if error_msg:
+                    on_complete(url, None, error_msg)
+                    continue
+                future = parse_executor.submit(_build_article_result_in_process, html_content, url, thread_name,
+                                               self.extraction_backend.name, self.extraction_backend.profile_path, self.tracer is not None)
+                pending[future] = url
+
+            for fetcher in fetchers:
+                fetcher.join()
+        self.retry_count += url_queue.retry_count
+
+    def connection_stats(self):
+        return self.session_manager.connection_stats()
+
+    def host_limit_stats(self):
+        return self.host_limiter.snapshot()
+
+FETCH_ENGINES = {
+    ThreadedFetchEngine.name: ThreadedFetchEngine,
+    AsyncioFetchEngine.name: AsyncioFetchEngine,
+    PipelinedFetchEngine.name: PipelinedFetchEngine,
+}
+
+def create_fetch_engine(name, max_concurrency=None, per_host_limit=None, keep_alive=True, extraction_backend='bs4', page_filter=None,
+                        max_retries=DEFAULT_MAX_RETRIES, adaptive=True, max_response_bytes=None, tracer=None):
+    """
+    Membuat engine fetch berdasarkan nama; batas yang None memakai nilai bawaan engine.
+    Dengan adaptive=True batas konkurensi per host dimulai kecil dan naik/turun sesuai respons host
+    (per_host_limit menjadi batas atasnya); dengan adaptive=False batasnya tetap per_host_limit.
+    Dengan max_response_bytes, respons di-stream dengan cek Content-Type dan dipotong pada batas itu.
+    Dengan tracer (StageTracer), durasi setiap tahap fetch dan parsing dicatat per URL.
+    """
+    if name not in FETCH_ENGINES:
+        raise ValueError(f"Engine fetch tidak dikenal: '{name}'. Pilihan: {', '.join(FETCH_ENGINES)}")
+    options = {'keep_alive': keep_alive, 'extraction_backend': get_extraction_backend(extraction_backend), 'page_filter': page_filter,
+               'retry_policy': RetryPolicy(max_retries), 'adaptive': adaptive, 'max_response_bytes': max_response_bytes,
+               'tracer': tracer}
+    if max_concurrency:
+        options['max_concurrency'] = max_concurrency
+    if per_host_limit:
+        options['per_host_limit'] = per_host_limit
+    return FETCH_ENGINES[name](**options)
+
+CSV_FIELDNAMES = ['url', 'title', 'word_count',
+                  'author', 'publish_date', 'meta_description',
+                  'content_preview', 'thread_id', 'timestamp']
+
+def result_to_csv_row(result):
+    """Membentuk satu baris CSV dari dict hasil; newline dibersihkan agar satu artikel = satu baris."""
+    csv_row = {}
+    for field in CSV_FIELDNAMES:
+        value = result.get(field, '')
+        if isinstance(value, str):
+            # Bersihkan newline dari string sebelum menulis ke CSV
+            value = value.replace('\n', ' ').replace('\r', ' ')
+        csv_row[field] = value
+    return csv_row
+
+def _truncate_partial_last_line(path):
+    """Membuang baris terakhir yang terpotong (mis. karena crash saat menulis) agar file bisa di-append lagi."""
+    with open(path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+        # Mundur blok demi blok sampai menemukan newline terakhir
+        position = size
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            newline_index = f.read(step).rfind(b'\n')
+            if newline_index != -1:
+                f.truncate(position + newline_index + 1)
+                return
+        f.truncate(0)
+
+class CheckpointedCSVWriter:
+    """
+    Menulis hasil ke CSV secara bertahap (per batch) selama scraping berjalan, ditambah file
+    checkpoint JSONL berisi URL yang sudah selesai/gagal. Dengan resume=True, CSV lama di-append
+    dan URL yang tercatat di checkpoint maupun CSV dilewati, sehingga crawl panjang yang terputus
+    dapat dilanjutkan tanpa mengambil ulang halaman. completed_urls berisi URL berhasil dan gagal,
+    done_urls hanya URL yang berhasil (ada barisnya di CSV).
+    """
+
+    def __init__(self, csv_path, checkpoint_path=None, batch_size=50, resume=False):
+        self.csv_path = csv_path
+        self.checkpoint_path = checkpoint_path or csv_path + '.checkpoint.jsonl'
+        self.batch_size = batch_size
+        self.completed_urls = set()
+        self.done_urls = set()
+        self._pending_rows = []
+        self._pending_checkpoints = []
+        self._lock = threading.Lock()
+
+        output_dir = os.path.dirname(os.path.abspath(csv_path))
+        os.makedirs(output_dir, exist_ok=True)
+
+        resuming = resume and os.path.exists(csv_path) and os.path.getsize(csv_path) > 0
+        if resuming:
+            _truncate_partial_last_line(csv_path)
+            self.done_urls.update(self._read_csv_urls())
+            self.completed_urls.update(self.done_urls)
+            if os.path.exists(self.checkpoint_path):
+                _truncate_partial_last_line(self.checkpoint_path)
+                for url, status in self._read_checkpoint_entries():
+                    self.completed_urls.add(url)
+                    if status == 'done':
+                        self.done_urls.add(url)
+
+        self._csv_file = open(csv_path, 'a' if resuming else 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDNAMES)
+        if not resuming:
+            self._csv_writer.writeheader()
+        self._checkpoint_file = open(self.checkpoint_path, 'a' if resuming else 'w', encoding='utf-8')
+
+    def _read_csv_urls(self):
+        with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row.get('url'):
+                    yield row['url']
+
+    def _read_checkpoint_entries(self):
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    yield entry['url'], entry.get('status')
+                except (ValueError, KeyError):
+                    continue # Baris rusak diabaikan; URL-nya akan diambil ulang
+
+    def write_result(self, result):
+        with self._lock:
+            self._pending_rows.append(result_to_csv_row(result))
+            self._pending_checkpoints.append({'url': result['url'], 'status': 'done'})
+            self.completed_urls.add(result['url'])
+            self.done_urls.add(result['url'])
+            if len(self._pending_checkpoints) >= self.batch_size:
+                self._flush_locked()
+
+    def record_failure(self, url, reason):
+        with self._lock:
+            self._pending_checkpoints.append({'url': url, 'status': 'failed', 'reason': reason})
+            self.completed_urls.add(url)
+            if len(self._pending_checkpoints) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        # CSV ditulis dan di-fsync lebih dulu; jika crash terjadi sebelum checkpoint tertulis,
+        # URL-nya tetap dilewati saat resume karena sudah ada di CSV
+        if self._pending_rows:
+            self._csv_writer.writerows(self._pending_rows)
+            self._csv_file.flush()
+            os.fsync(self._csv_file.fileno())
+        if self._pending_checkpoints:
+            self._checkpoint_file.write(''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in self._pending_checkpoints))
+            self._checkpoint_file.flush()
+            os.fsync(self._checkpoint_file.fileno())
+        self._pending_rows = []
+        self._pending_checkpoints = []
+
+    def close(self):
+        with self._lock:
+            if self._csv_file.closed:
+                return
+            self._flush_locked()
+            self._csv_file.close()
+            self._checkpoint_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+# Normalisasi URL dan indeks deduplikasi
+TRACKING_QUERY_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', '_ga', '_gl',
+    'ref', 'ref_src', 'tag_from', 'amp', 'outputtype', 'cmpid', 'spm',
+}
+TRACKING_QUERY_PREFIXES = ('utm_', 'pk_', 'mtm_')
+MOBILE_HOST_PREFIXES = ('m.', 'mobile.', 'amp.')
+
+def canonicalize_url(url):
+    """
+    Bentuk kanonik sebuah URL artikel: skema/host huruf kecil, tanpa port bawaan, tanpa prefiks host
+    mobile/AMP, tanpa segmen path /amp, tanpa parameter pelacak (utm_*, fbclid, ...), parameter
+    sisanya diurutkan, dan tanpa fragment. Varian dari artikel yang sama menjadi satu URL.
+    """
+    parsed_url = urlparse(url.strip())
+    scheme = parsed_url.scheme.lower()
+    host = (parsed_url.hostname or '').lower()
+    for prefix in MOBILE_HOST_PREFIXES:
+        if host.startswith(prefix) and host.count('.') >= 2:
+            host = host[len(prefix):]
+            if host.count('.') == 1:
+                host = 'www.' + host # m.detik.com -> www.detik.com, m.finance.detik.com -> finance.detik.com
+            break
+    if ':' in host:
+        host = f"[{host}]" # hostname IPv6 dikembalikan urlparse tanpa kurung siku
+    port = parsed_url.port
+    netloc = host if port is None or (scheme, port) in (('http', 80), ('https', 443)) else f"{host}:{port}"
+
+    path_segments = [segment for segment in parsed_url.path.split('/') if segment and segment.lower() != 'amp']
+    path = '/' + '/'.join(path_segments)
+    if path_segments and parsed_url.path.endswith('/'):
+        path += '/'
+
+    query_params = sorted(
+        (key, value) for key, value in parse_qsl(parsed_url.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_QUERY_PARAMS and not key.lower().startswith(TRACKING_QUERY_PREFIXES)
+    )
+    return urlunparse((scheme, netloc, path, '', urlencode(query_params), ''))
+
+def validate_url(url):
+    """
+    Memunculkan ValueError jika URL tidak dapat diurai (mis. port bukan angka seperti
+    http://a.com:abc/ atau IPv6 tanpa ']' seperti http://[::1/), sama seperti canonicalize_url.
+    """
+    urlparse(url).port
+    return url
+
+def url_host(url):
+    """netloc sebuah URL, atau '' jika URL tidak dapat diurai."""
+    try:
+        return urlparse(url).netloc
+    except ValueError:
+        return ''
+
+DEFAULT_DEDUP_INDEX_PATH = os.path.join('.', 'dedup_index.sqlite')
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4 # 4 pita x 16 bit: dua fingerprint dengan jarak Hamming <= 3 pasti sama di minimal satu pita
+NEAR_DUPLICATE_MAX_DISTANCE = 3
+
+def simhash(text, shingle_size=3):
+    """Fingerprint SimHash 64-bit dari shingle kata; teks yang hampir sama menghasilkan bit yang hampir sama."""
+    words = text.lower().split()
+    if len(words) < shingle_size:
+        shingles = [' '.join(words)] if words else []
+    else:
+        shingles = [' '.join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)]
+    vector = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        shingle_hash = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            vector[bit] += 1 if shingle_hash >> bit & 1 else -1
+    return sum(1 << bit for bit in range(SIMHASH_BITS) if vector[bit] > 0)
+
+class ContentDedupIndex:
+    """
+    Indeks deduplikasi persisten berbasis SQLite: URL kanonik yang sudah berhasil di-scrape, hash
+    persis dari HTML mentah (duplikat dilewati sebelum parsing), dan fingerprint SimHash teks hasil
+    ekstraksi yang dipecah menjadi pita 16-bit untuk mencari near-duplicate. Semua lookup memakai
+    primary key ter-indeks, dan cache halaman SQLite dibatasi sehingga memori tetap kecil walau
+    indeks berisi jutaan entri. Setiap penulisan langsung di-commit (murah dengan WAL) dan koneksi
+    menunggu hingga busy_timeout detik saat file dikunci, sehingga beberapa worker frontier dapat
+    berbagi satu indeks tanpa transaksi tulis yang lama menahan kunci.
+    """
+
+    def __init__(self, path=DEFAULT_DEDUP_INDEX_PATH, cache_size_kb=16384, busy_timeout=30.0):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False)
+        self._connection.executescript(f"""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA cache_size=-{int(cache_size_kb)};
+            CREATE TABLE IF NOT EXISTS seen_urls (url TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS content_hashes (hash BLOB PRIMARY KEY, url TEXT) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS simhash_bands (
+                band INTEGER, band_value INTEGER, fingerprint INTEGER, url TEXT,
+                PRIMARY KEY (band, band_value, fingerprint)
+            ) WITHOUT ROWID;
+        """)
+
+    def is_url_seen(self, canonical_url):
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM seen_urls WHERE url = ?", (canonical_url,)).fetchone() is not None
+
+    def mark_url_seen(self, canonical_url):
+        with self._lock:
+            self._connection.execute("INSERT OR IGNORE INTO seen_urls (url) VALUES (?)", (canonical_url,))
+            self._connection.commit()
+
+    def check_and_add_content(self, url, html_content):
+        """Mengembalikan URL pemilik pertama jika HTML ini persis sama dengan halaman yang sudah ada, selain itu None."""
+        content_hash = hashlib.blake2b(html_content, digest_size=16).digest()
+        with self._lock:
+            cursor = self._connection.execute("INSERT OR IGNORE INTO content_hashes (hash, url) VALUES (?, ?)", (content_hash, url))
+            self._connection.commit()
+            if cursor.rowcount == 1:
+                return None
+            row = self._connection.execute("SELECT url FROM content_hashes WHERE hash = ?", (content_hash,)).fetchone()
+            return row[0] if row and row[0] != url else None
+
+    def check_and_add_fingerprint(self, url, fingerprint, max_distance=NEAR_DUPLICATE_MAX_DISTANCE):
+        """Mengembalikan (url, jarak) dari near-duplicate terdekat; jika tidak ada, fingerprint disimpan dan None dikembalikan."""
+        # SQLite INTEGER bertanda 64-bit, jadi fingerprint disimpan dalam bentuk bertanda
+        signed_fingerprint = fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+        band_width = SIMHASH_BITS // SIMHASH_BANDS
+        band_mask = (1 << band_width) - 1
+        bands = [(band, fingerprint >> (band * band_width) & band_mask) for band in range(SIMHASH_BANDS)]
+        with self._lock:
+            best_match = None
+            for band, band_value in bands:
+                rows = self._connection.execute(
+                    "SELECT fingerprint, url FROM simhash_bands WHERE band = ? AND band_value = ?", (band, band_value))
+                for candidate, candidate_url in rows:
+                    if candidate_url == url:
+                        continue
+                    distance = bin((candidate & ((1 << 64) - 1)) ^ fingerprint).count('1')
+                    if distance <= max_distance and (best_match is None or distance < best_match[1]):
+                        best_match = (candidate_url, distance)
+            if best_match:
+                return best_match
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO simhash_bands (band, band_value, fingerprint, url) VALUES (?, ?, ?, ?)",
+                [(band, band_value, signed_fingerprint, url) for band, band_value in bands])
+            self._connection.commit()
+            return None
+
+    def page_filter(self, url, html_content):
+        """Filter pra-parsing untuk engine fetch: alasan lewati jika HTML persis duplikat, selain itu None."""
+        original_url = self.check_and_add_content(url, html_content)
+        if original_url:
+            return f"Duplikat konten: HTML sama persis dengan {original_url}"
+        return None
+
+    def close(self):
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
+
+DEFAULT_SEEN_FILTER_PATH = os.path.join('.', 'crawl_seen.bloom')
+BLOOM_FILE_MAGIC = b'TABLOOM1'
+
+class BloomFilter:
+    """
+    Himpunan URL yang sudah dilihat dalam bentuk Bloom filter: sekitar 1,8 byte per URL untuk tingkat
+    positif palsu 0,1% (10 juta URL kira-kira 18 MB), alih-alih set string Python yang memakan
+    ratusan byte per URL. Positif palsu berarti sebagian kecil URL baru dianggap sudah dilihat dan
+    dilewati; negatif palsu tidak pernah terjadi. Posisi bit dihitung dengan double hashing dari
+    satu digest blake2b. Dapat disimpan ke file dan dimuat lagi di run berikutnya.
+    """
+
+    def __init__(self, capacity=10_000_000, error_rate=0.001, path=None):
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                self._load(path)
+            except (OSError, ValueError) as e:
+                print(f"Filter URL '{path}' tidak dapat dibaca, mulai dari kosong: {e}")
+
+    def _load(self, path):
+        with open(path, 'rb') as f:
+            header = f.read(len(BLOOM_FILE_MAGIC) + 24)
+            if len(header) != len(BLOOM_FILE_MAGIC) + 24 or not header.startswith(BLOOM_FILE_MAGIC):
+                raise ValueError("bukan file Bloom filter")
+            bit_count, hash_count, count = (int.from_bytes(header[i:i + 8], 'big') for i in range(len(BLOOM_FILE_MAGIC), len(header), 8))
+            bits = bytearray(f.read())
+        if len(bits) != (bit_count + 7) // 8:
+            raise ValueError("ukuran file tidak sesuai")
+        # Ukuran filter yang tersimpan dipakai apa adanya, agar bit yang sudah ada tetap bermakna
+        self.bit_count, self.hash_count, self.count, self._bits = bit_count, hash_count, count, bits
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], 'little')
+        second_hash = int.from_bytes(digest[8:], 'little') | 1
+        return [(first_hash + i * second_hash) % self.bit_count for i in range(self.hash_count)]
+
+    def __contains__(self, item):
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def add(self, item):
+        """Menambahkan item; mengembalikan True jika item belum pernah dilihat (semua bitnya baru diset)."""
+        positions = self._positions(item)
+        with self._lock:
+            bits = self._bits
+            is_new = False
+            for position in positions:
+                mask = 1 << (position & 7)
+                if not bits[position >> 3] & mask:
+                    bits[position >> 3] |= mask
+                    is_new = True
+            if is_new:
+                self.count += 1
+                self._dirty = True
+            return is_new
+
+    def save(self):
+        """Menulis filter ke disk secara atomik, hanya jika ada perubahan."""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(BLOOM_FILE_MAGIC + b''.join(value.to_bytes(8, 'big') for value in (self.bit_count, self.hash_count, self.count)))
+                f.write(self._bits)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+DEFAULT_ARCHIVE_PATH = os.path.join('.', 'raw_html_archive.warc.gz')
+ARCHIVE_COMPRESSION_LEVEL = 6
+REEXTRACT_BATCH_SIZE = 64 # Record per tugas process pool; yang dikirim hanya (url, offset, panjang)
+
+def _archive_record_bytes(url, html_content):
+    """Satu record WARC 'resource' berisi HTML mentah, dikompresi sebagai member gzip tersendiri."""
+    header = (
+        "WARC/1.0\r\n"
+        "WARC-Type: resource\r\n"
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+        f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}\r\n"
+        f"WARC-Target-URI: {url}\r\n"
+        "Content-Type: text/html\r\n"
+        f"Content-Length: {len(html_content)}\r\n"
+        "\r\n"
+    ).encode('utf-8')
+    compressor = zlib.compressobj(ARCHIVE_COMPRESSION_LEVEL, zlib.DEFLATED, 31) # wbits=31: format gzip
+    return compressor.compress(header + html_content + b"\r\n\r\n") + compressor.flush()
+
+def _parse_archive_record(record):
+    """Mengurai record WARC yang sudah didekompresi menjadi (url, html_content)."""
+    header, _, rest = record.partition(b"\r\n\r\n")
+    fields = {}
+    for line in header.decode('utf-8').split("\r\n")[1:]:
+        key, _, value = line.partition(':')
+        fields[key.strip().lower()] = value.strip()
+    return fields.get('warc-target-uri'), rest[:int(fields.get('content-length', len(rest)))]
+
+def read_archive_record(buffer, offset, length):
+    """Membaca satu record dari buffer arsip (bytes atau mmap) pada offset/panjang dari indeks."""
+    return _parse_archive_record(zlib.decompress(buffer[offset:offset + length], 31))
+
+class RawHTMLArchive:
+    """
+    Arsip append-only HTML mentah hasil fetch, dalam format WARC ber-gzip per record (dapat dibaca
+    alat WARC standar). File indeks JSONL di sampingnya mencatat offset dan panjang setiap record,
+    sehingga satu halaman dapat dibaca langsung lewat mmap tanpa mendekompresi seluruh arsip.
+    Ditulis per batch seperti CheckpointedCSVWriter: arsip di-fsync sebelum indeks, dan record di
+    ujung arsip yang belum tercatat di indeks dipulihkan (atau dipotong jika tidak utuh) saat dibuka.
+    """
+
+    def __init__(self, path=DEFAULT_ARCHIVE_PATH, index_path=None, batch_size=50, writable=True):
+        self.path = path
+        self.index_path = index_path or path + '.idx.jsonl'
+        self.batch_size = batch_size
+        self.writable = writable
+        self.offsets = {} # URL -> (offset, panjang) record terbaru
+        self._pending_records = []
+        self._pending_index = []
+        self._lock = threading.Lock()
+        self._mmap = None
+        self._read_file = None
+
+        if writable:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            if os.path.exists(self.index_path):
+                _truncate_partial_last_line(self.index_path)
+        indexed_end, stale_entries = self._load_index()
+        self._end = os.path.getsize(path) if os.path.exists(path) else 0
+        if writable:
+            if stale_entries:
+                # Offset record yang hilang akan dipakai record baru; entri lamanya tidak boleh tertinggal di indeks
+                self._rewrite_index()
+            self._archive_file = open(path, 'ab')
+            self._index_file = open(self.index_path, 'a', encoding='utf-8')
+            if self._end > indexed_end:
+                self._recover_tail(indexed_end)
+        self._flushed_end = self._end
+
+    def _load_index(self):
+        """Memuat indeks; mengembalikan (offset akhir record terakhir yang tercatat, jumlah entri yang hilang dari arsip)."""
+        archive_size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        indexed_end = 0
+        stale_entries = 0
+        if not os.path.exists(self.index_path):
+            return indexed_end, stale_entries
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    offset, length = entry['offset'], entry['length']
+                except (ValueError, KeyError):
+                    continue
+                if offset + length <= archive_size: # Record yang hilang dari arsip diabaikan
+                    self.offsets[entry['url']] = (offset, length)
+                    indexed_end = max(indexed_end, offset + length)
+                else:
+                    stale_entries += 1
+        return indexed_end, stale_entries
+
+    def _rewrite_index(self):
+        """Menulis ulang indeks secara atomik dari self.offsets (satu entri per URL, urut offset)."""
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for url, (offset, length) in sorted(self.offsets.items(), key=lambda item: item[1]):
+                f.write(json.dumps({'url': url, 'offset': offset, 'length': length}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.index_path)
+
+    def _recover_tail(self, start):
+        """Mencatat ulang record utuh setelah offset `start` dan memotong member gzip yang terpotong."""
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            data = f.read()
+        position = 0
+        recovered = []
+        while position < len(data):
+            decompressor = zlib.decompressobj(31)
+            try:
+                record = decompressor.decompress(data[position:])
+            except zlib.error:
+                break
+            if not decompressor.eof:
+                break
+            length = len(data) - position - len(decompressor.unused_data)
+            url, _ = _parse_archive_record(record)
+            if url:
+                recovered.append({'url': url, 'offset': start + position, 'length': length})
+            position += length
+        if start + position < self._end:
+            self._archive_file.truncate(start + position)
+            self._end = start + position
+        for entry in recovered:
+            self.offsets[entry['url']] = (entry['offset'], entry['length'])
+        self._index_file.write(''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in recovered))
+        self._index_file.flush()
+        os.fsync(self._index_file.fileno())
+
+    def append(self, url, html_content):
+        record = _archive_record_bytes(url, html_content) # Kompresi di luar lock; zlib melepas GIL
+        with self._lock:
+            offset = self._end
+            self._end += len(record)
+            self._pending_records.append(record)
+            self._pending_index.append({'url': url, 'offset': offset, 'length': len(record)})
+            self.offsets[url] = (offset, len(record))
+            if len(self._pending_records) >= self.batch_size:
+                self._flush_locked()
+
+    def page_filter(self, url, html_content):
+        """Hook pra-parsing untuk engine fetch: menyimpan HTML mentah, tidak pernah melewati halaman."""
+        self.append(url, html_content)
+        return None
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._pending_records:
+            self._archive_file.write(b''.join(self._pending_records))
+            self._archive_file.flush()
+            os.fsync(self._archive_file.fileno())
+        if self._pending_index:
+            self._index_file.write(''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in self._pending_index))
+            self._index_file.flush()
+            os.fsync(self._index_file.fileno())
+        self._pending_records = []
+        self._pending_index = []
+        self._flushed_end = self._end
+
+    def _buffer(self, end):
+        """mmap arsip untuk dibaca; dipetakan ulang jika arsip sudah tumbuh melewati `end`."""
+        if self._mmap is None or len(self._mmap) < end:
+            if self._mmap is not None:
+                self._mmap.close()
+            if self._read_file is None:
+                self._read_file = open(self.path, 'rb')
+            self._mmap = mmap.mmap(self._read_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def get(self, url):
+        """HTML mentah terbaru untuk URL ini, atau None jika tidak ada di arsip."""
+        with self._lock:
+            if url not in self.offsets:
+                return None
+            offset, length = self.offsets[url]
+            if self.writable and offset + length > self._flushed_end:
+                self._flush_locked() # Record masih di buffer batch
+            return read_archive_record(self._buffer(offset + length), offset, length)[1]
+
+    def __contains__(self, url):
+        return url in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def close(self):
+        with self._lock:
+            if self.writable and not self._archive_file.closed:
+                self._flush_locked()
+                self._archive_file.close()
+                self._index_file.close()
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            if self._read_file is not None:
+                self._read_file.close()
+                self._read_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+# Dibuka sekali per worker process re-ekstraksi (lihat _init_reextract_worker)
+_reextract_archive_buffer = None
+
+def _init_reextract_worker(archive_path):
+    global _reextract_archive_buffer
+    archive_file = open(archive_path, 'rb') # Tetap terbuka selama umur process
+    _reextract_archive_buffer = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _reextract_batch_in_process(batch, backend_name, profile_path, trace=False):
+    """
+    Membaca record dari mmap arsip dan mengekstraksinya; hanya dict hasil (dan, dengan trace=True,
+    durasi parse/select per URL) yang dikirim balik.
+    """
+    extraction_backend = get_extraction_backend(backend_name, profile_path)
+    thread_name = multiprocessing.current_process().name
+    outcomes = []
+    for url, offset, length in batch:
+        try:
+            _, html_content = read_archive_record(_reextract_archive_buffer, offset, length)
+        except (zlib.error, ValueError) as e:
+            outcomes.append((url, None, f"Record arsip rusak: {e}", None))
+            continue
+        if trace:
+            begin_stage_capture()
+        result, error_reason = _build_article_result_safely(html_content, url, thread_name, extraction_backend)
+        outcomes.append((url, result, error_reason, end_stage_capture() if trace else None))
+    hosts = {urlparse(url).netloc for url, _, _ in batch}
+    return outcomes, {host: extraction_backend.profile_for(host) for host in hosts}
+
+def reextract_archive(archive_path, csv_output_path, extraction_backend='bs4', processes=None, log=print, on_success=None, tracer=None):
+    """
+    Mode re-ekstraksi: menjalankan ulang ekstraksi untuk setiap URL di arsip HTML mentah (record
+    terbaru per URL) di semua core, tanpa fetch ulang, dan menulis hasilnya ke CSV baru. Mengembalikan
+    dict ringkasan dengan bentuk yang sama seperti run_scraping_job() untuk log_scraping_summary().
+    Dengan tracer, durasi parse/select (dari worker process) dan penulisan CSV dicatat per URL.
+    Memunculkan OSError jika arsip tidak dapat dibaca atau file output tidak dapat dibuka.
+    """
+    if not os.path.exists(archive_path):
+        raise OSError(f"Arsip '{archive_path}' tidak ditemukan")
+    with RawHTMLArchive(archive_path, writable=False) as archive:
+        entries = sorted((offset, length, url) for url, (offset, length) in archive.offsets.items()) # Baca berurutan di disk
+    article_urls = [url for _, _, url in entries]
+    successful_results = []
+    failed_urls_info = []
+    backend = get_extraction_backend(extraction_backend)
+    analytics = LiveScrapingAnalytics()
+    processes = processes or os.cpu_count() or 1
+    log(f"Re-ekstraksi {len(entries)} halaman dari '{archive_path}' dengan {processes} proses (backend: {backend.name})...")
+
+    result_writer = CheckpointedCSVWriter(csv_output_path)
+    try:
+        batches = (entries[i:i + REEXTRACT_BATCH_SIZE] for i in range(0, len(entries), REEXTRACT_BATCH_SIZE))
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context,
+                                 initializer=_init_reextract_worker, initargs=(archive_path,)) as executor:
+            pending = set()
+            for batch in itertools.chain(batches, [None]):
+                # Jumlah batch yang sedang berjalan dibatasi agar hasil tidak menumpuk di memori
+                while pending and (batch is None or len(pending) >= processes * 2):
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        outcomes, learned_profiles = future.result()
+                        for host, profile in learned_profiles.items():
+                            backend.merge_profile(host, profile)
+                        for url, result, error_reason, stages in outcomes:
+                            analytics.record(url, result, error_reason)
+                            csv_start = time.perf_counter()
+                            if result:
+                                result_writer.write_result(result)
+                                successful_results.append({'url': url, 'title': result['title'], 'word_count': result['word_count']})
+                                if on_success:
+                                    on_success(url, result['word_count'], result['thread_id'])
+                            else:
+                                result_writer.record_failure(url, error_reason)
+                                failed_urls_info.append({'url': url, 'reason': error_reason})
+                            if tracer is not None:
+                                tracer.add_stages(url, stages)
+                                tracer.add_stage(url, 'csv', time.perf_counter() - csv_start)
+                                tracer.finish(url, error_reason if not result else None)
+                if batch is not None:
+                    pending.add(executor.submit(_reextract_batch_in_process, [(url, offset, length) for offset, length, url in batch],
+                                                backend.name, backend.profile_path, tracer is not None))
+        backend.save_profiles()
+    finally:
+        result_writer.close()
+    try:
+        analytics.save(live_analytics_path(csv_output_path), csv_output_path)
+    except OSError as e:
+        log(f"Statistik live tidak dapat disimpan: {e}")
+
+    return {
+        'urls_to_fetch': article_urls,
+        'invalid_urls': [],
+        'skipped_urls': set(),
+        'duplicate_urls': {},
+        'canonical_urls': {},
+        'successful_results': successful_results,
+        'failed_urls_info': failed_urls_info,
+        'connection_stats': None,
+        'host_limits': None,
+        'retried_attempts': 0,
+        'analytics': analytics,
+        'stage_summary': tracer.stage_summary() if tracer is not None else None,
+    }
+
+DEFAULT_FRONTIER_PATH = os.path.join('.', 'crawl_frontier.sqlite')
+DEFAULT_FRONTIER_SHARDS = 16
+DEFAULT_LEASE_SECONDS = 300
+FRONTIER_STATES = ('pending', 'leased', 'done', 'failed')
+
+def host_shard(url, shard_count):
+    """Kunci shard stabil per host: semua URL dari satu host selalu jatuh ke shard yang sama."""
+    digest = hashlib.blake2b(urlparse(url).netloc.lower().encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % shard_count
+
+class CrawlFrontier:
+    """
+    Antrean kerja persisten berbasis SQLite untuk scraping multi-proses/multi-mesin. Setiap URL
+    kanonik punya status pending/leased/done/failed. Worker menyewa (lease) sekumpulan URL untuk
+    waktu tertentu dan melaporkan hasilnya; sewa yang kedaluwarsa (worker crash) otomatis kembali
+    menjadi pending dan diberikan ke worker lain. Kolom shard (hash host) memungkinkan setiap worker
+    hanya mengambil sebagian host, sehingga beban per host tetap dikendalikan oleh satu worker.
+    """
+
+    def __init__(self, path=DEFAULT_FRONTIER_PATH, shard_count=DEFAULT_FRONTIER_SHARDS, busy_timeout=30.0):
+        self.path = path
+        self._lock = threading.Lock()
+        # isolation_level=None: transaksi diatur sendiri (BEGIN IMMEDIATE) agar lease antar-proses atomik
+        self._connection = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self._connection.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS frontier_meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY, host TEXT, shard INTEGER, state TEXT DEFAULT 'pending',
+                lease_owner TEXT, lease_expires REAL, attempts INTEGER DEFAULT 0, last_error TEXT, updated_at REAL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS frontier_by_state ON frontier (state, shard);
+            CREATE INDEX IF NOT EXISTS frontier_by_lease ON frontier (state, lease_expires);
+        """)
+        # Jumlah shard ditetapkan sekali saat frontier dibuat, supaya hash host tetap konsisten
+        self._connection.execute("INSERT OR IGNORE INTO frontier_meta (key, value) VALUES ('shard_count', ?)", (str(shard_count),))
+        self.shard_count = int(self._connection.execute("SELECT value FROM frontier_meta WHERE key = 'shard_count'").fetchone()[0])
+
+    def _transaction(self, statements):
+        """Menjalankan statements(connection) di dalam BEGIN IMMEDIATE ... COMMIT."""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                value = statements(self._connection)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+            return value
+
+    def add_urls(self, urls, canonicalize=True):
+        """
+        Menambahkan URL (dinormalisasi dengan canonicalize_url) sebagai pending; URL yang sudah ada
+        diabaikan. URL yang tidak dapat diurai langsung dicatat sebagai failed dengan alasannya.
+        """
+        now = time.time()
+        rows = []
+        invalid_rows = []
+        for url in urls:
+            try:
+                url = canonicalize_url(url) if canonicalize else validate_url(url)
+            except ValueError as e:
+                invalid_rows.append((url, f"URL tidak valid: {e}", now))
+                continue
+            rows.append((url, urlparse(url).netloc.lower(), host_shard(url, self.shard_count), now))
+
+        def insert(connection):
+            before = connection.total_changes
+            connection.executemany("INSERT OR IGNORE INTO frontier (url, host, shard, updated_at) VALUES (?, ?, ?, ?)", rows)
+            connection.executemany("INSERT OR IGNORE INTO frontier (url, host, shard, state, last_error, updated_at) "
+                                   "VALUES (?, '', 0, 'failed', ?, ?)", invalid_rows)
+            return connection.total_changes - before
+        return self._transaction(insert)
+
+    def lease(self, worker_id, limit=100, lease_seconds=DEFAULT_LEASE_SECONDS, shards=None):
+        """
+        Menyewa hingga `limit` URL pending untuk worker_id selama lease_seconds (opsional hanya dari
+        shard tertentu). Sewa kedaluwarsa milik worker mana pun dikembalikan ke pending lebih dulu.
+        """
+        def take(connection):
+            now = time.time()
+            connection.execute("UPDATE frontier SET state = 'pending', lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                               "WHERE state = 'leased' AND lease_expires < ?", (now, now))
+            query = "SELECT url FROM frontier WHERE state = 'pending'"
+            params = []
+            if shards is not None:
+                query += f" AND shard IN ({', '.join('?' * len(shards))})"
+                params.extend(shards)
+            query += " LIMIT ?"
+            params.append(limit)
+            urls = [row[0] for row in connection.execute(query, params)]
+            connection.executemany(
+                "UPDATE frontier SET state = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ? WHERE url = ?",
+                [(worker_id, now + lease_seconds, now, url) for url in urls])
+            return urls
+        return self._transaction(take)
+
+    def renew(self, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        """Memperpanjang semua sewa milik worker_id (heartbeat selama batch berjalan)."""
+        def extend(connection):
+            now = time.time()
+            return connection.execute("UPDATE frontier SET lease_expires = ?, updated_at = ? WHERE state = 'leased' AND lease_owner = ?",
+                                      (now + lease_seconds, now, worker_id)).rowcount
+        return self._transaction(extend)
+
+    def _finish(self, url, worker_id, state, error_reason):
+        def update(connection):
+            return connection.execute(
+                "UPDATE frontier SET state = ?, last_error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE url = ? AND state = 'leased' AND lease_owner = ?",
+                (state, error_reason, time.time(), url, worker_id)).rowcount == 1
+        return self._transaction(update)
+
+    def complete(self, url, worker_id, note=None):
+        """Menandai URL selesai. False jika sewanya sudah tidak dimiliki worker_id (kedaluwarsa dan diambil worker lain)."""
+        return self._finish(url, worker_id, 'done', note)
+
+    def fail(self, url, worker_id, error_reason):
+        return self._finish(url, worker_id, 'failed', error_reason)
+
+    def release(self, urls, worker_id):
+        """Mengembalikan URL yang belum diproses ke pending (mis. engine berhenti karena error)."""
+        def update(connection):
+            connection.executemany("UPDATE frontier SET state = 'pending', lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                                   "WHERE url = ? AND state = 'leased' AND lease_owner = ?",
+                                   [(time.time(), url, worker_id) for url in urls])
+        self._transaction(update)
+
+    def requeue_failed(self):
+        """Mengembalikan semua URL failed ke pending; mengembalikan jumlahnya."""
+        return self._transaction(lambda connection: connection.execute(
+            "UPDATE frontier SET state = 'pending', updated_at = ? WHERE state = 'failed'", (time.time(),)).rowcount)
+
+    def counts(self):
+        """Jumlah URL per status, termasuk status yang kosong."""
+        with self._lock:
+            counts = dict.fromkeys(FRONTIER_STATES, 0)
+            counts.update(self._connection.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state"))
+            return counts
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+class ScrapingJob:
+    """
+    Sumber daya satu job scraping tanpa GUI: CSV ber-checkpoint, indeks deduplikasi, arsip HTML,
+    LiveScrapingAnalytics, dan engine fetch yang dibuat sekali lalu dipakai oleh setiap panggilan
+    run(). run_scraping_job() menjalankannya satu kali; worker frontier memakai satu ScrapingJob
+    sepanjang hidupnya sehingga pool koneksi, status AIMD per host, dan process pool tidak dibangun
+    ulang untuk setiap batch. Argumennya sama dengan run_scraping_job(), ditambah skip_failed=False
+    (resume hanya melewati URL yang berhasil; URL yang gagal diambil ulang) dan keep_summary=False
+    (rincian per URL tidak ditahan di memori, hanya dilaporkan lewat callback).
+    Memunculkan OSError jika file output tidak dapat dibuka.
+    """
+
+    def __init__(self, csv_output_path, engine_name='thread', max_concurrency=None, per_host_limit=None,
+                 keep_alive=True, extraction_backend='bs4', resume=False, log=print, on_success=None,
+                 canonicalize=True, dedup_index_path=None, max_retries=DEFAULT_MAX_RETRIES, adaptive=True,
+                 archive_path=None, on_complete=None, on_page=None, analytics=None, max_response_bytes=None, tracer=None,
+                 skip_failed=True, keep_summary=True):
+        self.csv_output_path = csv_output_path
+        self.engine_name = engine_name
+        self.engine_options = dict(max_concurrency=max_concurrency, per_host_limit=per_host_limit, keep_alive=keep_alive,
+                                   extraction_backend=extraction_backend, max_retries=max_retries, adaptive=adaptive,
+                                   max_response_bytes=max_response_bytes, tracer=tracer)
+        self.engine = None
+        self.log = log
+        self.on_success = on_success
+        self.on_complete = on_complete
+        self.on_page = on_page
+        self.canonicalize = canonicalize
+        self.tracer = tracer
+        self.skip_failed = skip_failed
+        self.keep_summary = keep_summary
+
+        # Hanya ringkasan kecil yang disimpan di memori; hasil lengkap langsung dialirkan ke CSV
+        self.urls_to_fetch = []
+        self.invalid_urls = [] # Dilaporkan sebagai gagal tanpa menghentikan job
+        self.skipped_urls = set()
+        self.duplicate_urls = {} # URL input -> alasan dilewati sebelum fetch
+        self.canonical_urls = {} # URL input -> URL yang benar-benar diambil
+        self.successful_results = []
+        self.failed_urls_info = []
+
+        self.result_writer = CheckpointedCSVWriter(csv_output_path, resume=resume)
+        try:
+            self.dedup_index = ContentDedupIndex(dedup_index_path) if dedup_index_path else None
+        except sqlite3.Error as e:
+            self.result_writer.close()
+            raise OSError(f"Indeks deduplikasi '{dedup_index_path}' tidak dapat dibuka: {e}")
+        try:
+            self.archive = RawHTMLArchive(archive_path) if archive_path else None
+        except OSError:
+            self.result_writer.close()
+            if self.dedup_index is not None:
+                self.dedup_index.close()
+            raise
+        self.analytics = analytics if analytics is not None else LiveScrapingAnalytics()
+        if resume:
+            previous_analytics = LiveScrapingAnalytics.load(live_analytics_path(csv_output_path), csv_output_path)
+            if previous_analytics is not None:
+                self.analytics.merge(previous_analytics)
+            elif os.path.exists(live_analytics_path(csv_output_path)):
+                log("Statistik live run sebelumnya tidak cocok lagi dengan CSV; statistik hanya mencakup run ini.")
+
+    def prepare(self, article_urls):
+        """
+        Menormalisasi article_urls dan menyaring URL yang sudah selesai (resume), duplikat, atau tidak
+        valid (langsung dilaporkan sebagai gagal). Mengembalikan (urls_to_fetch, skipped_urls, duplicate_urls).
+        """
+        completed_urls = self.result_writer.completed_urls if self.skip_failed else self.result_writer.done_urls
+        urls_to_fetch = []
+        skipped_urls = set()
+        duplicate_urls = {}
+        invalid_urls = {}
+        first_input_for = {}
+        for url in article_urls:
+            try:
+                fetch_url = canonicalize_url(url) if self.canonicalize else validate_url(url)
+            except ValueError as e:
+                invalid_urls.setdefault(url, f"URL tidak valid: {e}")
+                continue
+            if self.keep_summary:
+                self.canonical_urls[url] = fetch_url
+            if fetch_url in completed_urls:
+                skipped_urls.add(url)
+            elif fetch_url in first_input_for:
+                duplicate_urls[url] = f"Duplikat URL: sama dengan {first_input_for[fetch_url]} setelah normalisasi"
+            elif self.dedup_index is not None and self.dedup_index.is_url_seen(fetch_url):
+                duplicate_urls[url] = "URL sudah pernah di-scrape (indeks deduplikasi)"
+            else:
+                first_input_for[fetch_url] = url
+                urls_to_fetch.append(fetch_url)
+        if self.keep_summary:
+            self.urls_to_fetch.extend(urls_to_fetch)
+            self.invalid_urls.extend(invalid_urls)
+            self.skipped_urls.update(skipped_urls)
+            self.duplicate_urls.update(duplicate_urls)
+        for url, error_reason in invalid_urls.items():
+            self._handle_completed(url, None, error_reason)
+        return urls_to_fetch, skipped_urls, duplicate_urls
+
+    def run(self, urls_to_fetch):
+        """
+        Mengambil urls_to_fetch (daftar dari prepare(), atau iterable yang dibaca bertahap) dengan
+        engine job ini. Engine dibuat pada panggilan pertama dan dipakai ulang pada panggilan berikutnya.
+        Mengembalikan False jika engine gagal dijalankan (pesannya ditulis lewat log).
+        """
+        try:
+            if self.engine is None:
+                use_page_filter = self.dedup_index is not None or self.archive is not None or self.on_page is not None
+                self.engine = create_fetch_engine(self.engine_name, page_filter=self._page_filter if use_page_filter else None,
+                                                  **self.engine_options)
+            self.engine.run(urls_to_fetch, self._handle_completed)
+            self.engine.extraction_backend.save_profiles() # Profil selektor per domain dipakai lagi di run berikutnya
+            return True
+        except Exception as e:
+            self.log(f"Engine '{self.engine_name}' gagal dijalankan: {e}")
+            return False
+
+    def _handle_completed(self, url, result, error_reason):
+        """Dipanggil engine setiap kali satu URL selesai diproses."""
+        if result and self.dedup_index is not None:
+            fingerprint = simhash(' '.join((result['title'], result['meta_description'], result['content_preview'])))
+            near_duplicate = self.dedup_index.check_and_add_fingerprint(url, fingerprint)
+            if near_duplicate:
+                result, error_reason = None, f"Duplikat mirip (near-duplicate) dari {near_duplicate[0]}, jarak Hamming {near_duplicate[1]}"
+            else:
+                self.dedup_index.mark_url_seen(url)
+        self.analytics.record(url, result, error_reason)
+        csv_start = time.perf_counter()
+        if result:
+            self.result_writer.write_result(result)
+            if self.keep_summary:
+                self.successful_results.append({'url': url, 'title': result['title'], 'word_count': result['word_count']})
+            if self.on_success:
+                self.on_success(url, result['word_count'], result['thread_id'])
+        else:
+            # Jika result adalah None, tambahkan ke daftar gagal
+            self.result_writer.record_failure(url, error_reason)
+            if self.keep_summary:
+                self.failed_urls_info.append({'url': url, 'reason': error_reason})
+        if self.tracer is not None:
+            self.tracer.add_stage(url, 'csv', time.perf_counter() - csv_start)
+            self.tracer.finish(url, error_reason if not result else None)
+        if self.on_complete:
+            self.on_complete(url, error_reason if not result else None)
+
+    def _page_filter(self, url, html_content):
+        # HTML diarsipkan sebelum dicek duplikat, jadi arsip berisi semua halaman yang benar-benar diunduh
+        if self.archive is not None:
+            self.archive.append(url, html_content)
+        if self.on_page is not None:
+            self.on_page(url, html_content)
+        if self.dedup_index is not None:
+            return self.dedup_index.page_filter(url, html_content)
+        return None
+
+    def close(self):
+        self.result_writer.close()
+        if self.dedup_index is not None:
+            self.dedup_index.close()
+        if self.archive is not None:
+            self.archive.close()
+        try:
+            self.analytics.save(live_analytics_path(self.csv_output_path), self.csv_output_path)
+        except OSError as e:
+            self.log(f"Statistik live tidak dapat disimpan: {e}")
+
+    def summary(self):
+        """Dict ringkasan untuk log_scraping_summary()."""
+        engine = self.engine
+        return {
+            'urls_to_fetch': self.urls_to_fetch,
+            'invalid_urls': self.invalid_urls,
+            'skipped_urls': self.skipped_urls,
+            'duplicate_urls': self.duplicate_urls,
+            'canonical_urls': self.canonical_urls,
+            'successful_results': self.successful_results,
+            'failed_urls_info': self.failed_urls_info,
+            'connection_stats': engine.connection_stats() if engine is not None else None,
+            'host_limits': engine.host_limit_stats() if engine is not None else None,
+            'retried_attempts': engine.retry_count if engine is not None else 0,
+            'analytics': self.analytics,
+            'stage_summary': self.tracer.stage_summary() if self.tracer is not None else None,
+        }
+
+def run_scraping_job(article_urls, csv_output_path, engine_name='thread', max_concurrency=None, per_host_limit=None,
+                     keep_alive=True, extraction_backend='bs4', resume=False, log=print, on_success=None,
+                     canonicalize=True, dedup_index_path=None, max_retries=DEFAULT_MAX_RETRIES, adaptive=True,
+                     archive_path=None, on_complete=None, on_page=None, analytics=None, max_response_bytes=None, tracer=None):
+    """
+    Menjalankan satu proses scraping lengkap tanpa bergantung pada GUI: memilih engine, mengalirkan
+    hasil ke CSV ber-checkpoint, dan mengembalikan dict ringkasan untuk log_scraping_summary().
+    on_success(url, word_count, thread_id) dipanggil untuk setiap artikel yang berhasil (mis. monitor),
+    dan on_complete(url, error_reason) untuk setiap URL yang selesai di-fetch (error_reason None jika berhasil).
+    on_page(url, html_content) dipanggil untuk setiap halaman terunduh sebelum parsing (mis. penemuan link).
+    Dengan canonicalize=True URL dinormalisasi sebelum fetch; dengan dedup_index_path, ContentDedupIndex
+    melewati URL yang sudah pernah di-scrape, HTML yang persis sama, dan konten near-duplicate.
+    URL yang tidak dapat diurai dilaporkan sebagai gagal ('URL tidak valid') tanpa menghentikan job.
+    URL yang gagal sementara (429/5xx/timeout) dicoba ulang hingga max_retries kali dengan backoff.
+    Dengan archive_path, HTML mentah setiap halaman yang terunduh disimpan ke RawHTMLArchive agar
+    dapat diekstraksi ulang nanti dengan reextract_archive() tanpa fetch ulang.
+    Dengan max_response_bytes, respons bukan HTML ditolak dan body dipotong pada batas tersebut.
+    Dengan tracer (StageTracer), durasi per tahap (fetch, parsing, penulisan CSV) dicatat per URL;
+    tracer tidak ditutup di sini karena dapat dipakai lintas beberapa run (crawl, frontier).
+    Setiap hasil juga dicatat ke LiveScrapingAnalytics (analytics, atau yang baru) yang dapat dibaca
+    selama run berlangsung; agregatnya disimpan di samping CSV dan digabung kembali saat resume.
+    Memunculkan OSError jika file output tidak dapat dibuka.
+    """
+    job = ScrapingJob(csv_output_path, engine_name, max_concurrency, per_host_limit, keep_alive, extraction_backend, resume, log,
+                      on_success, canonicalize, dedup_index_path, max_retries, adaptive, archive_path, on_complete, on_page,
+                      analytics, max_response_bytes, tracer)
+    try:
+        urls_to_fetch, skipped_urls, duplicate_urls = job.prepare(article_urls)
+        if resume:
+            log(f"Mode resume: {len(skipped_urls)} URL sudah selesai di run sebelumnya dan dilewati.")
+        if duplicate_urls:
+            log(f"Deduplikasi: {len(duplicate_urls)} URL duplikat dilewati sebelum fetch.")
+        job.run(urls_to_fetch)
+    finally:
+        job.close()
+    return job.summary()
+
+def log_scraping_summary(summary, article_urls, log=print, per_url=True):
+    """Menulis 'Analisis Artikel Cepat' dari ringkasan run_scraping_job() melalui fungsi log."""
+    urls_to_fetch = summary['urls_to_fetch']
+    skipped_urls = summary['skipped_urls']
+    duplicate_urls = summary['duplicate_urls']
+    canonical_urls = summary['canonical_urls']
+    successful_results = summary['successful_results']
+    failed_urls_info = summary['failed_urls_info']
+
+    log("\n" + "=" * 60)
+    log("Analisis Artikel Cepat:")
+    log("=" * 60)
+    attempted = len(urls_to_fetch) + len(summary['invalid_urls'])
+    log(f"Total URL yang dicoba: {attempted}")
+    if skipped_urls:
+        log(f"Dilewati (sudah selesai sebelumnya): {len(skipped_urls)}")
+    if duplicate_urls:
+        log(f"Duplikat dilewati sebelum fetch: {len(duplicate_urls)}")
+    log(f"Berhasil di-scrape: {len(successful_results)}")
+    log(f"Gagal di-scrape: {len(failed_urls_info)}")
+    
+    if attempted > 0:
+        success_rate = (len(successful_results) / attempted) * 100
+        log(f"Tingkat keberhasilan: {success_rate:.2f}%")
+
+    if summary['connection_stats'] is not None:
+        log("\nStatistik Koneksi HTTP:")
+        for line in format_connection_stats(summary['connection_stats']):
+            log(line)
+
+    if summary['host_limits']:
+        log("\nKonkurensi Adaptif per Host:")
+        for host, host_stats in summary['host_limits'].items():
+            log(f"   {host}: batas akhir {host_stats['limit']}, tertinggi {host_stats['peak_limit']}, "
+                f"{host_stats['requests']} request, {host_stats['throttled']} kali dibatasi (429/503/timeout)")
+        log(f"   Percobaan ulang: {summary['retried_attempts']}")
+
+    if summary.get('stage_summary'):
+        log("\nDurasi per Tahap (per URL):")
+        for line in format_stage_summary(summary['stage_summary']):
+            log(line)
+    
+    if per_url:
+        # Buat kamus untuk pencarian cepat berdasarkan URL
+        successful_results_map = {res['url']: res for res in successful_results}
+        failed_urls_map = {info['url']: info['reason'] for info in failed_urls_info}
+
+        log("\nRingkasan Hasil per URL Input (Terurut):")
+        for i, url in enumerate(article_urls):
+            status = "BERHASIL"
+            detail = ""
+            fetch_url = canonical_urls.get(url, url)
+            if url in duplicate_urls:
+                status = "DUPLIKAT"
+                detail = duplicate_urls[url]
+            elif fetch_url in successful_results_map:
+                article_info = successful_results_map[fetch_url]
+                detail = f"Judul: '{article_info['title']}' ({article_info['word_count']} kata)"
+            elif fetch_url in failed_urls_map:
+                status = "GAGAL"
+                detail = f"Alasan: {failed_urls_map[fetch_url]}"
+            elif url in skipped_urls:
+                status = "DILEWATI"
+                detail = "Sudah selesai di run sebelumnya (resume)"
+            else:
+                status = "TIDAK DIKETAHUI" # Seharusnya tidak terjadi jika semua futures diproses
+
+            log(f"   {i+1}. URL: {url}\n      Status: {status}\n      Detail: {detail}")
+            log("-" * 30)
+
+    analytics = summary.get('analytics')
+    if analytics is not None and analytics.failures:
+        log("\nKategori Kegagalan:")
+        for category, count in sorted(analytics.failure_categories.items(), key=lambda item: -item[1]):
+            log(f"   {category}: {count}")
+
+    if successful_results:
+        if analytics is not None and analytics.successes:
+            # Total sudah dijumlahkan secara inkremental oleh LiveScrapingAnalytics; tidak dihitung ulang
+            cumulative = f" (termasuk {analytics.previous_runs} run sebelumnya)" if analytics.previous_runs else ""
+            log(f"\nRata-rata panjang artikel (berhasil){cumulative}: {analytics.total_words / analytics.successes:.0f} kata "
+                f"(p50 {analytics.word_counts.quantile(0.5):.0f}, p90 {analytics.word_counts.quantile(0.9):.0f})")
+            log(f"Total kata yang di-scrape (berhasil){cumulative}: {analytics.total_words:,} kata")
+        else:
+            total_words = sum(r.get('word_count', 0) for r in successful_results)
+            log(f"\nRata-rata panjang artikel (berhasil): {total_words / len(successful_results):.0f} kata")
+            log(f"Total kata yang di-scrape (berhasil): {total_words:,} kata")
+        
+        # Contoh judul akan tetap 5 pertama dari yang berhasil (tidak harus terurut berdasarkan input URL)
+        log(f"\nContoh Judul Artikel (5 pertama yang berhasil):")
+        for i, result in enumerate(successful_results[:5]):
+            title = result.get('title', 'No Title')[:80]
+            word_count = result.get('word_count', 0)
+            log(f"   {i+1}. {title}... ({word_count} kata)")
+    else:
+        log("\nTidak ada artikel yang berhasil di-scrape untuk analisis cepat.")
+
+# Mode crawl: menemukan link artikel dari halaman yang diambil (mis. halaman indeks kanal)
+HREF_PATTERN = re.compile(rb'<a\s[^>]*?href\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+DEFAULT_CRAWL_MAX_DEPTH = 2
+
+def extract_links(html_content, base_url):
+    """
+    Mengambil semua link <a href> dari HTML mentah dengan regex (tanpa parsing DOM, jadi murah dan
+    tidak bergantung backend ekstraksi), lalu menjadikannya URL absolut http(s) yang kanonik.
+    href yang tidak dapat diurai (mis. port bukan angka) dilewati.
+    """
+    links = []
+    for match in HREF_PATTERN.finditer(html_content):
+        href = html.unescape((match.group(1) or match.group(2) or match.group(3)).decode('utf-8', 'ignore')).strip()
+        if not href or href.startswith(('#', 'javascript:', 'mailto:', 'tel:', 'data:')):
+            continue
+        try:
+            absolute_url = urljoin(base_url, href)
+            if absolute_url.startswith(('http://', 'https://')):
+                links.append(canonicalize_url(absolute_url))
+        except ValueError:
+            continue
+    return links
+
+class CrawlScope:
+    """
+    Aturan link mana yang boleh diikuti: host yang diizinkan (nama persis, atau '.detik.com' untuk
+    domain beserta semua subdomainnya), pola regex path yang harus cocok (jika ada) dan pola yang
+    dikecualikan, serta kedalaman maksimum dari halaman awal.
+    """
+
+    def __init__(self, allowed_hosts, include_patterns=(), exclude_patterns=(), max_depth=DEFAULT_CRAWL_MAX_DEPTH):
+        self.exact_hosts = {host.lower() for host in allowed_hosts if not host.startswith('.')}
+        self.host_suffixes = tuple(host.lower() for host in allowed_hosts if host.startswith('.'))
+        self.include_patterns = [re.compile(pattern) for pattern in include_patterns]
+        self.exclude_patterns = [re.compile(pattern) for pattern in exclude_patterns]
+        self.max_depth = max_depth
+
+    def allows(self, url):
+        parsed_url = urlparse(url)
+        host = parsed_url.netloc.lower()
+        if host not in self.exact_hosts and not (self.host_suffixes and ('.' + host).endswith(self.host_suffixes)):
+            return False
+        path = parsed_url.path + ('?' + parsed_url.query if parsed_url.query else '')
+        if self.include_patterns and not any(pattern.search(path) for pattern in self.include_patterns):
+            return False
+        return not any(pattern.search(path) for pattern in self.exclude_patterns)
+
+class LinkDiscoverer:
+    """
+    Mengumpulkan link baru dari halaman yang terunduh selama satu level crawl. Dipasang sebagai hook
+    pra-parsing run_scraping_job (on_page) sehingga bekerja di semua engine; link yang lolos
+    CrawlScope, belum ada di BloomFilter, dan bukan bagian dari level ini (scheduled) ditampung untuk
+    level berikutnya. BloomFilter sendiri tidak diubah di sini; URL baru masuk ke sana setelah di-fetch.
+    """
+
+    def __init__(self, scope, seen_filter, scheduled=()):
+        self.scope = scope
+        self.seen_filter = seen_filter
+        self.discovered = []
+        self.links_seen = 0
+        self._known = set(scheduled) # URL level ini dan link yang sudah ditampung
+        self._lock = threading.Lock()
+
+    def on_page(self, url, html_content):
+        links = [link for link in extract_links(html_content, url) if self.scope.allows(link)]
+        with self._lock:
+            self.links_seen += len(links)
+            for link in links:
+                if link not in self._known and link not in self.seen_filter:
+                    self._known.add(link)
+                    self.discovered.append(link)
+
+    def take_discovered(self):
+        with self._lock:
+            discovered, self.discovered = self.discovered, []
+            self._known = set()
+            return discovered
+
+def _merge_job_summaries(total, summary):
+    """Menggabungkan ringkasan run_scraping_job per level crawl menjadi satu ringkasan."""
+    if total is None:
+        return summary
+    total['urls_to_fetch'].extend(summary['urls_to_fetch'])
+    total['invalid_urls'].extend(summary['invalid_urls'])
+    total['skipped_urls'].update(summary['skipped_urls'])
+    total['duplicate_urls'].update(summary['duplicate_urls'])
+    total['canonical_urls'].update(summary['canonical_urls'])
+    total['successful_results'].extend(summary['successful_results'])
+    total['failed_urls_info'].extend(summary['failed_urls_info'])
+    if summary['connection_stats'] is not None:
+        connection_stats = total['connection_stats'] or {}
+        for host, host_stats in summary['connection_stats'].items():
+            merged = connection_stats.setdefault(host, dict.fromkeys(host_stats, 0))
+            for key, value in host_stats.items():
+                merged[key] += value
+        total['connection_stats'] = connection_stats
+    total['host_limits'] = summary['host_limits'] or total['host_limits']
+    total['retried_attempts'] += summary['retried_attempts']
+    total['analytics'] = summary['analytics'] # Level berikutnya berjalan dengan resume, jadi agregatnya sudah kumulatif
+    total['stage_summary'] = summary['stage_summary'] # Tracer yang sama dipakai di semua level
+    return total
+
+def run_crawl_job(seed_urls, csv_output_path, scope=None, max_pages=None, seen_filter_path=None,
+                  seen_filter_capacity=10_000_000, resume=False, log=print, **job_options):
+    """
+    Mode crawl: mulai dari seed_urls (mis. halaman indeks kanal), ambil setiap level dengan
+    run_scraping_job (job_options diteruskan apa adanya), kumpulkan link keluar yang lolos scope,
+    lalu ambil link baru tersebut sebagai level berikutnya hingga scope.max_depth atau max_pages.
+    URL yang sudah di-fetch dicatat di BloomFilter (disimpan ke seen_filter_path jika diberikan),
+    sehingga link yang sama tidak diambil dua kali, juga di run berikutnya. Link yang ditemukan tetapi
+    tidak sempat diambil (batas max_pages, crash) tidak dicatat, jadi dapat ditemukan lagi. Halaman awal selalu
+    diambil ulang karena isinya berubah. Mengembalikan ringkasan gabungan seperti run_scraping_job(),
+    ditambah 'discovered_per_level'.
+    """
+    canonical_seeds = []
+    invalid_seeds = [] # Tetap diserahkan ke run_scraping_job agar dilaporkan sebagai URL gagal
+    for url in seed_urls:
+        try:
+            canonical_seeds.append(canonicalize_url(url))
+        except ValueError:
+            invalid_seeds.append(url)
+    if scope is None:
+        scope = CrawlScope({urlparse(url).netloc for url in canonical_seeds})
+    seen_filter = BloomFilter(seen_filter_capacity, path=seen_filter_path)
+    seed_urls = canonical_seeds + invalid_seeds
+    on_complete = job_options.pop('on_complete', None)
+
+    def mark_fetched(url, error_reason):
+        seen_filter.add(url)
+        if on_complete is not None:
+            on_complete(url, error_reason)
+
+    total_summary = None
+    discovered_per_level = []
+    level_urls = seed_urls
+    fetched = 0
+    try:
+        for depth in range(scope.max_depth + 1):
+            if max_pages is not None:
+                level_urls = level_urls[:max(0, max_pages - fetched)]
+            if not level_urls:
+                break
+            log(f"Crawl level {depth}: {len(level_urls)} URL")
+            # Link dari level terakhir tidak akan diikuti, jadi tidak perlu diekstraksi
+            discoverer = LinkDiscoverer(scope, seen_filter, level_urls) if depth < scope.max_depth else None
+            summary = run_scraping_job(level_urls, csv_output_path, resume=resume or depth > 0, log=log, on_complete=mark_fetched,
+                                       on_page=discoverer.on_page if discoverer else None, **job_options)
+            total_summary = _merge_job_summaries(total_summary, summary)
+            fetched += len(summary['urls_to_fetch'])
+            if discoverer is None:
+                break
+            level_urls = discoverer.take_discovered()
+            discovered_per_level.append(len(level_urls))
+            log(f"Crawl level {depth}: {discoverer.links_seen} link dalam scope, {len(level_urls)} URL baru ditemukan")
+    finally:
+        seen_filter.save()
+
+    if total_summary is None:
+        total_summary = _merge_job_summaries(None, {
+            'urls_to_fetch': [], 'invalid_urls': [], 'skipped_urls': set(), 'duplicate_urls': {}, 'canonical_urls': {}, 'successful_results': [],
+            'failed_urls_info': [], 'connection_stats': None, 'host_limits': None, 'retried_attempts': 0,
+            'analytics': None, 'stage_summary': None})
+    total_summary['discovered_per_level'] = discovered_per_level
+    return total_summary
+
+def default_worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+def per_worker_path(path, worker_id):
+    """
+    Setiap worker frontier menulis file keluarannya sendiri (CSV, arsip), mis.
+    hasil_scraping.worker-<id>.csv, karena beberapa proses tidak boleh meng-append file yang sama.
+    """
+    root, extension = os.path.splitext(path)
+    safe_worker_id = re.sub(r'[^A-Za-z0-9_.-]', '_', worker_id)
+    return f"{root}.worker-{safe_worker_id}{extension}"
+
+def run_frontier_worker(frontier_path, csv_output_path, worker_id=None, shards=None, lease_batch=100,
+                        lease_seconds=DEFAULT_LEASE_SECONDS, wait_for_leases=True, log=print, **job_options):
+    """
+    Loop worker untuk CrawlFrontier. Satu ScrapingJob (CSV worker, engine, pool koneksi, status host)
+    dipakai sepanjang hidup worker: thread penyewa menyewa batch URL satu langkah di depan engine
+    (antrean terbatas), lalu setiap URL dilaporkan sebagai done/failed. job_options diteruskan
+    ke ScrapingJob apa adanya (mis. engine_name/extraction_backend/dedup_index_path). Sewa
+    diperpanjang oleh thread heartbeat. Jika tidak ada lagi URL pending, worker menunggu sewa milik
+    worker lain (yang mungkin crash dan kedaluwarsa) selama wait_for_leases=True, lalu berhenti.
+    Mengembalikan dict jumlah URL yang diproses oleh worker ini.
+    """
+    worker_id = worker_id or default_worker_id()
+    frontier = CrawlFrontier(frontier_path)
+    totals = {'batches': 0, 'done': 0, 'failed': 0, 'released': 0}
+    outstanding = set() # URL yang disewa worker ini dan belum dilaporkan
+    outstanding_lock = threading.Lock()
+    log(f"Worker '{worker_id}' memakai frontier '{frontier_path}' (shard: {', '.join(map(str, shards)) if shards is not None else 'semua'}), "
+        f"hasil ke '{csv_output_path}'")
+
+    def on_complete(url, error_reason):
+        with outstanding_lock:
+            outstanding.discard(url)
+        if error_reason:
+            frontier.fail(url, worker_id, error_reason)
+            totals['failed'] += 1
+        else:
+            frontier.complete(url, worker_id)
+            totals['done'] += 1
+
+    def complete_unfetched(url, note):
+        with outstanding_lock:
+            outstanding.discard(url)
+        frontier.complete(url, worker_id, note)
+
+    def lease_ahead(batches, stop):
+        """
+        Thread penyewa: menyewa dan menyaring batch berikutnya selagi engine masih mengambil batch
+        sebelumnya, sehingga transaksi SQLite frontier tidak berjalan di thread/event loop engine.
+        """
+        def put(item):
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        try:
+            while not stop.is_set():
+                urls = frontier.lease(worker_id, lease_batch, lease_seconds, shards)
+                if not urls:
+                    break
+                with outstanding_lock:
+                    outstanding.update(urls)
+                totals['batches'] += 1
+                log(f"[{worker_id}] batch {totals['batches']}: {len(urls)} URL; frontier: "
+                    + ", ".join(f"{state} {count}" for state, count in frontier.counts().items()))
+                urls_to_fetch, skipped_urls, duplicate_urls = job.prepare(urls)
+                # Dengan skip_failed=False hanya URL yang berhasil di CSV worker ini yang dilewati;
+                # URL yang pernah gagal (mis. setelah --requeue-failed) diambil ulang
+                for url in skipped_urls:
+                    complete_unfetched(url, "Sudah ada di CSV worker (resume)")
+                for url, reason in duplicate_urls.items():
+                    complete_unfetched(url, reason)
+                if urls_to_fetch:
+                    put(urls_to_fetch)
+        except Exception as e:
+            put(e) # Error frontier diteruskan ke engine lewat iterator URL
+        finally:
+            put(None)
+
+    def start_leasing():
+        """Memulai thread penyewa; mengembalikan (iterator URL untuk engine, fungsi untuk menghentikannya)."""
+        batches = queue.Queue(maxsize=1) # Paling banyak satu batch disewa di depan engine
+        stop = threading.Event()
+        leaser = threading.Thread(target=lease_ahead, args=(batches, stop), name='FrontierLeaser', daemon=True)
+        leaser.start()
+
+        def leased_urls():
+            # Berhenti jika frontier tidak punya URL pending atau penyewaan dihentikan
+            while not stop.is_set():
+                try:
+                    urls = batches.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if urls is None:
+                    return
+                if isinstance(urls, Exception):
+                    raise urls
+                for url in urls:
+                    if stop.is_set():
+                        return
+                    yield url
+
+        def stop_leasing():
+            stop.set()
+            leaser.join()
+        return leased_urls(), stop_leasing
+
+    stop_heartbeat = threading.Event()
+
+    def heartbeat():
+        while not stop_heartbeat.wait(lease_seconds / 3):
+            frontier.renew(worker_id, lease_seconds)
+
+    heartbeat_thread = threading.Thread(target=heartbeat, name='FrontierHeartbeat', daemon=True)
+    try:
+        # resume=True agar CSV worker ini di-append jika worker dijalankan ulang dengan worker_id yang sama
+        job = ScrapingJob(csv_output_path, resume=True, log=log, on_complete=on_complete, skip_failed=False, keep_summary=False,
+                          **job_options)
+        heartbeat_thread.start()
+        try:
+            while True:
+                leased_urls, stop_leasing = start_leasing()
+                try:
+                    engine_ok = job.run(leased_urls)
+                finally:
+                    stop_leasing() # Thread penyewa berhenti sebelum URL yang belum dilaporkan dihitung
+                with outstanding_lock:
+                    unreported = list(outstanding)
+                if unreported:
+                    # Mis. engine gagal dijalankan: URL dikembalikan agar worker lain (atau run berikutnya) mencoba
+                    frontier.release(unreported, worker_id)
+                    totals['released'] += len(unreported)
+                    log(f"[{worker_id}] {len(unreported)} URL tidak selesai diproses dan dikembalikan ke pending; worker berhenti.")
+                    break
+                if not engine_ok or not (wait_for_leases and frontier.counts()['leased']):
+                    break
+                time.sleep(min(5.0, lease_seconds / 4)) # Tunggu sewa worker lain selesai atau kedaluwarsa
+        finally:
+            job.close()
+    finally:
+        stop_heartbeat.set()
+        if heartbeat_thread.is_alive():
+            heartbeat_thread.join()
+        frontier.close()
+    return totals
+
+# GUI Class
+LOG_RENDER_INTERVAL_MS = 100 # Log dirender paling banyak 10 kali per detik
+LOG_MAX_EVENTS_PER_FRAME = 5000 # Sisa event diproses di frame berikutnya agar UI tetap responsif
+LOG_MAX_ARTICLES_PER_FRAME = 20 # Artikel lain dalam frame yang sama diringkas menjadi satu baris
+LOG_MAX_LINES = 5000 # Widget log berperilaku seperti ring buffer: baris tertua dibuang
+GUI_PER_URL_SUMMARY_LIMIT = 500 # Di atas jumlah ini, ringkasan per URL tidak ditampilkan di GUI
+
+class ArticleScraperGUI:
+    def __init__(self, master):
+        _load_tkinter()
+        self.master = master
+        master.title("Advanced Article Scraper & Analyzer")
+
+        # Frame untuk input URL
+        input_frame = tk.LabelFrame(master, text="Masukkan URL Artikel (satu per baris):", padx=10, pady=10)
+        input_frame.pack(pady=10, padx=10, fill="both", expand=True)
+
+        self.url_input = scrolledtext.ScrolledText(input_frame, width=80, height=10)
+        self.url_input.pack(pady=5, fill="both", expand=True)
+        # URL contoh telah dihapus agar inputan kosong
+        # self.url_input.insert(tk.END, """URL_CONTOH_1
+        # URL_CONTOH_2
+        # ...""")
+
+        # Frame untuk tombol
+        button_frame = tk.Frame(master)
+        button_frame.pack(pady=5)
+
+        self.scrape_button = tk.Button(button_frame, text="Mulai Scraping", command=self.start_scraping)
+        self.scrape_button.pack(side=tk.LEFT, padx=5)
+
+        self.analyze_button = tk.Button(button_frame, text="Analisis Hasil Scraping", command=self.analyze_results)
+        self.analyze_button.pack(side=tk.LEFT, padx=5)
+
+        # Frame untuk pengaturan engine fetch dan batas konkurensi
+        engine_frame = tk.Frame(master)
+        engine_frame.pack(pady=5)
+
+        tk.Label(engine_frame, text="Engine:").pack(side=tk.LEFT)
+        self.engine_var = tk.StringVar(value=ThreadedFetchEngine.name)
+        tk.OptionMenu(engine_frame, self.engine_var, *FETCH_ENGINES, command=self._on_engine_changed).pack(side=tk.LEFT, padx=5)
+
+        tk.Label(engine_frame, text="Koneksi global:").pack(side=tk.LEFT)
+        self.max_concurrency_var = tk.IntVar(value=16)
+        tk.Spinbox(engine_frame, from_=1, to=2000, width=6, textvariable=self.max_concurrency_var).pack(side=tk.LEFT, padx=5)
+
+        tk.Label(engine_frame, text="Koneksi per host:").pack(side=tk.LEFT)
+        self.per_host_limit_var = tk.IntVar(value=16)
+        tk.Spinbox(engine_frame, from_=1, to=500, width=6, textvariable=self.per_host_limit_var).pack(side=tk.LEFT, padx=5)
+
+        self.keep_alive_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(engine_frame, text="Keep-alive", variable=self.keep_alive_var).pack(side=tk.LEFT, padx=5)
+
+        tk.Label(engine_frame, text="Ekstraksi:").pack(side=tk.LEFT)
+        self.extraction_backend_var = tk.StringVar(value=BeautifulSoupExtractionBackend.name)
+        tk.OptionMenu(engine_frame, self.extraction_backend_var, *EXTRACTION_BACKENDS).pack(side=tk.LEFT, padx=5)
+
+        self.resume_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(engine_frame, text="Lanjutkan run sebelumnya (resume)", variable=self.resume_var).pack(side=tk.LEFT, padx=5)
+
+        self.dedup_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(engine_frame, text="Deduplikasi", variable=self.dedup_var).pack(side=tk.LEFT, padx=5)
+
+        self.archive_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(engine_frame, text="Arsip HTML", variable=self.archive_var).pack(side=tk.LEFT, padx=5)
+
+        self.stream_limit_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(engine_frame, text=f"Batasi unduhan ({DEFAULT_MAX_RESPONSE_BYTES // (1024 * 1024)} MB, HTML saja)",
+                       variable=self.stream_limit_var).pack(side=tk.LEFT, padx=5)
+
+        # Frame untuk output log
+        output_frame = tk.LabelFrame(master, text="Log Scraping & Analisis:", padx=10, pady=10)
+        output_frame.pack(pady=10, padx=10, fill="both", expand=True)
+
+        self.output_text = scrolledtext.ScrolledText(output_frame, width=100, height=15, state='disabled')
+        self.output_text.pack(pady=5, fill="both", expand=True)
+
+        self.csv_output_path = os.path.join('.', 'hasil_scraping.csv')
+        self.live_analytics = None # LiveScrapingAnalytics dari run yang sedang berjalan
+
+        # Semua penulisan log (termasuk dari worker thread) lewat antrean ini; hanya main loop Tk
+        # yang menyentuh widget, dalam batch per frame
+        self.log_queue = queue.SimpleQueue()
+        self.master.after(LOG_RENDER_INTERVAL_MS, self._poll_log_queue)
+
+    def _on_engine_changed(self, engine_name):
+        """Menyesuaikan batas konkurensi bawaan saat engine diganti."""
+        if engine_name == AsyncioFetchEngine.name:
+            self.max_concurrency_var.set(200)
+            self.per_host_limit_var.set(20)
+        elif engine_name == PipelinedFetchEngine.name:
+            self.max_concurrency_var.set(16)
+            self.per_host_limit_var.set(16)
+        else:
+            self.max_concurrency_var.set(16)
+            self.per_host_limit_var.set(16)
+
+    def log_to_gui(self, message):
+        """Mengantrekan pesan untuk widget teks output; aman dipanggil dari thread mana pun."""
+        self.log_queue.put(('message', message))
+
+    def _call_in_gui(self, callback):
+        """Menjalankan callback (mis. messagebox, konfigurasi tombol) di main loop Tk."""
+        self.log_queue.put(('call', callback))
+
+    def _clear_log(self):
+        """
+        Mengosongkan widget log beserta pesan yang belum sempat dirender. Event 'call' tetap
+        dijalankan (mis. akhir run yang mengaktifkan tombol lagi). Hanya dari main thread.
+        """
+        pending_calls = []
+        try:
+            while True:
+                event = self.log_queue.get_nowait()
+                if event[0] == 'call':
+                    pending_calls.append(event)
+        except queue.Empty:
+            pass
+        for event in pending_calls:
+            self.log_queue.put(event)
+        self.output_text.config(state='normal')
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.config(state='disabled')
+
+    def _render_log_chunks(self, chunks):
+        """Menyisipkan teks satu frame sekaligus, lalu membuang baris tertua di atas LOG_MAX_LINES."""
+        if not chunks:
+            return
+        self.output_text.config(state='normal')
+        self.output_text.insert(tk.END, "".join(chunks))
+        line_count = int(self.output_text.index('end-1c').split('.')[0])
+        if line_count > LOG_MAX_LINES:
+            self.output_text.delete("1.0", f"{line_count - LOG_MAX_LINES + 1}.0")
+        self.output_text.see(tk.END) # Scroll to the end
+        self.output_text.config(state='disabled')
+        chunks.clear()
+
+    def _poll_log_queue(self):
+        """Menguras antrean log dengan laju frame tetap dan merender event secara tergabung (coalesced)."""
+        chunks = []
+        rendered_articles = 0
+        skipped_articles = 0
+        last_skipped_event = None
+
+        def flush_skipped():
+            nonlocal skipped_articles
+            if skipped_articles:
+                _, elapsed_time, _, _, _, processed_articles, total_words = last_skipped_event
+                chunks.append(f"[{elapsed_time:.1f}s] ... {skipped_articles} artikel lain diproses "
+                              f"(Progress: {processed_articles} articles, {total_words:,} words total)\n" + "-" * 80 + "\n")
+                skipped_articles = 0
+
+        try:
+            for _ in range(LOG_MAX_EVENTS_PER_FRAME):
+                event = self.log_queue.get_nowait()
+                if event[0] == 'article':
+                    if rendered_articles < LOG_MAX_ARTICLES_PER_FRAME:
+                        chunks.append(format_article_event(event))
+                        rendered_articles += 1
+                    else:
+                        skipped_articles += 1
+                        last_skipped_event = event
+                    continue
+                flush_skipped()
+                if event[0] == 'message':
+                    chunks.append(event[1] + "\n")
+                elif event[0] == 'call':
+                    self._render_log_chunks(chunks) # Teks sebelumnya harus tampil sebelum callback (mis. messagebox)
+                    event[1]()
+        except queue.Empty:
+            pass
+        flush_skipped()
+        self._render_log_chunks(chunks)
+        self.master.after(LOG_RENDER_INTERVAL_MS, self._poll_log_queue)
+
+    def start_scraping(self):
+        """Memulai proses scraping di thread terpisah."""
+        urls_str = self.url_input.get("1.0", tk.END).strip()
+        article_urls = [url.strip() for url in urls_str.split('\n') if url.strip()]
+
+        if not article_urls:
+            messagebox.showwarning("Input Kosong", "Harap masukkan setidaknya satu URL di kolom input.")
+            return
+
+        # Membersihkan log sebelumnya
+        self._clear_log()
+
+        self.log_to_gui("Memulai Demo Scraping Artikel Multithreading Lanjutan...")
+        self.log_to_gui("=" * 80)
+
+        engine_name = self.engine_var.get()
+        try:
+            max_concurrency = int(self.max_concurrency_var.get())
+            per_host_limit = int(self.per_host_limit_var.get())
+        except (tk.TclError, ValueError):
+            max_concurrency, per_host_limit = None, None # Gunakan nilai bawaan engine
+        keep_alive = self.keep_alive_var.get()
+        extraction_backend = self.extraction_backend_var.get()
+        resume = self.resume_var.get()
+        dedup_index_path = DEFAULT_DEDUP_INDEX_PATH if self.dedup_var.get() else None
+        archive_path = DEFAULT_ARCHIVE_PATH if self.archive_var.get() else None
+        max_response_bytes = DEFAULT_MAX_RESPONSE_BYTES if self.stream_limit_var.get() else None
+        self.log_to_gui(f"Engine: {engine_name} (batas global: {max_concurrency or 'bawaan'}, per host: {per_host_limit or 'bawaan'}, keep-alive: {'ya' if keep_alive else 'tidak'}, ekstraksi: {extraction_backend})")
+        
+        # Nonaktifkan tombol scraping saat scraping berlangsung; analisis tetap bisa dari statistik live
+        self.scrape_button.config(state='disabled')
+
+        # Jalankan scraping di thread terpisah agar GUI tidak hang
+        threading.Thread(target=self._run_scraping_logic, args=(article_urls, engine_name, max_concurrency, per_host_limit, keep_alive, extraction_backend, resume, dedup_index_path, archive_path, max_response_bytes)).start()
+
+    def _run_scraping_logic(self, article_urls, engine_name='thread', max_concurrency=None, per_host_limit=None, keep_alive=True, extraction_backend='bs4', resume=False, dedup_index_path=None, archive_path=None, max_response_bytes=None):
+        """Logika inti scraping yang berjalan di thread terpisah."""
+        monitor = RealTimeArticleScrapingMonitor(self.log_queue)
+        self.live_analytics = LiveScrapingAnalytics()
+
+        try:
+            summary = run_scraping_job(article_urls, self.csv_output_path, engine_name, max_concurrency, per_host_limit,
+                                       keep_alive, extraction_backend, resume, log=self.log_to_gui, on_success=monitor.update_stats,
+                                       dedup_index_path=dedup_index_path, archive_path=archive_path, analytics=self.live_analytics,
+                                       max_response_bytes=max_response_bytes)
+        except OSError as e:
+            self.log_to_gui(f"File output '{self.csv_output_path}' tidak dapat dibuka: {e}")
+            self._call_in_gui(self._end_run)
+            return
+
+        self.log_to_gui(f"\nScraping artikel selesai! Hasil berhasil disimpan ke '{self.csv_output_path}'")
+        per_url = len(article_urls) <= GUI_PER_URL_SUMMARY_LIMIT
+        log_scraping_summary(summary, article_urls, log=self.log_to_gui, per_url=per_url)
+        if not per_url:
+            self.log_to_gui(f"\nRingkasan per URL tidak ditampilkan untuk lebih dari {GUI_PER_URL_SUMMARY_LIMIT} URL; status tiap URL ada di '{self.csv_output_path}.checkpoint.jsonl'.")
+
+        def finish():
+            messagebox.showinfo("Scraping Selesai", "Scraping artikel telah selesai! Hasil disimpan ke 'hasil_scraping.csv'")
+            # Aktifkan kembali tombol setelah scraping selesai
+            self._end_run()
+        self._call_in_gui(finish)
+
+    def _end_run(self):
+        """
+        Dijalankan di main thread setelah ringkasan run dirender. Sampai saat itu live_analytics tetap
+        terisi, jadi analyze_results tidak menghapus log selama ringkasan akhir masih di antrean.
+        """
+        self.live_analytics = None
+        self._enable_buttons()
+
+    def _enable_buttons(self):
+        self.scrape_button.config(state='normal')
+        self.analyze_button.config(state='normal')
+
+    def analyze_results(self):
+        """
+        Menampilkan laporan analisis di GUI: selama scraping berjalan dari statistik live run tersebut,
+        setelahnya dari snapshot statistik di samping CSV (atau dengan membaca ulang CSV jika tidak ada).
+        """
+        live_analytics = self.live_analytics
+        if live_analytics is not None:
+            # Log progres run yang sedang berjalan tidak dihapus
+            self.log_to_gui("\n" + "=" * 80)
+            self.log_to_gui("STATISTIK LIVE SCRAPING YANG SEDANG BERJALAN...")
+            self.log_to_gui(live_analytics.generate_comprehensive_report())
+            return
+
+        self._clear_log() # Hapus log sebelumnya
+        
+        if os.path.exists(self.csv_output_path) and os.path.getsize(self.csv_output_path) > 0:
+            self.log_to_gui("\n" + "=" * 80)
+            self.log_to_gui("MENGANALISIS HASIL SCRAPING ARTIKEL (Detail Laporan)...")
+            try:
+                report = load_comprehensive_report(self.csv_output_path)
+                self.log_to_gui(report)
+                self.log_to_gui("\nAnalisis selesai! Periksa file CSV untuk hasil detail.")
+            except Exception as e:
+                self.log_to_gui(f"Terjadi kesalahan saat menganalisis hasil scraping: {e}")
+                self.log_to_gui("Pastikan file 'hasil_scraping.csv' tidak kosong atau rusak.")
+        else:
+            self.log_to_gui("Tidak ditemukan file hasil untuk dianalisis atau file kosong. Pastikan scraping berhasil.")
+
+def read_url_list(source):
+    """Membaca daftar URL (satu per baris) dari file, atau dari stdin jika source adalah '-'."""
+    if source == '-':
+        lines = sys.stdin.read().split('\n')
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = f.read().split('\n')
+    return [url.strip() for url in lines if url.strip()]
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        description="Advanced Article Scraper & Analyzer. Tanpa argumen, GUI Tkinter dibuka seperti biasa.")
+    parser.add_argument('--urls', metavar='FILE',
+                        help="Mode headless: file berisi URL (satu per baris), atau '-' untuk membaca dari stdin")
+    parser.add_argument('--output', metavar='CSV', default=os.path.join('.', 'hasil_scraping.csv'),
+                        help="File CSV hasil scraping (bawaan: ./hasil_scraping.csv)")
+    parser.add_argument('--engine', choices=list(FETCH_ENGINES), default=ThreadedFetchEngine.name,
+                        help="Engine fetch (bawaan: thread)")
+    parser.add_argument('--max-concurrency', type=int, help="Batas koneksi global (bawaan: sesuai engine)")
+    parser.add_argument('--per-host-limit', type=int, help="Batas atas koneksi per host (bawaan: sesuai engine)")
+    parser.add_argument('--no-keep-alive', action='store_true', help="Tutup koneksi setelah setiap request")
+    parser.add_argument('--max-retries', type=int, default=DEFAULT_MAX_RETRIES,
+                        help=f"Percobaan ulang maksimum per URL untuk 429/5xx/timeout/error koneksi (bawaan: {DEFAULT_MAX_RETRIES})")
+    parser.add_argument('--no-adaptive', action='store_true',
+                        help="Batas per host tetap sebesar --per-host-limit (tanpa penyesuaian AIMD)")
+    parser.add_argument('--extraction-backend', choices=list(EXTRACTION_BACKENDS), default=BeautifulSoupExtractionBackend.name,
+                        help="Backend ekstraksi (bawaan: bs4; 'partial' hanya membangun elemen yang dibutuhkan ekstraksi)")
+    parser.add_argument('--max-response-bytes', metavar='BYTES', type=int, nargs='?', const=DEFAULT_MAX_RESPONSE_BYTES,
+                        help=f"Stream respons: tolak yang bukan HTML dan potong body setelah BYTES (bawaan jika tanpa nilai: {DEFAULT_MAX_RESPONSE_BYTES})")
+    parser.add_argument('--resume', action='store_true', help="Lanjutkan run sebelumnya, lewati URL yang sudah ada di checkpoint")
+    parser.add_argument('--no-canonicalize', action='store_true',
+                        help="Ambil URL persis seperti input (tanpa membuang parameter pelacak/varian mobile/AMP)")
+    parser.add_argument('--dedup-index', metavar='SQLITE', nargs='?', const=DEFAULT_DEDUP_INDEX_PATH,
+                        help="Aktifkan indeks deduplikasi persisten (bawaan: ./dedup_index.sqlite)")
+    parser.add_argument('--archive', metavar='WARC', nargs='?', const=DEFAULT_ARCHIVE_PATH,
+                        help="Simpan HTML mentah setiap halaman ke arsip WARC terkompresi (bawaan: ./raw_html_archive.warc.gz)")
+    parser.add_argument('--reextract', metavar='WARC',
+                        help="Hanya ekstraksi ulang: jalankan ekstraksi untuk semua halaman di arsip ke --output, tanpa fetch")
+    parser.add_argument('--crawl', action='store_true',
+                        help="Mode crawl: URL dari --urls menjadi halaman awal (mis. indeks kanal), link artikel di dalamnya ditemukan dan diikuti")
+    parser.add_argument('--max-depth', type=int, default=DEFAULT_CRAWL_MAX_DEPTH,
+                        help=f"Dengan --crawl: kedalaman link maksimum dari halaman awal (bawaan: {DEFAULT_CRAWL_MAX_DEPTH})")
+    parser.add_argument('--max-pages', type=int, help="Dengan --crawl: jumlah halaman maksimum yang diambil")
+    parser.add_argument('--crawl-host', metavar='HOST', action='append',
+                        help="Dengan --crawl: host yang boleh diikuti, '.detik.com' untuk semua subdomain (bawaan: host halaman awal)")
+    parser.add_argument('--crawl-include', metavar='REGEX', action='append', default=[],
+                        help="Dengan --crawl: hanya ikuti link yang path-nya cocok dengan pola ini (boleh diulang), mis. '/d-\\d+/'")
+    parser.add_argument('--crawl-exclude', metavar='REGEX', action='append', default=[],
+                        help="Dengan --crawl: jangan ikuti link yang path-nya cocok dengan pola ini (boleh diulang)")
+    parser.add_argument('--seen-filter', metavar='BLOOM', nargs='?', const=DEFAULT_SEEN_FILTER_PATH,
+                        help="Dengan --crawl: simpan Bloom filter URL yang sudah dilihat antar run (bawaan: ./crawl_seen.bloom)")
+    parser.add_argument('--frontier', metavar='SQLITE', nargs='?', const=DEFAULT_FRONTIER_PATH,
+                        help="Pakai frontier SQLite persisten (bawaan: ./crawl_frontier.sqlite): URL dari --urls ditambahkan ke "
+                             "frontier, lalu proses ini bekerja sebagai worker. Jalankan beberapa proses/mesin dengan file yang sama")
+    parser.add_argument('--enqueue-only', action='store_true', help="Dengan --frontier: hanya tambahkan URL, jangan jalankan worker")
+    parser.add_argument('--frontier-status', action='store_true', help="Dengan --frontier: cetak jumlah URL per status lalu keluar")
+    parser.add_argument('--requeue-failed', action='store_true', help="Dengan --frontier: kembalikan URL berstatus failed ke pending")
+    parser.add_argument('--worker-id', help="Dengan --frontier: identitas worker (bawaan: hostname-pid); menentukan nama file CSV worker")
+    parser.add_argument('--shards', metavar='LIST',
+                        help="Dengan --frontier: hanya ambil URL dari shard host ini, mis. '0-3,8' (bawaan: semua shard)")
+    parser.add_argument('--shard-count', type=int, default=DEFAULT_FRONTIER_SHARDS,
+                        help=f"Jumlah shard host saat frontier pertama kali dibuat (bawaan: {DEFAULT_FRONTIER_SHARDS})")
+    parser.add_argument('--lease-batch', type=int, default=100, help="Dengan --frontier: URL yang disewa per batch (bawaan: 100)")
+    parser.add_argument('--lease-seconds', type=float, default=DEFAULT_LEASE_SECONDS,
+                        help=f"Dengan --frontier: lama sewa sebelum URL diberikan ke worker lain (bawaan: {DEFAULT_LEASE_SECONDS})")
+    parser.add_argument('--report', metavar='FILE',
+                        help="Tulis laporan analisis komprehensif setelah scraping ke FILE ('-' untuk stdout)")
+    parser.add_argument('--parquet', action='store_true',
+                        help="Setelah scraping, simpan juga salinan Parquet terkompresi di samping CSV (butuh pyarrow)")
+    parser.add_argument('--analyze', metavar='CSV',
+                        help="Hanya analisis: cetak laporan untuk file CSV/Parquet yang sudah ada (dengan --parquet, buat Parquet dulu)")
+    parser.add_argument('--per-url-summary', action='store_true', help="Cetak ringkasan status untuk setiap URL input")
+    parser.add_argument('--trace', metavar='JSONL', nargs='?', const=DEFAULT_TRACE_PATH,
+                        help="Catat durasi per tahap (dns/connect/tls/ttfb/download/parse/select/csv) setiap URL ke JSONL (bawaan: ./scraping_trace.jsonl)")
+    parser.add_argument('--metrics-file', metavar='FILE', help="Tulis histogram durasi per tahap dalam format teks Prometheus ke FILE")
+    parser.add_argument('--metrics-port', metavar='PORT', type=int, help="Sajikan metrik Prometheus di http://127.0.0.1:PORT/metrics selama run")
+    parser.add_argument('--profile-every', metavar='N', type=int, default=0,
+                        help="Profilkan satu dari N ekstraksi dengan cProfile (bawaan: 0 = mati)")
+    parser.add_argument('--profile-output', metavar='FILE', default=DEFAULT_PROFILE_PATH,
+                        help=f"File .pstats hasil --profile-every (bawaan: {DEFAULT_PROFILE_PATH})")
+    parser.add_argument('--startup-time', action='store_true',
+                        help="Cetak waktu startup headless (impor modul + argumen) dan bandingkan dengan targetnya")
+    return parser
+
+def load_comprehensive_report(csv_file):
+    """
+    Laporan komprehensif untuk csv_file: dari snapshot LiveScrapingAnalytics jika masih sesuai dengan
+    CSV (tanpa membaca ulang file), selain itu dengan memindai CSV/Parquet lewat ArticleScrapingResultAnalyzer.
+    """
+    analytics = LiveScrapingAnalytics.load(live_analytics_path(csv_file), csv_file)
+    if analytics is not None and analytics.successes:
+        return analytics.generate_comprehensive_report()
+    return ArticleScrapingResultAnalyzer(csv_file).generate_comprehensive_report()
+
+def write_analysis_report(csv_file, destination, analytics=None):
+    """Membuat laporan komprehensif (dari analytics jika diberikan) dan menulisnya ke file atau stdout ('-')."""
+    if analytics is not None and analytics.successes:
+        report = analytics.generate_comprehensive_report()
+    else:
+        report = load_comprehensive_report(csv_file)
+    if destination == '-':
+        print(report)
+    else:
+        with open(destination, 'w', encoding='utf-8') as f:
+            f.write(report + "\n")
+        print(f"Laporan analisis disimpan ke '{destination}'", file=sys.stderr)
+
+def export_parquet_with_log(csv_file, log):
+    try:
+        parquet_file = export_results_to_parquet(csv_file)
+        log(f"Salinan Parquet disimpan ke '{parquet_file}'")
+    except Exception as e:
+        log(f"Gagal membuat file Parquet dari '{csv_file}': {e}")
+
+def build_stage_tracer(args, log, worker_id=None):
+    """
+    StageTracer sesuai opsi --trace/--metrics-file/--metrics-port/--profile-every, atau None jika
+    tidak ada yang diminta (engine lalu berjalan tanpa tracing). Dengan worker_id (mode frontier),
+    setiap worker menulis file trace/metrik/profilnya sendiri. Memunculkan OSError jika file trace
+    tidak dapat dibuka atau port metrik tidak dapat dipakai.
+    """
+    if not (args.trace or args.metrics_file or args.metrics_port is not None or args.profile_every):
+        return None
+    def output_path(path):
+        return per_worker_path(path, worker_id) if path and worker_id else path
+    tracer = StageTracer(output_path(args.trace), output_path(args.metrics_file), args.profile_every, output_path(args.profile_output))
+    if args.metrics_port is not None:
+        try:
+            port = tracer.serve_metrics(args.metrics_port)
+        except OSError:
+            tracer.close()
+            raise
+        log(f"Metrik Prometheus tersedia di http://127.0.0.1:{port}/metrics")
+    return tracer
+
+def log_tracer_outputs(tracer, log):
+    """Menutup tracer dan menyebutkan file yang dihasilkannya."""
+    tracer.close()
+    if tracer.jsonl_path:
+        log(f"Trace per URL disimpan ke '{tracer.jsonl_path}'")
+    if tracer.metrics_path:
+        log(f"Metrik Prometheus disimpan ke '{tracer.metrics_path}'")
+    if tracer.profiled_pages:
+        log(f"Profil {tracer.profiled_pages} ekstraksi disimpan ke '{tracer.profile_path}' (lihat dengan: python -m pstats {tracer.profile_path})")
+
+def run_headless(args):
+    """Mode CLI/batch: scraping tanpa display, log ke stderr, hasil ke CSV (dan laporan opsional)."""
+    def log(message):
+        print(message, file=sys.stderr)
+
+    try:
+        article_urls = read_url_list(args.urls)
+    except OSError as e:
+        log(f"Daftar URL '{args.urls}' tidak dapat dibaca: {e}")
+        return 2
+    if not article_urls:
+        log("Tidak ada URL untuk di-scrape.")
+        return 2
+
+    if args.startup_time:
+        startup_seconds = time.perf_counter() - _MODULE_LOAD_START
+        status = "OK" if startup_seconds <= HEADLESS_STARTUP_TARGET_SECONDS else "MELEBIHI TARGET"
+        log(f"Waktu startup headless: {startup_seconds * 1000:.0f} ms (target {HEADLESS_STARTUP_TARGET_SECONDS * 1000:.0f} ms) - {status}")
+
+    try:
+        tracer = build_stage_tracer(args, log)
+    except OSError as e:
+        log(f"Tracing tidak dapat dimulai: {e}")
+        return 2
+
+    log(f"Memulai {'crawl dari' if args.crawl else 'scraping'} {len(article_urls)} URL dengan engine '{args.engine}'...")
+    monitor = ConsoleProgressMonitor()
+    job_options = dict(engine_name=args.engine, max_concurrency=args.max_concurrency, per_host_limit=args.per_host_limit,
+                       keep_alive=not args.no_keep_alive, extraction_backend=args.extraction_backend,
+                       on_success=monitor.update_stats, dedup_index_path=args.dedup_index,
+                       max_retries=args.max_retries, adaptive=not args.no_adaptive, archive_path=args.archive,
+                       max_response_bytes=args.max_response_bytes, tracer=tracer)
+    try:
+        if args.crawl:
+            seed_hosts = set()
+            for url in article_urls:
+                try:
+                    seed_hosts.add(urlparse(canonicalize_url(url)).netloc)
+                except ValueError:
+                    pass # URL seed yang tidak valid dilaporkan sebagai gagal oleh run_crawl_job
+            try:
+                scope = CrawlScope(args.crawl_host or seed_hosts,
+                                   args.crawl_include, args.crawl_exclude, args.max_depth)
+            except re.error as e:
+                log(f"Pola --crawl-include/--crawl-exclude tidak valid: {e}")
+                return 2
+            summary = run_crawl_job(article_urls, args.output, scope, args.max_pages, args.seen_filter,
+                                    resume=args.resume, log=log, **job_options)
+            article_urls = summary['invalid_urls'] + summary['urls_to_fetch'] # Ringkasan per URL mencakup halaman yang ditemukan
+        else:
+            summary = run_scraping_job(article_urls, args.output, resume=args.resume, log=log,
+                                       canonicalize=not args.no_canonicalize, **job_options)
+    except OSError as e:
+        log(f"File output '{args.output}' tidak dapat dibuka: {e}")
+        return 1
+    finally:
+        if tracer is not None:
+            log_tracer_outputs(tracer, log)
+
+    log(f"\nScraping artikel selesai! Hasil berhasil disimpan ke '{args.output}'")
+    log_scraping_summary(summary, article_urls, log=log, per_url=args.per_url_summary)
+
+    if args.parquet:
+        export_parquet_with_log(args.output, log)
+    if args.report:
+        write_analysis_report(args.output, args.report, summary['analytics'])
+
+    # Kode keluar 1 jika ada URL yang dicoba tetapi tidak satu pun berhasil
+    if (summary['urls_to_fetch'] or summary['invalid_urls']) and not summary['successful_results']:
+        return 1
+    return 0
+
+def run_reextract(args):
+    """Mode re-ekstraksi: ekstraksi ulang dari arsip HTML mentah ke CSV, memakai semua core."""
+    def log(message):
+        print(message, file=sys.stderr)
+
+    try:
+        tracer = build_stage_tracer(args, log)
+    except OSError as e:
+        log(f"Tracing tidak dapat dimulai: {e}")
+        return 2
+    monitor = ConsoleProgressMonitor()
+    try:
+        summary = reextract_archive(args.reextract, args.output, args.extraction_backend, log=log, on_success=monitor.update_stats,
+                                    tracer=tracer)
+    except OSError as e:
+        log(f"Re-ekstraksi dari '{args.reextract}' gagal: {e}")
+        return 1
+    finally:
+        if tracer is not None:
+            log_tracer_outputs(tracer, log)
+
+    log(f"\nRe-ekstraksi selesai! Hasil disimpan ke '{args.output}'")
+    log_scraping_summary(summary, summary['urls_to_fetch'], log=log, per_url=args.per_url_summary)
+    if args.parquet:
+        export_parquet_with_log(args.output, log)
+    if args.report:
+        write_analysis_report(args.output, args.report, summary['analytics'])
+    return 0 if summary['successful_results'] or not summary['urls_to_fetch'] else 1
+
+def parse_shard_list(value):
+    """'0-3,8' -> [0, 1, 2, 3, 8]"""
+    shards = []
+    for part in value.split(','):
+        start, _, end = part.strip().partition('-')
+        shards.extend(range(int(start), int(end or start) + 1))
+    return shards
+
+def run_frontier(args):
+    """Mode frontier: menambahkan URL ke CrawlFrontier dan/atau bekerja sebagai salah satu worker-nya."""
+    def log(message):
+        print(message, file=sys.stderr)
+
+    try:
+        shards = parse_shard_list(args.shards) if args.shards else None
+    except ValueError:
+        log(f"Daftar shard tidak valid: '{args.shards}'")
+        return 2
+    try:
+        frontier = CrawlFrontier(args.frontier, args.shard_count)
+    except sqlite3.Error as e:
+        log(f"Frontier '{args.frontier}' tidak dapat dibuka: {e}")
+        return 1
+    try:
+        if args.urls:
+            try:
+                article_urls = read_url_list(args.urls)
+            except OSError as e:
+                log(f"Daftar URL '{args.urls}' tidak dapat dibaca: {e}")
+                return 2
+            added = frontier.add_urls(article_urls, canonicalize=not args.no_canonicalize)
+            log(f"{added} URL baru ditambahkan ke frontier ({len(article_urls) - added} sudah ada).")
+        if args.requeue_failed:
+            log(f"{frontier.requeue_failed()} URL gagal dikembalikan ke pending.")
+        if args.frontier_status or args.enqueue_only:
+            log(f"Frontier '{args.frontier}' ({frontier.shard_count} shard): "
+                + ", ".join(f"{state} {count}" for state, count in frontier.counts().items()))
+            return 0
+    finally:
+        frontier.close()
+
+    worker_id = args.worker_id or default_worker_id()
+    csv_output_path = per_worker_path(args.output, worker_id)
+    try:
+        tracer = build_stage_tracer(args, log, worker_id)
+    except OSError as e:
+        log(f"Tracing tidak dapat dimulai: {e}")
+        return 2
+    monitor = ConsoleProgressMonitor()
+    try:
+        totals = run_frontier_worker(args.frontier, csv_output_path, worker_id, shards, args.lease_batch, args.lease_seconds, log=log,
+                                     engine_name=args.engine, max_concurrency=args.max_concurrency, per_host_limit=args.per_host_limit,
+                                     keep_alive=not args.no_keep_alive, extraction_backend=args.extraction_backend,
+                                     on_success=monitor.update_stats, canonicalize=not args.no_canonicalize,
+                                     dedup_index_path=args.dedup_index, max_retries=args.max_retries, adaptive=not args.no_adaptive,
+                                     archive_path=per_worker_path(args.archive, worker_id) if args.archive else None,
+                                     max_response_bytes=args.max_response_bytes, tracer=tracer)
+    except OSError as e:
+        log(f"Worker '{worker_id}' gagal: {e}")
+        return 1
+    finally:
+        if tracer is not None:
+            log_tracer_outputs(tracer, log)
+    log(f"\nWorker '{worker_id}' selesai: {totals['batches']} batch, {totals['done']} berhasil, {totals['failed']} gagal. "
+        f"Hasil di '{csv_output_path}'")
+    if args.report and os.path.exists(csv_output_path):
+        write_analysis_report(csv_output_path, args.report)
+    return 1 if totals['released'] else 0
+
+def main(argv=None):
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.crawl and (args.frontier or not args.urls):
+        parser.error("--crawl membutuhkan --urls dan tidak dapat digabung dengan --frontier")
+    if args.frontier:
+        return run_frontier(args)
+    if args.reextract:
+        return run_reextract(args)
+    if args.analyze:
+        if args.parquet and not args.analyze.endswith('.parquet'):
+            export_parquet_with_log(args.analyze, lambda message: print(message, file=sys.stderr))
+        write_analysis_report(args.analyze, args.report or '-')
+        return 0
+    if args.urls:
+        return run_headless(args)
 
-def main():
+    _load_tkinter()
     root = tk.Tk()
     gui = ArticleScraperGUI(root)
     root.mainloop()
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())